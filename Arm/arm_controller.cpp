@@ -2,6 +2,7 @@
 #include <BLEDevice.h>
 #include <BLEServer.h>
 #include <BLEUtils.h>
+#include <BLE2902.h>
 
 // Pinos dos servos
 #define BASE_PIN   13
@@ -19,15 +20,114 @@
 #define FREQ 50
 #define RES 16
 
-// Armazena posição atual (importante para controle parcial da garra)
-int posAtual_base   = 90;
-int posAtual_braco1 = 90;
-int posAtual_braco2 = 90;
-int posAtual_garra  = 90;
+// Estados enviados por notificação: [estado, seq, base, braço1, braço2, garra, progresso %]
+#define ESTADO_MOVENDO      1  // também repetido a cada PERIODO_PROGRESSO_MS com o progresso
+#define ESTADO_CONCLUIDO    2
+#define ESTADO_ERRO         3
+#define ESTADO_INTERROMPIDO 4  // substituído por um comando novo antes de terminar
 
-// Mapeia ângulo para duty (0–180° → duty de 1638 a 8192)
-int angleToDuty(int ang) {
-  return map(ang, 0, 180, 1638, 8192);
+// Protocolo binário v1 (little-endian). Quadro: [versão, tipo, seq, dados...]
+//   POSE:   [base, braço1, braço2, garra, velocidade, duração_lo, duração_hi, (perfil)]
+//   LOTE:   [n, velocidade, n x (base, braço1, braço2, garra, duração_lo, duração_hi)]
+//   PRESET: [índice 0–9, o mesmo dos caracteres '0'–'9']
+// ANGULO_MANTER deixa a junta onde está; velocidade em graus/s de pico e duração em ms (0 = padrão).
+// Qualquer primeiro byte diferente de PROTOCOLO_VERSAO é tratado como caractere legado '0'–'9' (seq 0)
+#define PROTOCOLO_VERSAO 0xA1
+#define TIPO_POSE        0x01
+#define TIPO_LOTE        0x02
+#define TIPO_PRESET      0x03
+#define ANGULO_MANTER    0xFF
+
+// Gerador de trajetórias: todas as juntas seguem o mesmo perfil normalizado e chegam juntas ao alvo.
+// A referência em Python (trajetoria.py) implementa o mesmo planejador para testes no PC
+#define PERFIL_TRAPEZIO      0
+#define PERFIL_SCURVE        1
+#define PERFIL_PADRAO        PERFIL_SCURVE
+#define FRACAO_ACELERACAO    0.25f  // trapézio: fração do tempo acelerando (e também desacelerando)
+#define VELOCIDADE_PADRAO    120    // graus/s de pico (o maior preset, 155°, leva ~2,4 s)
+#define VELOCIDADE_GARRA     180    // presets da garra
+#define PERIODO_CONTROLE_US  10000  // atualização dos servos (o PWM é de 50 Hz)
+#define PERIODO_PROGRESSO_MS 100
+
+// Comandos recebidos pelo BLE esperam numa fila até o loop() processá-los
+#define MTU_LOCAL     247  // oferecido na troca de MTU pedida pelo Pico (o padrão do BLEDevice é 23)
+#define MAX_QUADRO    244  // MTU_LOCAL - 3
+#define MAX_WAYPOINTS 39   // (MAX_QUADRO - 5) / 6
+#define FILA_QUADROS  4
+
+#define SERVICE_UUID "12345678-1234-5678-1234-56789abcdef0"
+
+// Característica BLE (escrita de comandos + notificação de movimento)
+BLECharacteristic *caracteristica = nullptr;
+
+const int N_JUNTAS = 4;
+const int canais[N_JUNTAS] = { CH_BASE, CH_BRACO1, CH_BRACO2, CH_GARRA };
+
+// Posição comandada de cada junta (base, braço1, braço2, garra), em graus
+float atual[N_JUNTAS] = { 90, 90, 90, 90 };
+
+struct Quadro {
+  uint16_t n;
+  uint8_t dados[MAX_QUADRO];
+};
+QueueHandle_t filaQuadros;
+// seq dos comandos recusados com a fila cheia: o callback BLE não notifica, o loop() é o único que chama notificarEstado
+QueueHandle_t filaRecusados;
+
+struct Waypoint {
+  uint8_t alvo[N_JUNTAS];
+  uint16_t duracao_ms;
+};
+
+// Movimento em andamento: uma sequência de waypoints, executados um após o outro
+struct Movimento {
+  bool ativo;
+  uint8_t seq;
+  uint8_t perfil;
+  uint8_t velocidade;
+  uint8_t total;
+  uint8_t indice;
+  Waypoint waypoints[MAX_WAYPOINTS];
+  float inicio[N_JUNTAS];
+  float fim[N_JUNTAS];
+  uint32_t t0_ms;
+  uint32_t duracao_ms;
+  uint32_t ultimoProgresso_ms;
+};
+Movimento mov;
+
+// Progresso do movimento atual, de 0 a 100, contando todos os waypoints
+uint8_t progresso(uint32_t agora) {
+  if (!mov.ativo || mov.total == 0) return 100;
+  float tau = mov.duracao_ms ? (float)(agora - mov.t0_ms) / mov.duracao_ms : 1;
+  if (tau > 1) tau = 1;
+  return (uint8_t)(100 * (mov.indice + tau) / mov.total);
+}
+
+// Notifica o Pico sobre o estado do comando seq, com os ângulos atuais das juntas. Só é chamada pelo loop()
+void notificarEstado(uint8_t estado, uint8_t seq, uint8_t pct) {
+  uint8_t dados[7] = {
+    estado,
+    seq,
+    (uint8_t)lroundf(atual[0]),
+    (uint8_t)lroundf(atual[1]),
+    (uint8_t)lroundf(atual[2]),
+    (uint8_t)lroundf(atual[3]),
+    pct
+  };
+  caracteristica->setValue(dados, sizeof(dados));
+  caracteristica->notify();
+}
+
+// Mapeia ângulo para duty (0–180° → duty de 1638 a 8192), com resolução abaixo de 1°
+int angleToDuty(float ang) {
+  return 1638 + (int)(ang * (8192 - 1638) / 180.0f + 0.5f);
+}
+
+void escreverJuntas() {
+  for (int j = 0; j < N_JUNTAS; j++) {
+    ledcWrite(canais[j], angleToDuty(atual[j]));
+  }
 }
 
 // Estrutura de posição
@@ -51,86 +151,180 @@ Posicao posicoes[8] = {
   { 5, 100, 120, 90 }
 };
 
-void aplicarPosicaoCompleta(const Posicao& alvo) {
-  const int delay_ms = 15;
-  const int passo = 1;
-
-  int a_base   = posAtual_base;
-  int a_braco1 = posAtual_braco1;
-  int a_braco2 = posAtual_braco2;
-  int a_garra  = posAtual_garra;
-
-  while (a_base != alvo.base || a_braco1 != alvo.braco1 || a_braco2 != alvo.braco2 || a_garra != alvo.garra) {
-    if (a_base < alvo.base)   a_base   += passo;
-    if (a_base > alvo.base)   a_base   -= passo;
-
-    if (a_braco1 < alvo.braco1) a_braco1 += passo;
-    if (a_braco1 > alvo.braco1) a_braco1 -= passo;
+// Fração do caminho percorrida (0–1) no tempo normalizado tau (0–1)
+float perfilPosicao(uint8_t perfil, float tau) {
+  if (tau <= 0) return 0;
+  if (tau >= 1) return 1;
+  if (perfil == PERFIL_TRAPEZIO) {
+    const float fa = FRACAO_ACELERACAO;
+    const float k = 1.0f / (2 * fa * (1 - fa));
+    if (tau < fa) return k * tau * tau;
+    if (tau > 1 - fa) return 1 - k * (1 - tau) * (1 - tau);
+    return (tau - fa / 2) / (1 - fa);
+  }
+  // S-curve (polinômio de 5ª ordem): velocidade e aceleração nulas nas pontas
+  return tau * tau * tau * (10 + tau * (6 * tau - 15));
+}
 
-    if (a_braco2 < alvo.braco2) a_braco2 += passo;
-    if (a_braco2 > alvo.braco2) a_braco2 -= passo;
+// Razão entre a velocidade de pico e a velocidade média de cada perfil
+float perfilPico(uint8_t perfil) {
+  return perfil == PERFIL_TRAPEZIO ? 1.0f / (1 - FRACAO_ACELERACAO) : 1.875f;
+}
 
-    if (a_garra < alvo.garra)   a_garra  += passo;
-    if (a_garra > alvo.garra)   a_garra  -= passo;
+// Começa o waypoint mov.indice a partir da posição atual. Sem duração pedida, ela sai da velocidade de pico
+// aplicada à junta que mais se desloca
+void iniciarWaypoint(uint32_t agora) {
+  const Waypoint &w = mov.waypoints[mov.indice];
+  float maior = 0;
+  for (int j = 0; j < N_JUNTAS; j++) {
+    mov.inicio[j] = atual[j];
+    mov.fim[j] = w.alvo[j] == ANGULO_MANTER ? atual[j] : min((int)w.alvo[j], 180);
+    maior = max(maior, fabsf(mov.fim[j] - mov.inicio[j]));
+  }
+  if (w.duracao_ms > 0) {
+    mov.duracao_ms = w.duracao_ms;
+  } else {
+    int velocidade = mov.velocidade ? mov.velocidade : VELOCIDADE_PADRAO;
+    mov.duracao_ms = (uint32_t)(1000.0f * maior * perfilPico(mov.perfil) / velocidade);
+  }
+  mov.t0_ms = agora;
+}
 
-    ledcWrite(CH_BASE,   angleToDuty(a_base));
-    ledcWrite(CH_BRACO1, angleToDuty(a_braco1));
-    ledcWrite(CH_BRACO2, angleToDuty(a_braco2));
-    ledcWrite(CH_GARRA,  angleToDuty(a_garra));
+// Troca o movimento atual por um novo (o anterior é interrompido a partir da posição em que está)
+void iniciarMovimento(uint8_t seq, uint8_t perfil, uint8_t velocidade, const Waypoint *waypoints, uint8_t total) {
+  uint32_t agora = millis();
+  if (mov.ativo) {
+    notificarEstado(ESTADO_INTERROMPIDO, mov.seq, progresso(agora));
+  }
+  mov.seq = seq;
+  mov.perfil = perfil;
+  mov.velocidade = velocidade;
+  mov.total = total;
+  mov.indice = 0;
+  memcpy(mov.waypoints, waypoints, total * sizeof(Waypoint));
+  mov.ativo = true;
+  mov.ultimoProgresso_ms = agora;
+  iniciarWaypoint(agora);
+  notificarEstado(ESTADO_MOVENDO, seq, 0);
+}
 
-    delay(delay_ms);
+// Passo do controle, chamado pelo loop() a cada PERIODO_CONTROLE_US
+void atualizarMovimento() {
+  if (!mov.ativo) return;
+  uint32_t agora = millis();
+  uint32_t decorrido = agora - mov.t0_ms;
+  float s = mov.duracao_ms ? perfilPosicao(mov.perfil, (float)decorrido / mov.duracao_ms) : 1;
+  for (int j = 0; j < N_JUNTAS; j++) {
+    atual[j] = mov.inicio[j] + (mov.fim[j] - mov.inicio[j]) * s;
   }
+  escreverJuntas();
 
-  // Atualiza estados finais
-  posAtual_base   = alvo.base;
-  posAtual_braco1 = alvo.braco1;
-  posAtual_braco2 = alvo.braco2;
-  posAtual_garra  = alvo.garra;
+  if (decorrido < mov.duracao_ms) {
+    if (agora - mov.ultimoProgresso_ms >= PERIODO_PROGRESSO_MS) {
+      mov.ultimoProgresso_ms = agora;
+      notificarEstado(ESTADO_MOVENDO, mov.seq, progresso(agora));
+    }
+    return;
+  }
+  if (++mov.indice < mov.total) {
+    iniciarWaypoint(agora);
+    return;
+  }
+  mov.ativo = false;
+  Serial.printf("Posição suave concluída: Base=%.0f, Braço1=%.0f, Braço2=%.0f, Garra=%.0f\n",
+                atual[0], atual[1], atual[2], atual[3]);
+  notificarEstado(ESTADO_CONCLUIDO, mov.seq, 100);
+}
 
-  Serial.printf("Posição suave concluída: Base=%d, Braço1=%d, Braço2=%d, Garra=%d\n",
-                posAtual_base, posAtual_braco1, posAtual_braco2, posAtual_garra);
+void lerWaypoint(const uint8_t *p, uint16_t duracao_ms, Waypoint &w) {
+  memcpy(w.alvo, p, N_JUNTAS);
+  w.duracao_ms = duracao_ms;
 }
 
-void moverGarraPara(int angGarra) {
-  const int delay_ms = 10;
-  const int passo = 1;
+uint16_t lerU16(const uint8_t *p) {
+  return p[0] | (p[1] << 8);
+}
 
-  int atual = posAtual_garra;
-  while (atual != angGarra) {
-    if (atual < angGarra) atual += passo;
-    else if (atual > angGarra) atual -= passo;
+// Posições da tabela (0–7) e garra fechada (8, botão Fechar do Pico) ou aberta (9, botão Abrir)
+void executarPreset(int idx, uint8_t seq) {
+  Waypoint w;
+  if (idx <= 7) {
+    const Posicao &p = posicoes[idx];
+    w = { { (uint8_t)p.base, (uint8_t)p.braco1, (uint8_t)p.braco2, (uint8_t)p.garra }, 0 };
+    iniciarMovimento(seq, PERFIL_PADRAO, VELOCIDADE_PADRAO, &w, 1);
+  } else {
+    uint8_t garra = idx == 8 ? 60 : 120;  // Garra fechada / aberta
+    w = { { ANGULO_MANTER, ANGULO_MANTER, ANGULO_MANTER, garra }, 0 };
+    iniciarMovimento(seq, PERFIL_PADRAO, VELOCIDADE_GARRA, &w, 1);
+  }
+}
 
-    ledcWrite(CH_GARRA, angleToDuty(atual));
-    delay(delay_ms);
+void processarQuadro(const uint8_t *dados, size_t n) {
+  if (n < 3) {
+    notificarEstado(ESTADO_ERRO, 0, 0);
+    return;
   }
+  uint8_t tipo = dados[1];
+  uint8_t seq = dados[2];
+  const uint8_t *p = dados + 3;
+  size_t resto = n - 3;
 
-  posAtual_garra = angGarra;
-  Serial.printf("Garra suavemente ajustada para %d°\n", angGarra);
+  if (tipo == TIPO_POSE && resto >= 7) {
+    uint8_t perfil = resto >= 8 ? p[7] : PERFIL_PADRAO;
+    Waypoint w;
+    lerWaypoint(p, lerU16(p + 5), w);
+    iniciarMovimento(seq, perfil == PERFIL_TRAPEZIO ? PERFIL_TRAPEZIO : PERFIL_SCURVE, p[4], &w, 1);
+  } else if (tipo == TIPO_LOTE && resto >= 2 && p[0] <= MAX_WAYPOINTS && resto >= 2 + 6 * (size_t)p[0]) {
+    static Waypoint lote[MAX_WAYPOINTS];
+    uint8_t total = p[0];
+    for (uint8_t i = 0; i < total; i++) {
+      const uint8_t *w = p + 2 + 6 * i;
+      lerWaypoint(w, lerU16(w + 4), lote[i]);
+    }
+    iniciarMovimento(seq, PERFIL_PADRAO, p[1], lote, total);
+  } else if (tipo == TIPO_PRESET && resto >= 1 && p[0] <= 9) {
+    executarPreset(p[0], seq);
+  } else {
+    Serial.printf("Quadro inválido: tipo=%u, %u bytes\n", tipo, (unsigned)n);
+    notificarEstado(ESTADO_ERRO, seq, 0);
+  }
 }
 
+void processarComando(const uint8_t *dados, size_t n) {
+  if (dados[0] == PROTOCOLO_VERSAO) {
+    processarQuadro(dados, n);
+    return;
+  }
+  // Modo de compatibilidade: um caractere '0'–'9' por escrita
+  char cmd = dados[0];
+  if (cmd < '0' || cmd > '9') {
+    Serial.printf("Comando inválido: %c\n", cmd);
+    notificarEstado(ESTADO_ERRO, 0, 0);
+    return;
+  }
+  executarPreset(cmd - '0', 0);
+}
 
-// BLE callback
+// BLE callback: só enfileira o comando; o movimento é feito pelo loop(), sem travar a pilha BLE
 class ComandoBLE : public BLECharacteristicCallbacks {
   void onWrite(BLECharacteristic *pChar) {
     std::string value = pChar->getValue();
-    if (value.length() > 0) {
-      char cmd = value[0];
-      if (cmd >= '0' && cmd <= '7') {
-        int idx = cmd - '0';
-        aplicarPosicaoCompleta(posicoes[idx]);
-      } else if (cmd == '8') {
-        moverGarraPara(60);  // Garra aberta
-      } else if (cmd == '9') {
-        moverGarraPara(120); // Garra fechada
-      } else {
-        Serial.printf("Comando inválido: %c\n", cmd);
-      }
+    if (value.length() == 0) return;
+    Quadro quadro;
+    quadro.n = min(value.length(), (size_t)MAX_QUADRO);
+    memcpy(quadro.dados, value.data(), quadro.n);
+    if (xQueueSend(filaQuadros, &quadro, 0) != pdTRUE) {
+      Serial.println("Fila de comandos cheia");
+      uint8_t seq = quadro.n >= 3 && quadro.dados[0] == PROTOCOLO_VERSAO ? quadro.dados[2] : 0;
+      xQueueSend(filaRecusados, &seq, 0);  // com esta fila também cheia, o Pico fica sem o erro e cai no timeout
     }
   }
 };
 
 void setup() {
   Serial.begin(115200);
+  filaQuadros = xQueueCreate(FILA_QUADROS, sizeof(Quadro));
+  filaRecusados = xQueueCreate(FILA_QUADROS, sizeof(uint8_t));
 
   // PWM setup
   ledcSetup(CH_BASE,   FREQ, RES); ledcAttachPin(BASE_PIN,   CH_BASE);
@@ -140,19 +334,38 @@ void setup() {
 
   // BLE
   BLEDevice::init("ESP32_BRAÇO_BLE");
+  BLEDevice::setMTU(MTU_LOCAL);  // sem isso a troca de MTU fica em 23 e cada escrita leva no máximo 2 waypoints
   BLEServer *server = BLEDevice::createServer();
-  BLEService *service = server->createService("12345678-1234-5678-1234-56789abcdef0");
-  BLECharacteristic *charac = service->createCharacteristic(
+  BLEService *service = server->createService(SERVICE_UUID);
+  caracteristica = service->createCharacteristic(
     "abcdef01-2345-6789-abcd-0123456789ab",
-    BLECharacteristic::PROPERTY_WRITE
+    BLECharacteristic::PROPERTY_WRITE | BLECharacteristic::PROPERTY_NOTIFY
   );
-  charac->setCallbacks(new ComandoBLE());
+  caracteristica->addDescriptor(new BLE2902());  // CCCD, para o Pico assinar as notificações
+  caracteristica->setCallbacks(new ComandoBLE());
   service->start();
-  server->getAdvertising()->start();
+  // Anuncia o UUID do serviço (o Pico filtra o scan por ele); o nome vai na resposta ao scan ativo
+  BLEAdvertising *anuncio = server->getAdvertising();
+  anuncio->addServiceUUID(SERVICE_UUID);
+  anuncio->setScanResponse(true);
+  anuncio->start();
 
-  Serial.println("BLE pronto. Envie caracteres '0' a '9' para controle.");
+  Serial.println("BLE pronto. Envie quadros binários v1 ou caracteres '0' a '9' para controle.");
 }
 
 void loop() {
-  // nada
+  static uint32_t ultimoControle_us = 0;
+  Quadro quadro;
+  uint8_t recusado;
+  while (xQueueReceive(filaRecusados, &recusado, 0) == pdTRUE) {
+    notificarEstado(ESTADO_ERRO, recusado, 0);
+  }
+  if (xQueueReceive(filaQuadros, &quadro, 0) == pdTRUE) {
+    processarComando(quadro.dados, quadro.n);
+  }
+  uint32_t agora = micros();
+  if (agora - ultimoControle_us >= PERIODO_CONTROLE_US) {
+    ultimoControle_us = agora;
+    atualizarMovimento();
+  }
 }
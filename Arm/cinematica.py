@@ -0,0 +1,304 @@
+"""
+Cinemática do braço e gerador da tabela de cinemática inversa do modo mapa
+
+O modo mapa da interface (main.py) manda o braço para o ponto tocado num mapa
+visto de cima. Em vez de resolver a trigonometria a cada toque no Pico, os
+ângulos vêm de uma tabela pré-calculada aqui, num plano horizontal na altura
+ALTURA_ALVO_MM, e interpolada pelo ik.py do firmware. A tabela é gravada em
+Firmware/external/libs/ik_table.py, congelada no firmware pelo manifest.py.
+
+Os comprimentos dos elos são medidos nas peças de Arm/Structure (Arm.stl e
+Forearm.stl); o alcance da garra além do antebraço, a altura do ombro e o
+sentido dos servos são estimativas e devem ser conferidos no braço montado
+(ver as constantes abaixo). Depois de mudar qualquer um deles, gere a tabela
+de novo.
+
+Convenção (mm, vista de cima): origem no eixo da base, x para a direita, y
+para a frente e z para cima a partir da mesa. base = 90 aponta para a frente
+(y), 0 para a direita e 180 para a esquerda, como nos botões D1 (160) a D4 (5).
+
+Uso:
+    python3 Arm/cinematica.py                     # verificações + benchmark
+    python3 Arm/cinematica.py --gerar             # regrava ik_table.py
+    python3 Arm/cinematica.py --gerar --orcamento 4096
+    python3 Arm/cinematica.py --conferir          # falha se ik_table.py estiver desatualizado
+    base, ombro, cotovelo = ik(80, 100, ALTURA_ALVO_MM)
+"""
+
+import math
+import os
+import struct
+import sys
+
+PASTA = os.path.dirname(os.path.abspath(__file__))
+ESTRUTURA = os.path.join(PASTA, 'Structure')
+LIBS = os.path.join(PASTA, '..', 'Firmware', 'external', 'libs')
+SAIDA = os.path.join(LIBS, 'ik_table.py')
+
+# Braço (Arm.stl): do furo do horn do servo do ombro, no centro da ponta arredondada, ao centro do rasgo onde entra
+# o MG90S do cotovelo. O eixo do MG90S fica ~5,5 mm fora do centro do corpo; sem saber para que lado ele foi
+# montado, o centro do rasgo é usado (erro de até 5,5 mm no elo)
+L1_MM = 71.0
+# Antebraço (Forearm.stl): do furo do horn do cotovelo à ponta (58,5 mm), mais o trecho da garra (Claw.stl, 58 mm,
+# presa sobre o SG90 na ponta) até o ponto onde ela prende, ~10 mm antes das pontas dos dedos (estimativa)
+ALEM_DO_ANTEBRACO_MM = 36.5
+L2_MM = 58.5 + ALEM_DO_ANTEBRACO_MM
+# Altura do eixo do ombro acima da mesa (estimativa a partir do modelo montado, Assembled 3D Structure.stl)
+ALTURA_OMBRO_MM = 110.0
+# Altura do plano do mapa: ponto de pega de um objeto pequeno sobre a mesa
+ALTURA_ALVO_MM = 30.0
+
+# Sentido dos servos: elevação do braço = OMBRO_HORIZONTAL - ombro (ombro 90 = braço na vertical, valores maiores
+# inclinam o braço para a frente) e dobra do cotovelo = COTOVELO_RETO - cotovelo (antebraço alinhado ao braço em 180,
+# dobrando para baixo)
+OMBRO_HORIZONTAL = 180
+COTOVELO_RETO = 180
+# Faixas de cada junta (base, ombro, cotovelo) aceitas pelo solver. Sem limites mecânicos medidos, é a faixa que a
+# ESP32 aceita (0–180); restrinja aqui se alguma pose levar as peças a se tocarem
+LIMITES = ((0, 180), (0, 180), (0, 180))
+
+# Tabela: um byte por ângulo (graus inteiros, a mesma resolução do protocolo), 3 bytes por ponto da grade
+ORCAMENTO_PADRAO = 6144
+PASSO_MINIMO_MM = 2.0
+INALCANCAVEL = 0xFF
+BYTES_POR_LINHA = 24
+
+
+# Ângulos (base, ombro, cotovelo) em graus, sem arredondar, para o ponto (x, y, z); None fora do alcance ou dos
+# LIMITES. Usa a solução com o cotovelo para cima (o antebraço desce até o ponto)
+def ik(x, y, z):
+    r = math.hypot(x, y)
+    if y < 0 or r == 0:
+        return None
+    base = math.degrees(math.atan2(y, x))
+    dz = z - ALTURA_OMBRO_MM
+    d2 = r * r + dz * dz
+    c = (d2 - L1_MM * L1_MM - L2_MM * L2_MM) / (2 * L1_MM * L2_MM)
+    if c < -1 or c > 1:
+        return None
+    dobra = math.acos(c)
+    elevacao = math.atan2(dz, r) + math.atan2(L2_MM * math.sin(dobra), L1_MM + L2_MM * math.cos(dobra))
+    angulos = (base, OMBRO_HORIZONTAL - math.degrees(elevacao), COTOVELO_RETO - math.degrees(dobra))
+    for a, (minimo, maximo) in zip(angulos, LIMITES):
+        if not minimo - 1e-9 <= a <= maximo + 1e-9:
+            return None
+    return angulos
+
+
+# Ponto (x, y, z) alcançado com os ângulos dados (cinemática direta)
+def fk(base, ombro, cotovelo):
+    elevacao = math.radians(OMBRO_HORIZONTAL - ombro)
+    antebraco = elevacao - math.radians(COTOVELO_RETO - cotovelo)
+    r = L1_MM * math.cos(elevacao) + L2_MM * math.cos(antebraco)
+    z = ALTURA_OMBRO_MM + L1_MM * math.sin(elevacao) + L2_MM * math.sin(antebraco)
+    b = math.radians(base)
+    return r * math.cos(b), r * math.sin(b), z
+
+
+# Triângulos de um STL binário: lista de (normal, v1, v2, v3), cada um com 3 floats
+def ler_stl(nome):
+    with open(os.path.join(ESTRUTURA, nome), 'rb') as f:
+        dados = f.read()
+    n = struct.unpack_from('<I', dados, 80)[0]
+    triangulos = []
+    for i in range(n):
+        v = struct.unpack_from('<12f', dados, 84 + 50 * i)
+        triangulos.append((v[0:3], v[3:6], v[6:9], v[9:12]))
+    return triangulos
+
+
+# Coordenadas (no eixo dado, 0.01 mm) das faces planas perpendiculares a esse eixo
+def paredes(triangulos, eixo):
+    return sorted({round(t[1][eixo], 2) for t in triangulos if abs(t[0][eixo]) > 0.99})
+
+
+# Comprimentos medidos nas peças: (braço, antebraço até a ponta), em mm. As duas peças são placas ao longo de x com
+# o furo do horn (6 mm) perto da ponta de x menor
+def medir_pecas():
+    medidas = []
+    for nome in ('Arm.stl', 'Forearm.stl'):
+        triangulos = ler_stl(nome)
+        xs = [v[0] for t in triangulos for v in t[1:]]
+        px = paredes(triangulos, 0)
+        furo = [(a + b) / 2 for a in px for b in px if abs(b - a - 6) < 0.1]
+        assert furo, "furo do horn não encontrado em " + nome
+        cubo = min(furo)
+        if nome == 'Arm.stl':
+            # Rasgo do MG90S: o par de paredes mais próximas que ainda deixa passar o corpo do servo (22,5 mm)
+            rasgo = min(((a, b) for a in px for b in px if a > cubo + 3 and b - a > 22.5), key=lambda p: p[1] - p[0])
+            medidas.append((rasgo[0] + rasgo[1]) / 2 - cubo)
+        else:
+            medidas.append(max(xs) - cubo)
+    return tuple(medidas)
+
+
+# Maior distância horizontal ao eixo da base alcançável no plano z, com 1 mm de resolução
+def alcance(z, passo=1.0):
+    r = 0.0
+    maximo = 0.0
+    while r < L1_MM + L2_MM:
+        r += passo
+        if ik(0, r, z) is not None:
+            maximo = r
+    return maximo
+
+
+# Grade da tabela: (x0, y0, passo, nx, ny) com o menor passo (múltiplo de 0,5 mm) que cabe no orçamento em bytes.
+# A grade cobre o semicírculo da frente, simétrica em x
+def dimensionar(z, orcamento):
+    raio = alcance(z)
+    passo = PASSO_MINIMO_MM
+    while True:
+        meio = math.ceil(raio / passo)
+        nx, ny = 2 * meio + 1, meio + 1
+        if 3 * nx * ny <= orcamento:
+            return -meio * passo, 0.0, passo, nx, ny
+        passo += 0.5
+
+
+# Tabela (x0, y0, passo, nx, ny, dados): 3 bytes (base, ombro, cotovelo) por ponto, linha a linha a partir de y0;
+# INALCANCAVEL no primeiro byte marca pontos sem solução
+def gerar_tabela(z=ALTURA_ALVO_MM, orcamento=ORCAMENTO_PADRAO):
+    x0, y0, passo, nx, ny = dimensionar(z, orcamento)
+    dados = bytearray()
+    for j in range(ny):
+        for i in range(nx):
+            angulos = ik(x0 + i * passo, y0 + j * passo, z)
+            if angulos is None:
+                dados += bytes((INALCANCAVEL, INALCANCAVEL, INALCANCAVEL))
+            else:
+                dados += bytes(int(a + 0.5) for a in angulos)
+    return x0, y0, passo, nx, ny, bytes(dados)
+
+
+# Código do ik_table.py
+def renderizar(tabela, z=ALTURA_ALVO_MM):
+    x0, y0, passo, nx, ny, dados = tabela
+    linhas = [
+        '"""',
+        'Inverse Kinematics Table of the Arm',
+        '',
+        'Generated by Arm/cinematica.py from the link lengths of the printed',
+        'parts: do not edit, run it again with --gerar after changing them.',
+        'Servo angles (base, shoulder, elbow) in degrees, 3 bytes per point of',
+        'a grid on the horizontal plane Z mm above the table, row by row from',
+        '(X0, Y0); a base of 255 marks a point out of reach. ik.IKTable reads',
+        'it.',
+        '"""',
+        '',
+        '# Geometry the table was solved for (mm): link lengths and shoulder height',
+        'LINKS = ({:.1f}, {:.1f})'.format(L1_MM, L2_MM),
+        'SHOULDER_Z = {:.1f}'.format(ALTURA_OMBRO_MM),
+        '',
+        'Z = {:.1f}'.format(z),
+        'X0 = {:.1f}'.format(x0),
+        'Y0 = {:.1f}'.format(y0),
+        'STEP = {:.1f}'.format(passo),
+        'NX = {}'.format(nx),
+        'NY = {}'.format(ny),
+        '',
+        '# {} bytes'.format(len(dados)),
+        'DATA = (',
+    ]
+    for i in range(0, len(dados), BYTES_POR_LINHA):
+        linhas.append('    {}'.format(dados[i:i + BYTES_POR_LINHA]))
+    linhas.append(')')
+    return '\n'.join(linhas) + '\n'
+
+
+def carregar_ik():
+    if LIBS not in sys.path:
+        sys.path.insert(0, LIBS)
+    import ik
+    import ik_table
+    return ik.IKTable(ik_table), ik_table
+
+
+def _verificar():
+    # Elos iguais aos medidos nas peças
+    braco, antebraco = medir_pecas()
+    assert abs(braco - L1_MM) < 0.5, braco
+    assert abs(antebraco + ALEM_DO_ANTEBRACO_MM - L2_MM) < 0.5, antebraco
+
+    # ik e fk são inversas uma da outra
+    for x, y in ((0, 100), (-80, 60), (110, 30), (40, 90)):
+        angulos = ik(x, y, ALTURA_ALVO_MM)
+        assert angulos is not None, (x, y)
+        ponto = fk(*angulos)
+        assert max(abs(a - b) for a, b in zip(ponto, (x, y, ALTURA_ALVO_MM))) < 1e-6, (x, y, ponto)
+    assert ik(0, L1_MM + L2_MM + 1, ALTURA_OMBRO_MM) is None
+
+    # Tabela contra o solver exato, numa grade de 1 mm: erro dos ângulos (em relação à resposta exata arredondada,
+    # que é o que a ESP32 recebe), erro de posição da garra e cobertura do espaço alcançável
+    tabela, modulo = carregar_ik()
+    raio = alcance(ALTURA_ALVO_MM)
+    pontos = alcancaveis = respondidos = 0
+    erro_angulo = 0
+    erros_mm = []
+    for y in range(0, int(raio) + 1):
+        for x in range(-int(raio), int(raio) + 1):
+            exato = ik(x, y, ALTURA_ALVO_MM)
+            lido = tabela.angles(x, y)
+            pontos += 1
+            if lido is not None:
+                # A tabela só responde dentro do espaço alcançável
+                assert exato is not None, (x, y, lido)
+                respondidos += 1
+                erro_angulo = max(erro_angulo, max(abs(a - int(e + 0.5)) for a, e in zip(lido, exato)))
+                px, py, pz = fk(*lido)
+                erros_mm.append(math.sqrt((px - x) ** 2 + (py - y) ** 2 + (pz - ALTURA_ALVO_MM) ** 2))
+            if exato is not None:
+                alcancaveis += 1
+    erros_mm.sort()
+    cobertura = respondidos / alcancaveis
+    assert erro_angulo <= 2, erro_angulo
+    assert erros_mm[-1] < 8, erros_mm[-1]
+    assert cobertura > 0.9, cobertura
+    print(f"Tabela: {len(modulo.DATA)} bytes, passo {modulo.STEP} mm, {modulo.NX}x{modulo.NY} pontos")
+    print(f"Erro dos ângulos: até {erro_angulo} grau(s) da resposta exata arredondada")
+    print(f"Erro de posição: mediana {erros_mm[len(erros_mm) // 2]:.2f} mm, "
+          f"p95 {erros_mm[len(erros_mm) * 95 // 100]:.2f} mm, máximo {erros_mm[-1]:.2f} mm")
+    print(f"Cobertura: {cobertura * 100:.1f}% dos {alcancaveis} pontos alcançáveis de {pontos}")
+
+
+def _benchmark(n=20000):
+    import time
+    tabela, _ = carregar_ik()
+    raio = int(alcance(ALTURA_ALVO_MM))
+    pontos = [((i * 37) % (2 * raio) - raio, (i * 53) % raio) for i in range(n)]
+    t0 = time.perf_counter()
+    for x, y in pontos:
+        tabela.angles(x, y)
+    dt_tabela = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    for x, y in pontos:
+        ik(x, y, ALTURA_ALVO_MM)
+    dt_exato = time.perf_counter() - t0
+    print(f"IKTable.angles(): {dt_tabela / n * 1e6:.2f} us por ponto")
+    print(f"ik() exato: {dt_exato / n * 1e6:.2f} us por ponto")
+
+
+if __name__ == '__main__':
+    import argparse
+    parser = argparse.ArgumentParser(description="Cinemática do braço e tabela de cinemática inversa do modo mapa")
+    parser.add_argument('--gerar', action='store_true', help="regrava Firmware/external/libs/ik_table.py")
+    parser.add_argument('--conferir', action='store_true', help="só confere se ik_table.py está atualizado")
+    parser.add_argument('--orcamento', type=int, default=ORCAMENTO_PADRAO, help="tamanho máximo da tabela em bytes")
+    args = parser.parse_args()
+    if args.gerar or args.conferir:
+        tabela = gerar_tabela(orcamento=args.orcamento)
+        codigo = renderizar(tabela)
+        atual = open(SAIDA).read() if os.path.exists(SAIDA) else None
+        if args.conferir:
+            if codigo != atual:
+                sys.exit("ik_table.py desatualizado: rode python3 Arm/cinematica.py --gerar")
+            print("ik_table.py atualizado")
+        else:
+            with open(SAIDA, 'w') as f:
+                f.write(codigo)
+            x0, y0, passo, nx, ny, dados = tabela
+            print(f"{nx}x{ny} pontos, passo {passo} mm, {len(dados)} bytes: {os.path.relpath(SAIDA)}")
+    else:
+        _verificar()
+        print("Verificações OK")
+        _benchmark()
@@ -0,0 +1,224 @@
+"""
+Referência em Python do gerador de trajetórias do arm_controller.cpp
+
+Implementa o mesmo planejador que roda no loop() da ESP32 (perfis, cálculo da
+duração, waypoints em sequência, interrupção por um comando novo e progresso),
+com o relógio passado explicitamente, para ser testado e medido no PC.
+Qualquer mudança em um dos lados deve ser replicada no outro.
+
+Uso:
+    python3 Arm/trajetoria.py            # verificações + benchmark
+    p = Planejador()
+    p.comandar(1, [(160, 100, 120, 90, 0)], agora_ms=0)
+    for t in range(0, 3000, 10):
+        for notificacao in p.atualizar(t):
+            print(notificacao)
+"""
+
+# Estados notificados (iguais aos ESTADO_* da ESP32)
+MOVENDO = 1
+CONCLUIDO = 2
+ERRO = 3
+INTERROMPIDO = 4
+
+ANGULO_MANTER = 0xFF
+
+PERFIL_TRAPEZIO = 0
+PERFIL_SCURVE = 1
+PERFIL_PADRAO = PERFIL_SCURVE
+FRACAO_ACELERACAO = 0.25
+VELOCIDADE_PADRAO = 120
+PERIODO_CONTROLE_MS = 10
+PERIODO_PROGRESSO_MS = 100
+N_JUNTAS = 4
+
+
+# Fração do caminho percorrida (0–1) no tempo normalizado tau (0–1)
+def perfil_posicao(perfil, tau):
+    if tau <= 0:
+        return 0.0
+    if tau >= 1:
+        return 1.0
+    if perfil == PERFIL_TRAPEZIO:
+        fa = FRACAO_ACELERACAO
+        k = 1.0 / (2 * fa * (1 - fa))
+        if tau < fa:
+            return k * tau * tau
+        if tau > 1 - fa:
+            return 1 - k * (1 - tau) * (1 - tau)
+        return (tau - fa / 2) / (1 - fa)
+    # S-curve (polinômio de 5ª ordem): velocidade e aceleração nulas nas pontas
+    return tau * tau * tau * (10 + tau * (6 * tau - 15))
+
+
+# Razão entre a velocidade de pico e a velocidade média de cada perfil
+def perfil_pico(perfil):
+    return 1.0 / (1 - FRACAO_ACELERACAO) if perfil == PERFIL_TRAPEZIO else 1.875
+
+
+class Planejador:
+
+    def __init__(self, atual=(90, 90, 90, 90)):
+        self.atual = [float(a) for a in atual]
+        self.ativo = False
+        self.seq = 0
+        self.perfil = PERFIL_PADRAO
+        self.velocidade = 0
+        self.waypoints = []
+        self.indice = 0
+        self.inicio = [0.0] * N_JUNTAS
+        self.fim = [0.0] * N_JUNTAS
+        self.t0_ms = 0
+        self.duracao_ms = 0
+        self.ultimo_progresso_ms = 0
+
+    # Notificação no formato da ESP32: (estado, seq, base, braço1, braço2, garra, progresso %)
+    def _notificacao(self, estado, seq, pct):
+        return (estado, seq) + tuple(int(round(a)) for a in self.atual) + (pct,)
+
+    # Progresso do movimento atual, de 0 a 100, contando todos os waypoints
+    def progresso(self, agora_ms):
+        if not self.ativo or not self.waypoints:
+            return 100
+        tau = (agora_ms - self.t0_ms) / self.duracao_ms if self.duracao_ms else 1
+        return int(100 * (self.indice + min(tau, 1)) / len(self.waypoints))
+
+    # Começa o waypoint self.indice a partir da posição atual (iniciarWaypoint na ESP32)
+    def _iniciar_waypoint(self, agora_ms):
+        *alvo, duracao_ms = self.waypoints[self.indice]
+        maior = 0.0
+        for j in range(N_JUNTAS):
+            self.inicio[j] = self.atual[j]
+            self.fim[j] = self.atual[j] if alvo[j] == ANGULO_MANTER else float(min(alvo[j], 180))
+            maior = max(maior, abs(self.fim[j] - self.inicio[j]))
+        if duracao_ms > 0:
+            self.duracao_ms = duracao_ms
+        else:
+            velocidade = self.velocidade or VELOCIDADE_PADRAO
+            self.duracao_ms = int(1000.0 * maior * perfil_pico(self.perfil) / velocidade)
+        self.t0_ms = agora_ms
+
+    # Troca o movimento atual por uma sequência de waypoints (base, braço1, braço2, garra, duracao_ms).
+    # Retorna as notificações geradas
+    def comandar(self, seq, waypoints, velocidade=0, perfil=PERFIL_PADRAO, agora_ms=0):
+        notificacoes = []
+        if self.ativo:
+            notificacoes.append(self._notificacao(INTERROMPIDO, self.seq, self.progresso(agora_ms)))
+        self.seq = seq
+        self.perfil = perfil
+        self.velocidade = velocidade
+        self.waypoints = list(waypoints)
+        self.indice = 0
+        self.ativo = True
+        self.ultimo_progresso_ms = agora_ms
+        self._iniciar_waypoint(agora_ms)
+        notificacoes.append(self._notificacao(MOVENDO, seq, 0))
+        return notificacoes
+
+    # Passo do controle (atualizarMovimento na ESP32). Retorna as notificações geradas
+    def atualizar(self, agora_ms):
+        if not self.ativo:
+            return []
+        decorrido = agora_ms - self.t0_ms
+        s = perfil_posicao(self.perfil, decorrido / self.duracao_ms) if self.duracao_ms else 1.0
+        for j in range(N_JUNTAS):
+            self.atual[j] = self.inicio[j] + (self.fim[j] - self.inicio[j]) * s
+        if decorrido < self.duracao_ms:
+            if agora_ms - self.ultimo_progresso_ms >= PERIODO_PROGRESSO_MS:
+                self.ultimo_progresso_ms = agora_ms
+                return [self._notificacao(MOVENDO, self.seq, self.progresso(agora_ms))]
+            return []
+        self.indice += 1
+        if self.indice < len(self.waypoints):
+            self._iniciar_waypoint(agora_ms)
+            return []
+        self.ativo = False
+        return [self._notificacao(CONCLUIDO, self.seq, 100)]
+
+
+# Roda o planejador até o fim do movimento. Retorna [(t_ms, ângulos)] e as notificações
+def simular(planejador, agora_ms=0, limite_ms=60000):
+    trajeto = []
+    notificacoes = []
+    while planejador.ativo and agora_ms <= limite_ms:
+        notificacoes += planejador.atualizar(agora_ms)
+        trajeto.append((agora_ms, tuple(planejador.atual)))
+        agora_ms += PERIODO_CONTROLE_MS
+    return trajeto, notificacoes
+
+
+def _verificar():
+    for perfil in (PERFIL_TRAPEZIO, PERFIL_SCURVE):
+        # Perfil contínuo, monótono, de 0 a 1
+        anterior = 0.0
+        for i in range(1001):
+            s = perfil_posicao(perfil, i / 1000)
+            assert anterior - 1e-9 <= s <= 1 + 1e-9
+            anterior = s
+        assert perfil_posicao(perfil, 1) == 1.0
+        # Pico de velocidade normalizada igual ao declarado
+        pico = max((perfil_posicao(perfil, (i + 1) / 10000) - perfil_posicao(perfil, i / 10000)) * 10000
+                   for i in range(10000))
+        assert abs(pico - perfil_pico(perfil)) < 1e-2, (perfil, pico)
+
+        # Juntas chegam juntas: nenhuma alcança o alvo antes da última amostra do movimento
+        p = Planejador()
+        p.comandar(1, [(5, 130, 150, 60, 0)], perfil=perfil)
+        trajeto, notificacoes = simular(p)
+        fim = trajeto[-1][0]
+        assert abs(fim - p.duracao_ms) < PERIODO_CONTROLE_MS, (fim, p.duracao_ms)
+        for t, angulos in trajeto[:-1]:
+            assert all(a != alvo for a, alvo in zip(angulos, (5, 130, 150, 60))), (t, angulos)
+        assert trajeto[-1][1] == (5.0, 130.0, 150.0, 60.0)
+        assert notificacoes[-1][:2] == (CONCLUIDO, 1)
+        # Velocidade de pico respeitada na junta que mais anda
+        velocidade = max(abs(b[1][0] - a[1][0]) / (b[0] - a[0]) * 1000 for a, b in zip(trajeto, trajeto[1:]))
+        assert velocidade <= VELOCIDADE_PADRAO * 1.01, velocidade
+
+    # Duração pedida é respeitada
+    p = Planejador()
+    p.comandar(2, [(90, 90, 90, 120, 1500)])
+    trajeto, _ = simular(p)
+    assert abs(trajeto[-1][0] - 1500) < PERIODO_CONTROLE_MS
+
+    # Interrupção: o novo movimento parte da posição atual, sem salto
+    p = Planejador()
+    p.comandar(3, [(160, 90, 90, 90, 0)])
+    for t in range(0, 500, PERIODO_CONTROLE_MS):
+        p.atualizar(t)
+    antes = tuple(p.atual)
+    notificacoes = p.comandar(4, [(5, 90, 90, 90, 0)], agora_ms=500)
+    assert notificacoes[0][:2] == (INTERROMPIDO, 3)
+    p.atualizar(500)
+    assert tuple(p.atual) == antes
+
+    # Lote: waypoints em sequência, com MANTER e progresso crescente
+    p = Planejador()
+    p.comandar(5, [(160, 100, 120, ANGULO_MANTER, 0), (ANGULO_MANTER, ANGULO_MANTER, ANGULO_MANTER, 120, 0)])
+    trajeto, notificacoes = simular(p)
+    assert trajeto[-1][1] == (160.0, 100.0, 120.0, 120.0)
+    progresso = [n[-1] for n in notificacoes]
+    assert progresso == sorted(progresso) and progresso[-1] == 100
+
+
+def _benchmark(n=20000):
+    import time
+    p = Planejador()
+    p.comandar(1, [(5, 130, 150, 60, 0)])
+    duracao = p.duracao_ms
+    t0 = time.perf_counter()
+    for i in range(n):
+        p.atualizar(i % duracao)
+    dt = time.perf_counter() - t0
+    print(f"atualizar(): {dt / n * 1e6:.2f} us por passo ({n} passos)")
+    t0 = time.perf_counter()
+    for i in range(n // 10):
+        p.comandar(i & 0xFF, [(i % 180, 130, 150, 60, 0)], agora_ms=0)
+    dt = time.perf_counter() - t0
+    print(f"comandar(): {dt / (n // 10) * 1e6:.2f} us por comando")
+
+
+if __name__ == '__main__':
+    _verificar()
+    print("Verificações OK")
+    _benchmark()
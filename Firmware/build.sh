@@ -4,6 +4,18 @@ set -e
 # Configura submódulos (Feito manualmente)
 ./setup_submodules.sh > ./setup_output.log
 
+# Confere se o main.py (e o pico_bench.py) compilam no MicroPython da firmware: o CPython do emulador aceita sintaxe
+# que o compilador do MicroPython recusa (ex.: f-strings adjacentes com chaves)
+make -C external/micropython/mpy-cross > ./mpy_cross_output.log
+external/micropython/mpy-cross/build/mpy-cross -o /dev/null ../main.py
+external/micropython/mpy-cross/build/mpy-cross -o /dev/null pico_bench.py
+
+# Confere se as telas pré-renderizadas (ui_assets.py) correspondem às rotinas de desenho do main.py
+python3 build_assets.py --check
+
+# Confere se a tabela de cinemática inversa do modo mapa (ik_table.py) corresponde à geometria do Arm/cinematica.py
+python3 ../Arm/cinematica.py --conferir
+
 # Limpa build anterior
 cd external/micropython/ports/rp2
 make clean
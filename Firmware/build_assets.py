@@ -0,0 +1,238 @@
+"""
+Screen Asset Builder
+
+Renders the static screens of the touch interface with the drawing
+functions of main.py (on the host emulator, through the same Canvas the
+board uses) and writes them, compressed, to external/libs/ui_assets.py,
+which manifest.py freezes into the firmware. The bytes stay in flash:
+showing a screen streams them to the LCD instead of repeating the fill
+and text calls.
+
+Assets:
+- TELA: the whole 320x240 screen after init() (grid idle, claw open)
+- GARRA_FECHADA: the 320x80 claw row after fechar()
+
+Every other state is one of these with other colors: a pressed grid
+button is its idle rectangle in the highlight color, and each claw
+button is one half of either asset. The builder checks all of them
+(each grid button pressed and released, each claw button in each
+color) against the procedural drawing before writing the file.
+
+Format of an asset: (width, height, palette, rows, data)
+- palette: RGB565 colors; index 0 is the primary color (cor1) and 1
+  the background (cor2) of the drawing functions, so the same asset is
+  drawn in any pair of colors by passing another palette
+- rows: little-endian 16-bit offset of each row in data
+- data: each row as runs of one palette index. A run byte holds the
+  index in the high nibble and the length - 1 in the low nibble; a low
+  nibble of 15 means 16 pixels plus the next byte (16 to 271). Runs do
+  not cross rows, so any sub-rectangle can be decoded directly.
+
+Usage:
+    python3 Firmware/build_assets.py          (rewrite ui_assets.py)
+    python3 Firmware/build_assets.py --check  (fail if it is stale)
+"""
+
+import argparse
+import os
+import sys
+import types
+
+FIRMWARE_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(FIRMWARE_DIR, 'host'))
+
+import emulator  # noqa: E402
+
+emulator.install(with_board=False)
+
+import machine  # noqa: E402
+import main  # noqa: E402
+from canvas import Canvas  # noqa: E402
+from ili9341 import ILI9341, asset_runs  # noqa: E402
+
+OUTPUT = os.path.join(FIRMWARE_DIR, 'external', 'libs', 'ui_assets.py')
+MAX_RUN = 271
+BYTES_PER_LINE = 24
+
+HEADER = '''"""
+Screen Assets of the Touch Interface
+
+Generated by Firmware/build_assets.py from the drawing functions of
+main.py: do not edit, run the builder again after changing them. The
+format is described in build_assets.py; ILI9341.blit_asset() and
+Canvas.blit_asset() draw these tuples.
+"""
+'''
+
+
+class NullSPI:
+    """SPI stand-in for the display the canvas renders for"""
+
+    def write(self, buf):
+        pass
+
+
+def new_canvas():
+    display = ILI9341(NullSPI(), dc=machine.Pin(20), cs=machine.Pin(17))
+    return Canvas(display)
+
+
+def pixels(tela, x, y, w, h):
+    """RGB565 color of each pixel of a canvas rectangle, row by row"""
+    fb, palette = tela.fb, tela._palette
+    return [[palette[fb.pixel(x + i, y + j)] for i in range(w)] for j in range(h)]
+
+
+def encode(image, roles):
+    """
+    Compress rows of RGB565 colors.
+
+    Args:
+        image: List of rows of colors
+        roles: Colors placed first in the palette, in this order
+
+    Returns:
+        (width, height, palette, rows, data) asset tuple
+    """
+    palette = list(roles)
+    for row in image:
+        for color in row:
+            if color not in palette:
+                palette.append(color)
+    if len(palette) > 16:
+        raise ValueError("asset has {} colors, at most 16 fit a run byte".format(len(palette)))
+    index = {color: i for i, color in enumerate(palette)}
+    rows = bytearray()
+    data = bytearray()
+    for row in image:
+        if len(data) > 0xFFFF:
+            raise ValueError("asset data does not fit 16-bit row offsets")
+        rows += len(data).to_bytes(2, 'little')
+        x = 0
+        while x < len(row):
+            color = row[x]
+            n = 1
+            while x + n < len(row) and row[x + n] == color and n < MAX_RUN:
+                n += 1
+            if n < 16:
+                data.append(index[color] << 4 | (n - 1))
+            else:
+                data.append(index[color] << 4 | 15)
+                data.append(n - 16)
+            x += n
+    return (len(image[0]), len(image), tuple(palette), bytes(rows), bytes(data))
+
+
+def decode(asset, palette=None, area=None):
+    """Rows of RGB565 colors of an asset, the way the drivers read it"""
+    width, height, colors, rows, data = asset
+    sx, sy, w, h = area if area else (0, 0, width, height)
+    colors = palette or colors
+    image = []
+    for r in range(sy, sy + h):
+        row = []
+        for a, b, idx in asset_runs(data, rows[2 * r] | rows[2 * r + 1] << 8, sx, sx + w):
+            row += [colors[idx]] * (b - a)
+        image.append(row)
+    return image
+
+
+def build():
+    """
+    Returns:
+        dict of asset name -> tuple
+    """
+    roles = (main.BRANCO, main.PRETO)
+    tela = new_canvas()
+    main.montar_botoes(main.BRANCO, main.PRETO, tela)
+    main.abrir(main.BRANCO, main.PRETO, tela)
+    images = {'TELA': pixels(tela, 0, 0, 320, 240)}
+    main.fechar(main.BRANCO, main.PRETO, tela)
+    images['GARRA_FECHADA'] = pixels(tela, 0, 160, 320, 80)
+    assets = {}
+    for name, image in images.items():
+        assets[name] = encode(image, roles)
+        assert decode(assets[name]) == image, "run encoding does not round-trip: " + name
+    return assets
+
+
+def verify(assets):
+    """
+    Draw every interface state with the drawing functions and with the
+    assets (main.telas) and compare the pixels.
+
+    Raises:
+        AssertionError: On the first state that differs
+    """
+    cores = (main.BRANCO, main.PRETO, main.VERDE, main.VERMELHO, 0x1234)
+
+    def both(draw):
+        images = []
+        for telas in (None, types.SimpleNamespace(**assets)):
+            main.telas = telas
+            tela = new_canvas()
+            draw(tela)
+            images.append(pixels(tela, 0, 0, 320, 240))
+        main.telas = None
+        return images
+
+    states = [('init', lambda t: (main.montar_botoes(main.BRANCO, main.PRETO, t),
+                                  main.abrir(main.BRANCO, main.PRETO, t)))]
+    for cor in cores:
+        states.append(('fechar {:04x}'.format(cor), lambda t, c=cor: main.fechar(c, main.PRETO, t)))
+        states.append(('abrir {:04x}'.format(cor), lambda t, c=cor: main.abrir(c, main.PRETO, t)))
+        for rotulo in ('Fechar', 'Fechado', 'Abrir', 'Aberto'):
+            x = 0 if rotulo.startswith('Fech') else 160
+            states.append(('garra {} {:04x}'.format(rotulo, cor),
+                           lambda t, x=x, r=rotulo, c=cor: main.tocar_garra(x, c, main.PRETO, t, r)))
+    for linha, prefixo in enumerate(('D', 'U')):
+        for coluna in range(4):
+            rotulo = prefixo + str(coluna + 1)
+            for cor, comp in ((main.VERDE, main.PRETO), (main.PRETO, main.VERDE),
+                              (main.BRANCO, main.PRETO), (main.PRETO, 0x1234)):
+                states.append(('botao {} {:04x}'.format(rotulo, cor),
+                               lambda t, x=coluna * 80, y=linha * 80, r=rotulo, c=cor, k=comp:
+                               main.tocar_botao(x, y, c, k, t, r)))
+    for name, draw in states:
+        procedural, blitted = both(draw)
+        assert procedural == blitted, "asset differs from the drawing functions: " + name
+    return len(states)
+
+
+def render(assets):
+    """Source of ui_assets.py"""
+    out = [HEADER]
+    for name, (width, height, palette, rows, data) in assets.items():
+        colors = ', '.join('0x{:04X}'.format(c) for c in palette)
+        out.append('')
+        out.append('# {}x{}, {} colors, {} bytes of runs'.format(width, height, len(palette), len(data)))
+        out.append('{} = ('.format(name))
+        out.append('    {}, {},'.format(width, height))
+        out.append('    ({}{}),'.format(colors, ',' if len(palette) == 1 else ''))
+        for blob in (rows, data):
+            out.append('    (')
+            for i in range(0, len(blob), BYTES_PER_LINE):
+                out.append('        {}'.format(blob[i:i + BYTES_PER_LINE]))
+            out.append('    ),')
+        out.append(')')
+    return '\n'.join(out) + '\n'
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Build the compressed screen assets of the touch interface")
+    parser.add_argument('--check', action='store_true', help="only check that ui_assets.py is up to date")
+    args = parser.parse_args()
+    assets = build()
+    states = verify(assets)
+    source = render(assets)
+    current = open(OUTPUT).read() if os.path.exists(OUTPUT) else None
+    if args.check:
+        if source != current:
+            sys.exit("ui_assets.py is stale: run python3 Firmware/build_assets.py")
+        print("ui_assets.py is up to date ({} states checked)".format(states))
+    else:
+        with open(OUTPUT, 'w') as f:
+            f.write(source)
+        for name, asset in assets.items():
+            print("{}: {}x{}, {} bytes (raw RGB565: {})".format(
+                name, asset[0], asset[1], len(asset[3]) + len(asset[4]), asset[0] * asset[1] * 2))
+        print("{} states checked, written to {}".format(states, os.path.relpath(OUTPUT)))
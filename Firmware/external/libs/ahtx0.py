@@ -41,6 +41,7 @@ class AHT10:
     AHTX0_CMD_SOFTRESET = const(0xBA)  # Soft reset command
     AHTX0_STATUS_BUSY = const(0x80)  # Status bit for busy
     AHTX0_STATUS_CALIBRATED = const(0x08)  # Status bit for calibrated
+    AHTX0_MEASUREMENT_MS = const(80)  # Conversion time from the datasheet
 
     def __init__(self, i2c, address=AHTX0_I2CADDR_DEFAULT):
         utime.sleep_ms(20)  # 20ms delay to wake up
@@ -80,19 +81,41 @@ class AHT10:
     def relative_humidity(self):
         """The measured relative humidity in percent."""
         self._perform_measurement()
-        self._humidity = (
-            (self._buf[1] << 12) | (self._buf[2] << 4) | (self._buf[3] >> 4)
-        )
-        self._humidity = (self._humidity * 100) / 0x100000
+        self._decode()
         return self._humidity
 
     @property
     def temperature(self):
         """The measured temperature in degrees Celcius."""
         self._perform_measurement()
+        self._decode()
+        return self._temp
+
+    def measure(self):
+        """Temperature and relative humidity from a single conversion, as a (celsius, percent) tuple"""
+        self._perform_measurement()
+        self._decode()
+        return self._temp, self._humidity
+
+    async def measure_async(self):
+        """Same as measure(), awaiting the conversion instead of blocking the event loop"""
+        import uasyncio as asyncio
+        self._trigger_measurement()
+        await asyncio.sleep_ms(self.AHTX0_MEASUREMENT_MS)
+        while self.status & self.AHTX0_STATUS_BUSY:
+            await asyncio.sleep_ms(5)
+        self._read_to_buffer()
+        self._decode()
+        return self._temp, self._humidity
+
+    def _decode(self):
+        """Convert the raw buffer into temperature and humidity"""
+        self._humidity = (
+            (self._buf[1] << 12) | (self._buf[2] << 4) | (self._buf[3] >> 4)
+        )
+        self._humidity = (self._humidity * 100) / 0x100000
         self._temp = ((self._buf[3] & 0xF) << 16) | (self._buf[4] << 8) | self._buf[5]
         self._temp = ((self._temp * 200.0) / 0x100000) - 50
-        return self._temp
 
     def _read_to_buffer(self):
         """Read sensor data to buffer"""
@@ -3,7 +3,7 @@
 import math
 
 from micropython import const
-from utime import sleep_ms
+from utime import sleep_ms, ticks_add, ticks_diff, ticks_ms
 
 
 class BH1750:
@@ -29,6 +29,7 @@ class BH1750:
         self._measurement_mode = BH1750.MEASUREMENT_MODE_ONE_TIME
         self._resolution = BH1750.RESOLUTION_HIGH
         self._measurement_time = BH1750.MEASUREMENT_TIME_DEFAULT
+        self._ready_ms = None  # ticks_ms when the conversion in progress is done, None if none is
         
         self._write_measurement_time()
         self._write_measurement_mode()
@@ -65,11 +66,31 @@ class BH1750:
         self._i2c.writeto(self._address, buffer)
         
     def _write_measurement_mode(self):
+        # Does not wait for the conversion: the next read waits for what is left of it
+        self._start_measurement()
+
+    def _start_measurement(self):
         buffer = bytearray(1)
                 
         buffer[0] = self._measurement_mode << 4 | self._resolution
         self._i2c.writeto(self._address, buffer)
-        sleep_ms(24 if self._measurement_time == BH1750.RESOLUTION_LOW else 180)
+        self._ready_ms = ticks_add(ticks_ms(), self._conversion_ms())
+
+    def _pending_ms(self) -> int:
+        """Milliseconds until the conversion in progress is done (0 if there is none).
+
+        In one-time mode a conversion is started first when none is in progress.
+        """
+        if self._ready_ms is None:
+            if self._measurement_mode != BH1750.MEASUREMENT_MODE_ONE_TIME:
+                return 0
+            self._start_measurement()
+        return max(0, ticks_diff(self._ready_ms, ticks_ms()))
+
+    def _conversion_ms(self) -> int:
+        """Maximum conversion time from the datasheet (24 ms low, 180 ms high resolution), scaled by MTreg."""
+        base = 24 if self._resolution == BH1750.RESOLUTION_LOW else 180
+        return math.ceil(base * self._measurement_time / BH1750.MEASUREMENT_TIME_DEFAULT)
         
     def reset(self):
         """Clear the illuminance data register."""
@@ -86,11 +107,26 @@ class BH1750:
     @property
     def measurement(self) -> float:
         """Returns the latest measurement."""
-        if self._measurement_mode == BH1750.MEASUREMENT_MODE_ONE_TIME:
-            self._write_measurement_mode()
+        sleep_ms(self._pending_ms())
+        return self._read_lux()
+
+    async def measurement_async(self) -> float:
+        """Returns a new measurement, awaiting the conversion time instead of blocking.
+
+        The conversion started by the constructor (or configure()) is collected first; after it, in one-time mode a
+        conversion is started and awaited, and in continuous mode the latest result is read right away.
+        """
+        wait_ms = self._pending_ms()
+        if wait_ms:
+            import uasyncio as asyncio
+            await asyncio.sleep_ms(wait_ms)
             
+        return self._read_lux()
+
+    def _read_lux(self) -> float:
         buffer = bytearray(2)
         self._i2c.readfrom_into(self._address, buffer)
+        self._ready_ms = None
         lux = (buffer[0] << 8 | buffer[1]) / (1.2 * (BH1750.MEASUREMENT_TIME_DEFAULT / self._measurement_time))
         
         if self._resolution == BH1750.RESOLUTION_HIGH_2:
@@ -112,5 +148,5 @@ class BH1750:
             yield self.measurement
             
             if self._measurement_mode == BH1750.MEASUREMENT_MODE_CONTINUOUSLY:
-                base_measurement_time = 16 if self._measurement_time == BH1750.RESOLUTION_LOW else 120
+                base_measurement_time = 16 if self._resolution == BH1750.RESOLUTION_LOW else 120
                 sleep_ms(math.ceil(base_measurement_time * self._measurement_time / BH1750.MEASUREMENT_TIME_DEFAULT))
\ No newline at end of file
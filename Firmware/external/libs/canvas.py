@@ -0,0 +1,558 @@
+"""
+Off-screen Canvas for the ILI9341 Driver
+
+Features:
+- Palette-indexed backing store (framebuf GS4_HMSB, up to 16 colors):
+  38.4 KB for 320x240, where a full RGB565 frame (150 KB) does not fit
+  in Pico W RAM next to the BLE stack
+- Drawing API compatible with ILI9341 (fill, fill_rect, pixel, text)
+- Dirty rectangle tracking, merging rectangles whose union is not larger
+  than drawing them separately
+- Batched flush: only dirty rectangles are expanded to RGB565, through a
+  small strip buffer, and streamed with one CS-framed write each
+- Palette coverage per 8x8 tile (a bitmask of the indices drawn in
+  it), so recoloring only repaints the tiles where that color is
+- Compressed screen assets (see build_assets.py) decoded straight into
+  the backing store, so a whole screen costs one call instead of one
+  per rectangle and character
+
+Usage:
+    canvas = Canvas(display)
+    canvas.fill_rect(0, 0, 80, 80, 0xF81F)
+    canvas.text('D1', 25, 25, fg_color=0x0000, bg_color=0xF81F, scale=3)
+    canvas.flush()
+"""
+
+import framebuf
+from array import array
+from ili9341 import ILI9341, asset_runs
+
+# Viper row expansion and asset decoding (kernels.py, when kernels.ENABLED), or None to use the Python loops
+try:
+    import kernels
+    if not kernels.ENABLED:
+        raise ImportError("kernels disabled")
+    from kernels import expand_gs4_rows, rle_gs4_row, rle_cover_row
+except (ImportError, SyntaxError, ValueError):
+    expand_gs4_rows = None
+    rle_gs4_row = None
+    rle_cover_row = None
+
+
+def _expand_gs4(src, src_off, count, lut, dst, dst_off):
+    """
+    Expand GS4 bytes (two pixels each) into big-endian RGB565.
+
+    Args:
+        src: GS4_HMSB buffer
+        src_off: First byte to convert
+        count: Number of bytes to convert
+        lut: 1 KB table mapping each byte to its 4 RGB565 bytes
+        dst: Output buffer
+        dst_off: First output byte
+    """
+    for i in range(src_off, src_off + count):
+        j = src[i] << 2
+        dst[dst_off] = lut[j]
+        dst[dst_off + 1] = lut[j + 1]
+        dst[dst_off + 2] = lut[j + 2]
+        dst[dst_off + 3] = lut[j + 3]
+        dst_off += 4
+
+
+class Canvas:
+    """
+    Off-screen, dirty-rectangle tracked drawing surface for ILI9341.
+
+    Constants:
+    MAX_COLORS: Palette size (GS4 = 16 colors)
+    MAX_DIRTY : Dirty rectangles kept before forcing merges
+    TILE_SHIFT: Coverage tiles are (1 << TILE_SHIFT) pixels square
+    """
+
+    MAX_COLORS = 16
+    MAX_DIRTY = 24
+    TILE_SHIFT = 3
+
+    def __init__(self, display, strip_bytes=2048):
+        """
+        Initialize canvas matching the display size.
+
+        The backing store starts as color 0x0000, which is what
+        ILI9341 leaves on screen after initialization.
+
+        Args:
+            display: Initialized ILI9341 instance
+            strip_bytes: Size of the RGB565 buffer used while flushing
+        """
+        self.display = display
+        self.width = display._width
+        self.height = display._height
+        self._stride = (self.width + 1) // 2
+        self.buffer = bytearray(self._stride * self.height)
+        self.fb = framebuf.FrameBuffer(self.buffer, self.width, self.height, framebuf.GS4_HMSB)
+
+        # Palette: index -> RGB565 color, and color -> index
+        self._palette = []
+        self._index = {}
+        # Palette indices that may be present in each tile (bit n = index n), for recolor()
+        tile = 1 << self.TILE_SHIFT
+        self._tile_cols = (self.width + tile - 1) >> self.TILE_SHIFT
+        self._tile_rows = (self.height + tile - 1) >> self.TILE_SHIFT
+        self._cover = array('H', [1] * (self._tile_cols * self._tile_rows))
+        # Byte (two GS4 pixels) -> four RGB565 bytes
+        self._lut = bytearray(256 * 4)
+        self._color_index(0x0000)
+
+        # Dirty rectangles as [x0, y0, x1, y1] (exclusive ends)
+        self._dirty = []
+        self._strip = bytearray(max(strip_bytes, self.width * 2))
+        # Kernel parameters: [first byte, bytes per row, stride, rows]
+        self._params = array('i', [0, 0, self._stride, 0])
+        # Asset palette index -> canvas palette index, and asset kernel parameters
+        self._asset_lut = bytearray(self.MAX_COLORS)
+        self._asset_params = array('i', [0, 0, 0, 0, 0, 0, self.TILE_SHIFT])
+
+    def _set_palette(self, idx, color):
+        """Update a palette entry and its bytes in the lookup table"""
+        hi = (color >> 8) & 0xFF
+        lo = color & 0xFF
+        self._palette[idx] = color
+        lut = self._lut
+        for b in range(256):
+            j = b << 2
+            if b >> 4 == idx:
+                lut[j] = hi
+                lut[j + 1] = lo
+            if b & 0x0F == idx:
+                lut[j + 2] = hi
+                lut[j + 3] = lo
+
+    def _color_index(self, color):
+        """
+        Return the palette index for a color, allocating one if needed.
+
+        Raises:
+            ValueError: If the palette is full even after reclaiming
+                        entries no longer present in the buffer
+        """
+        idx = self._index.get(color)
+        if idx is not None:
+            return idx
+        if len(self._palette) >= self.MAX_COLORS:
+            idx = self._reclaim()
+            if idx is None:
+                raise ValueError("Canvas palette full ({} colors)".format(self.MAX_COLORS))
+        else:
+            idx = len(self._palette)
+            self._palette.append(None)
+        self._set_palette(idx, color)
+        self._index[color] = idx
+        return idx
+
+    def _reclaim(self):
+        """
+        Find a palette index not used by any pixel: first one absent from
+        every coverage tile, else one absent from the buffer (full scan).
+        """
+        used = 0
+        for bits in self._cover:
+            used |= bits
+        free = None
+        for idx in range(self.MAX_COLORS):
+            if not used & (1 << idx):
+                free = idx
+                break
+        if free is None:
+            # Coverage is conservative: the index may have been drawn over
+            present = bytearray(self.MAX_COLORS)
+            for b in self.buffer:
+                present[b >> 4] = 1
+                present[b & 0x0F] = 1
+            for idx in range(self.MAX_COLORS):
+                if not present[idx]:
+                    free = idx
+                    break
+            if free is None:
+                return None
+            cover = self._cover
+            keep = ~(1 << free)
+            for t in range(len(cover)):
+                cover[t] &= keep
+        old = self._palette[free]
+        if self._index.get(old) == free:
+            del self._index[old]
+        return free
+
+    def _cover_rect(self, bits, x, y, w, h):
+        """
+        Record the palette indices in bits as drawn over a rectangle.
+
+        Tiles the rectangle covers completely hold only these indices now;
+        the ones it touches keep their previous indices as well.
+        """
+        x0 = max(0, x)
+        y0 = max(0, y)
+        x1 = min(self.width, x + w)
+        y1 = min(self.height, y + h)
+        if x0 >= x1 or y0 >= y1:
+            return
+        shift = self.TILE_SHIFT
+        cover = self._cover
+        cols = self._tile_cols
+        tx0 = x0 >> shift
+        tx1 = (x1 - 1) >> shift
+        for ty in range(y0 >> shift, ((y1 - 1) >> shift) + 1):
+            full_y = ty << shift >= y0 and min((ty + 1) << shift, self.height) <= y1
+            row = ty * cols
+            for tx in range(tx0, tx1 + 1):
+                if full_y and tx << shift >= x0 and min((tx + 1) << shift, self.width) <= x1:
+                    cover[row + tx] = bits
+                else:
+                    cover[row + tx] |= bits
+
+    def _mark_tiles(self, bit):
+        """
+        Mark dirty every tile whose coverage has bit: runs of tiles in a
+        tile row, stacked with the same run of the rows below, become one
+        rectangle each.
+        """
+        shift = self.TILE_SHIFT
+        cover = self._cover
+        cols = self._tile_cols
+        # (first tile, end tile) -> first tile row, for the runs still growing
+        stacks = {}
+        for ty in range(self._tile_rows + 1):
+            runs = []
+            if ty < self._tile_rows:
+                row = ty * cols
+                start = None
+                for tx in range(cols + 1):
+                    hit = tx < cols and cover[row + tx] & bit
+                    if hit and start is None:
+                        start = tx
+                    elif not hit and start is not None:
+                        runs.append((start, tx))
+                        start = None
+            for run in list(stacks):
+                if run not in runs:
+                    top = stacks.pop(run)
+                    self._mark(run[0] << shift, top << shift, (run[1] - run[0]) << shift, (ty - top) << shift)
+            for run in runs:
+                if run not in stacks:
+                    stacks[run] = ty
+
+    def _merge(self, src, dst):
+        """Repaint the pixels of palette index src with index dst, in the tiles holding src"""
+        trans = bytearray(256)
+        for b in range(256):
+            hi = b >> 4
+            lo = b & 0x0F
+            trans[b] = ((dst if hi == src else hi) << 4) | (dst if lo == src else lo)
+        shift = self.TILE_SHIFT
+        size = 1 << shift
+        cover = self._cover
+        cols = self._tile_cols
+        buf = self.buffer
+        stride = self._stride
+        bit = 1 << src
+        for t in range(len(cover)):
+            if cover[t] & bit:
+                x = (t % cols) << shift
+                y = (t // cols) << shift
+                count = (min(x + size, self.width) - x + 1) >> 1
+                for row in range(y, min(y + size, self.height)):
+                    start = row * stride + (x >> 1)
+                    for i in range(start, start + count):
+                        buf[i] = trans[buf[i]]
+                cover[t] = (cover[t] & ~bit) | (1 << dst)
+
+    def _mark(self, x, y, w, h):
+        """
+        Add a rectangle to the dirty list, clipped to the canvas.
+
+        X bounds are aligned to even pixels so flushing works on whole
+        GS4 bytes. A rectangle is merged with an existing one when their
+        union is not larger than the two areas added together.
+
+        Returns:
+            Clipped (x0, y0, x1, y1), or None if nothing is visible
+        """
+        x0 = max(0, x) & ~1
+        y0 = max(0, y)
+        x1 = min(self.width, (x + w + 1) & ~1)
+        y1 = min(self.height, y + h)
+        if x0 >= x1 or y0 >= y1:
+            return None
+        clipped = (x0, y0, x1, y1)
+
+        dirty = self._dirty
+        merged = True
+        while merged:
+            merged = False
+            area = (x1 - x0) * (y1 - y0)
+            for i in range(len(dirty)):
+                d = dirty[i]
+                ux0 = min(x0, d[0]); uy0 = min(y0, d[1])
+                ux1 = max(x1, d[2]); uy1 = max(y1, d[3])
+                if (ux1 - ux0) * (uy1 - uy0) <= area + (d[2] - d[0]) * (d[3] - d[1]):
+                    x0, y0, x1, y1 = ux0, uy0, ux1, uy1
+                    dirty.pop(i)
+                    merged = True
+                    break
+
+        if len(dirty) >= self.MAX_DIRTY:
+            # Too many rectangles: fold the new one into the cheapest match
+            best = 0
+            best_growth = None
+            for i in range(len(dirty)):
+                d = dirty[i]
+                growth = ((max(x1, d[2]) - min(x0, d[0])) * (max(y1, d[3]) - min(y0, d[1]))
+                          - (d[2] - d[0]) * (d[3] - d[1]))
+                if best_growth is None or growth < best_growth:
+                    best, best_growth = i, growth
+            d = dirty.pop(best)
+            x0, y0 = min(x0, d[0]), min(y0, d[1])
+            x1, y1 = max(x1, d[2]), max(y1, d[3])
+        dirty.append([x0, y0, x1, y1])
+        return clipped
+
+    def fill(self, color):
+        """Fill the whole canvas with specified color"""
+        idx = self._color_index(color)
+        self.fb.fill(idx)
+        cover = self._cover
+        for t in range(len(cover)):
+            cover[t] = 1 << idx
+        self._dirty = [[0, 0, self.width, self.height]]
+
+    def pixel(self, x, y, color):
+        """Draw a single pixel at specified coordinates"""
+        idx = self._color_index(color)
+        self.fb.pixel(x, y, idx)
+        if self._mark(x, y, 1, 1):
+            self._cover_rect(1 << idx, x, y, 1, 1)
+
+    def fill_rect(self, x, y, w, h, color):
+        """
+        Draw a filled rectangle with specified color.
+
+        Args:
+            x: Top-left X coordinate
+            y: Top-left Y coordinate
+            w: Rectangle width
+            h: Rectangle height
+            color: RGB565 color value
+        """
+        idx = self._color_index(color)
+        self.fb.fill_rect(x, y, w, h, idx)
+        if self._mark(x, y, w, h):
+            self._cover_rect(1 << idx, x, y, w, h)
+
+    def draw_char(self, x, y, char, fg_color=0xFFFF, bg_color=0x0000, scale=1):
+        """
+        Render a single character using the ILI9341 built-in font.
+
+        Returns:
+            (width, height): Dimensions of rendered character
+        """
+        code = ord(char)
+        if code < 32 or code > 126:
+            code = 32  # Replace unsupported with space
+        start = (code - 32) * 5
+        font = ILI9341.DEFAULT_FONT
+        fg = self._color_index(fg_color)
+        bg = self._color_index(bg_color)
+        fb = self.fb
+
+        char_width = 5 * scale
+        char_height = 8 * scale
+        fb.fill_rect(x, y, char_width, char_height, bg)
+        for col_idx in range(5):
+            byte = font[start + col_idx]
+            row_idx = 0
+            # Draw vertical runs of lit pixels (bit 7 is the top row)
+            while row_idx < 8:
+                if (byte >> (7 - row_idx)) & 0x01:
+                    run = row_idx
+                    while run < 8 and (byte >> (7 - run)) & 0x01:
+                        run += 1
+                    fb.fill_rect(x + col_idx * scale, y + row_idx * scale,
+                                 scale, (run - row_idx) * scale, fg)
+                    row_idx = run
+                else:
+                    row_idx += 1
+
+        if self._mark(x, y, char_width, char_height):
+            self._cover_rect((1 << fg) | (1 << bg), x, y, char_width, char_height)
+        return char_width, char_height
+
+    def text(self, text, x, y, fg_color=None, bg_color=None, scale=None, spacing=None):
+        """
+        Render text string using the ILI9341 built-in font.
+
+        Args:
+            text: String to render
+            x: Start X coordinate
+            y: Start Y coordinate
+            fg_color: Text color (default: display setting)
+            bg_color: Background color (default: display setting)
+            scale: Character scaling factor (default: display setting)
+            spacing: Extra spacing between characters (default: display setting)
+        """
+        display = self.display
+        fg = fg_color if fg_color is not None else display._fg_color
+        bg = bg_color if bg_color is not None else display._bg_color
+        scale_val = scale if scale is not None else display._scale
+        spacing_val = spacing if spacing is not None else display._char_spacing
+
+        for char in text:
+            if char == '\n':
+                y += 8 * scale_val + display._line_spacing
+                continue
+
+            width, height = self.draw_char(x, y, char, fg, bg, scale_val)
+            x += width + spacing_val
+
+    def blit_asset(self, asset, x, y, palette=None, area=None):
+        """
+        Draw a compressed asset, or part of it (same arguments as
+        ILI9341.blit_asset). The area is sent on the next flush.
+
+        Args:
+            asset: (width, height, palette, rows, data) tuple, as written
+                   by build_assets.py
+            x: Destination top-left X coordinate
+            y: Destination top-left Y coordinate
+            palette: Colors replacing the asset palette, index by index
+            area: (x, y, w, h) part of the asset to draw (default: all)
+        """
+        width, height, colors, rows, data = asset
+        sx, sy, w, h = area if area else (0, 0, width, height)
+        # Clip to the canvas
+        if x < 0:
+            sx -= x
+            w += x
+            x = 0
+        if y < 0:
+            sy -= y
+            h += y
+            y = 0
+        w = min(w, self.width - x)
+        h = min(h, self.height - y)
+        if w <= 0 or h <= 0:
+            return
+        if palette:
+            colors = palette
+        lut = self._asset_lut
+        for i in range(len(colors)):
+            lut[i] = self._color_index(colors[i])
+        # Tiles inside the area are rebuilt from the runs decoded into them
+        self._cover_rect(0, x, y, w, h)
+
+        params = self._asset_params
+        params[1] = sx
+        params[2] = sx + w
+        params[4] = x - sx
+        pitch = self._stride << 1
+        p = y * pitch + x
+        fb = self.fb
+        cover = self._cover
+        shift = self.TILE_SHIFT
+        for r in range(sy, sy + h):
+            off = rows[2 * r] | (rows[2 * r + 1] << 8)
+            dy = y + r - sy
+            base = (dy >> shift) * self._tile_cols
+            if rle_gs4_row is not None:
+                params[0] = off
+                params[3] = p
+                params[5] = base
+                rle_gs4_row(data, self.buffer, lut, params)
+                rle_cover_row(data, cover, lut, params)
+                p += pitch
+            else:
+                for a, b, idx in asset_runs(data, off, sx, sx + w):
+                    fb.hline(x + a - sx, dy, b - a, lut[idx])
+                    bit = 1 << lut[idx]
+                    for t in range(base + ((x + a - sx) >> shift), base + ((x + b - sx - 1) >> shift) + 1):
+                        cover[t] |= bit
+        self._mark(x, y, w, h)
+
+    def recolor(self, old_color, new_color):
+        """
+        Replace a color everywhere it was drawn by changing its palette entry.
+
+        No pixel is touched: only the tiles where that color was drawn are
+        marked dirty. If new_color is already in the palette, the pixels of
+        old_color are repainted with its index instead (in those tiles
+        only), so each color keeps a single index. Does nothing if
+        old_color is not in the palette.
+
+        Args:
+            old_color: RGB565 color currently in the palette
+            new_color: RGB565 color that replaces it
+        """
+        idx = self._index.get(old_color)
+        if idx is None or old_color == new_color:
+            return
+        del self._index[old_color]
+        self._mark_tiles(1 << idx)
+        other = self._index.get(new_color)
+        if other is None:
+            self._index[new_color] = idx
+            self._set_palette(idx, new_color)
+        else:
+            self._merge(idx, other)
+
+    def invalidate(self, x=0, y=0, w=None, h=None):
+        """Mark an area (default: whole canvas) to be sent on next flush"""
+        self._mark(x, y, self.width if w is None else w, self.height if h is None else h)
+
+    def flush(self):
+        """
+        Send every dirty rectangle to the display and clear the list.
+
+        Returns:
+            Number of pixel bytes sent
+        """
+        sent = 0
+        for x0, y0, x1, y1 in self._dirty:
+            sent += self._flush_rect(x0, y0, x1, y1)
+        self._dirty = []
+        return sent
+
+    def _flush_rect(self, x0, y0, x1, y1):
+        """Expand a rectangle to RGB565 strip by strip and stream it"""
+        display = self.display
+        w = x1 - x0
+        row_bytes = w * 2
+        strip = self._strip
+        rows_per_strip = len(strip) // row_bytes
+        mv = memoryview(strip)
+        src = self.buffer
+        lut = self._lut
+        stride = self._stride
+        src_count = w // 2
+
+        display.set_window(x0, y0, w, y1 - y0)
+        display.dc(1)  # Data mode
+        display.cs(0)  # Select device for the whole rectangle
+        params = self._params
+        params[1] = src_count
+        y = y0
+        while y < y1:
+            rows = min(rows_per_strip, y1 - y)
+            if expand_gs4_rows is not None:
+                params[0] = y * stride + (x0 >> 1)
+                params[3] = rows
+                expand_gs4_rows(src, strip, lut, params)
+                off = rows * row_bytes
+            else:
+                off = 0
+                for row in range(y, y + rows):
+                    _expand_gs4(src, row * stride + (x0 >> 1), src_count, lut, strip, off)
+                    off += row_bytes
+            display.spi.write(mv[:off])
+            y += rows
+        display.cs(1)  # Deselect device
+        return row_bytes * (y1 - y0)
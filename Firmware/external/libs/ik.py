@@ -0,0 +1,125 @@
+"""
+Inverse Kinematics Lookup
+
+Features:
+- Servo angles (base, shoulder, elbow) of a point of the horizontal work
+  plane, read from a table built offline (ik_table.py, generated by
+  Arm/cinematica.py) instead of solving the trigonometry on each touch
+- Bilinear interpolation in 8-bit fixed point: integer math only, after
+  scaling the coordinates
+- Points whose grid cell has an unreachable corner are rejected, so every
+  answer comes from solved poses
+- Runs unchanged under CPython, where Arm/cinematica.py measures its
+  accuracy and speed against the exact solver
+
+Usage:
+    import ik_table
+    table = IKTable(ik_table)
+    angles = table.angles(x_mm, y_mm)  # (base, shoulder, elbow) or None
+    for x0, y0, x1, y1 in table.regions():
+        ...                            # reachable rectangles, to draw a map
+"""
+
+UNREACHABLE = 0xFF
+
+
+class IKTable:
+    """
+    Lookup over a grid of precomputed poses.
+
+    Attributes:
+        x0, y0: Plane coordinates of the first grid point (mm)
+        x1, y1: Plane coordinates of the last grid point (mm)
+        z: Height of the plane above the table (mm)
+    """
+
+    def __init__(self, table):
+        """
+        Args:
+            table: Module (or object) with X0, Y0, STEP, NX, NY, Z and DATA,
+                   as written by Arm/cinematica.py
+        """
+        self.x0 = table.X0
+        self.y0 = table.Y0
+        self.z = table.Z
+        self.x1 = table.X0 + (table.NX - 1) * table.STEP
+        self.y1 = table.Y0 + (table.NY - 1) * table.STEP
+        self._step = table.STEP
+        self._nx = table.NX
+        self._ny = table.NY
+        self._scale = 256 / table.STEP
+        self._data = table.DATA
+
+    def angles(self, x, y):
+        """
+        Args:
+            x, y: Point of the plane in mm (x to the right, y forward)
+
+        Returns:
+            (base, shoulder, elbow) in whole degrees, or None if the point is
+            out of reach
+        """
+        if x < self.x0 or y < self.y0:
+            return None
+        fx = int((x - self.x0) * self._scale)
+        fy = int((y - self.y0) * self._scale)
+        i = fx >> 8
+        j = fy >> 8
+        nx = self._nx
+        # The last row/column only has a cell before it
+        if i >= nx - 1:
+            if i > nx - 1 or fx & 0xFF:
+                return None
+            i -= 1
+            fx = 256
+        else:
+            fx &= 0xFF
+        if j >= self._ny - 1:
+            if j > self._ny - 1 or fy & 0xFF:
+                return None
+            j -= 1
+            fy = 256
+        else:
+            fy &= 0xFF
+        data = self._data
+        a = 3 * (j * nx + i)
+        b = a + 3
+        c = a + 3 * nx
+        d = c + 3
+        if (data[a] == UNREACHABLE or data[b] == UNREACHABLE
+                or data[c] == UNREACHABLE or data[d] == UNREACHABLE):
+            return None
+        # Weights of the four corners, summing to 1 << 16
+        gx = 256 - fx
+        gy = 256 - fy
+        w00 = gx * gy
+        w10 = fx * gy
+        w01 = gx * fy
+        w11 = fx * fy
+        return ((data[a] * w00 + data[b] * w10 + data[c] * w01 + data[d] * w11 + 0x8000) >> 16,
+                (data[a + 1] * w00 + data[b + 1] * w10 + data[c + 1] * w01 + data[d + 1] * w11 + 0x8000) >> 16,
+                (data[a + 2] * w00 + data[b + 2] * w10 + data[c + 2] * w01 + data[d + 2] * w11 + 0x8000) >> 16)
+
+    def regions(self):
+        """
+        Rectangles of the plane where angles() answers: one per run of
+        reachable cells in each row of cells.
+
+        Yields:
+            (x0, y0, x1, y1) in mm
+        """
+        data = self._data
+        nx = self._nx
+        step = self._step
+        for j in range(self._ny - 1):
+            y = self.y0 + j * step
+            start = None
+            for i in range(nx):
+                a = 3 * (j * nx + i)
+                ok = (i < nx - 1 and data[a] != UNREACHABLE and data[a + 3] != UNREACHABLE
+                      and data[a + 3 * nx] != UNREACHABLE and data[a + 3 * nx + 3] != UNREACHABLE)
+                if ok and start is None:
+                    start = i
+                elif not ok and start is not None:
+                    yield self.x0 + start * step, y, self.x0 + i * step, y + step
+                    start = None
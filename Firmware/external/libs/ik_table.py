@@ -0,0 +1,277 @@
+"""
+Inverse Kinematics Table of the Arm
+
+Generated by Arm/cinematica.py from the link lengths of the printed
+parts: do not edit, run it again with --gerar after changing them.
+Servo angles (base, shoulder, elbow) in degrees, 3 bytes per point of
+a grid on the horizontal plane Z mm above the table, row by row from
+(X0, Y0); a base of 255 marks a point out of reach. ik.IKTable reads
+it.
+"""
+
+# Geometry the table was solved for (mm): link lengths and shoulder height
+LINKS = (71.0, 95.0)
+SHOULDER_Z = 110.0
+
+Z = 30.0
+X0 = -124.0
+Y0 = 0.0
+STEP = 4.0
+NX = 63
+NY = 32
+
+# 6048 bytes
+DATA = (
+    b'\xff\xff\xff\xb4\xb3x\xb4\xb1s\xb4\xafo\xb4\xaek\xb4\xadh\xb4\xacd\xb4\xaba'
+    b'\xb4\xaa]\xb4\xa9Z\xb4\xa9W\xb4\xa8U\xb4\xa8R\xb4\xa8O\xb4\xa8M\xb4\xa8K'
+    b'\xb4\xa8H\xb4\xa9F\xb4\xa9D\xb4\xaaC\xb4\xabA\xb4\xac?\xb4\xad>\xb4\xaf='
+    b'\xb4\xb0;\xb4\xb2:\xb4\xb49\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x00\xb49\x00\xb2:\x00\xb0;\x00\xaf='
+    b'\x00\xad>\x00\xac?\x00\xabA\x00\xaaC\x00\xa9D\x00\xa9F\x00\xa8H\x00\xa8K'
+    b'\x00\xa8M\x00\xa8O\x00\xa8R\x00\xa8U\x00\xa9W\x00\xa9Z\x00\xaa]\x00\xaba'
+    b'\x00\xacd\x00\xadh\x00\xaek\x00\xafo\x00\xb1s\x00\xb3x\xff\xff\xff\xff\xff\xff'
+    b'\xb2\xb3x\xb2\xb1s\xb2\xb0o\xb2\xaek\xb2\xadh\xb2\xacd\xb2\xaba\xb2\xaa]'
+    b'\xb1\xa9Z\xb1\xa9W\xb1\xa8U\xb1\xa8R\xb1\xa8O\xb1\xa8M\xb0\xa8K\xb0\xa8I'
+    b'\xb0\xa9F\xb0\xa9D\xaf\xaaC\xaf\xabA\xae\xac?\xae\xad>\xad\xae=\xac\xb0;'
+    b'\xab\xb2:\xa9\xb49\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\x0b\xb49\t\xb2:\x08\xb0;\x07\xae=\x06\xad>'
+    b'\x06\xac?\x05\xabA\x05\xaaC\x04\xa9D\x04\xa9F\x04\xa8I\x04\xa8K\x03\xa8M'
+    b'\x03\xa8O\x03\xa8R\x03\xa8U\x03\xa9W\x03\xa9Z\x02\xaa]\x02\xaba\x02\xacd'
+    b'\x02\xadh\x02\xaek\x02\xb0o\x02\xb1s\x02\xb3x\xff\xff\xff\xff\xff\xff\xb0\xb3x'
+    b'\xb0\xb1t\xb0\xb0o\xb0\xael\xb0\xadh\xaf\xacd\xaf\xaba\xaf\xaa^\xaf\xa9['
+    b'\xaf\xa9X\xae\xa8U\xae\xa8R\xae\xa8P\xad\xa8M\xad\xa8K\xac\xa8I\xac\xa9G'
+    b'\xab\xa9E\xab\xaaC\xaa\xabA\xa9\xac@\xa7\xad>\xa6\xae=\xa4\xb0<\xa2\xb1;'
+    b'\x9e\xb3:\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\x16\xb3:\x12\xb1;\x10\xb0<\x0e\xae=\r\xad>\x0b\xac@'
+    b'\n\xabA\t\xaaC\t\xa9E\x08\xa9G\x08\xa8I\x07\xa8K\x07\xa8M\x06\xa8P'
+    b'\x06\xa8R\x06\xa8U\x05\xa9X\x05\xa9[\x05\xaa^\x05\xaba\x05\xacd\x04\xadh'
+    b'\x04\xael\x04\xb0o\x04\xb1t\x04\xb3x\xff\xff\xff\xff\xff\xff\xae\xb3y\xae\xb1t'
+    b'\xae\xb0p\xae\xael\xad\xadh\xad\xace\xad\xaba\xad\xaa^\xac\xa9[\xac\xa9X'
+    b'\xab\xa8U\xab\xa8S\xab\xa8P\xaa\xa8N\xa9\xa8K\xa9\xa8I\xa8\xa8G\xa7\xa9E'
+    b'\xa6\xaaC\xa5\xaaB\xa3\xab@\xa2\xac?\x9f\xae=\x9d\xaf<\x99\xb1;\x95\xb2:'
+    b'\x8f\xb49\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'%\xb49\x1f\xb2:\x1b\xb1;\x17\xaf<\x15\xae=\x12\xac?\x11\xab@\x0f\xaaB'
+    b'\x0e\xaaC\r\xa9E\x0c\xa8G\x0b\xa8I\x0b\xa8K\n\xa8N\t\xa8P\t\xa8S'
+    b'\t\xa8U\x08\xa9X\x08\xa9[\x07\xaa^\x07\xaba\x07\xace\x07\xadh\x06\xael'
+    b'\x06\xb0p\x06\xb1t\x06\xb3y\xff\xff\xff\xff\xff\xff\xac\xb3y\xac\xb2u\xac\xb0p'
+    b'\xac\xael\xab\xadi\xab\xace\xab\xabb\xaa\xaa^\xaa\xa9[\xa9\xa9X\xa9\xa8V'
+    b'\xa8\xa8S\xa7\xa8Q\xa7\xa8N\xa6\xa8L\xa5\xa8J\xa4\xa8H\xa3\xa9F\xa2\xa9D'
+    b'\xa0\xaaB\x9e\xab@\x9c\xac?\x99\xad>\x96\xae=\x92\xb0<\x8d\xb1;\x87\xb3:'
+    b'\x7f\xb49\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff5\xb49-\xb3:'
+    b'\'\xb1;"\xb0<\x1e\xae=\x1b\xad>\x18\xac?\x16\xab@\x14\xaaB\x12\xa9D'
+    b'\x11\xa9F\x10\xa8H\x0f\xa8J\x0e\xa8L\r\xa8N\r\xa8Q\x0c\xa8S\x0b\xa8V'
+    b'\x0b\xa9X\n\xa9[\n\xaa^\t\xabb\t\xace\t\xadi\x08\xael\x08\xb0p'
+    b'\x08\xb2u\x08\xb3y\xff\xff\xff\xff\xff\xff\xab\xb4z\xaa\xb2u\xaa\xb0q\xaa\xafm'
+    b'\xa9\xadi\xa9\xacf\xa8\xabb\xa8\xaa_\xa7\xaa\\\xa7\xa9Y\xa6\xa9V\xa5\xa8T'
+    b'\xa4\xa8Q\xa4\xa8O\xa3\xa8L\xa2\xa8J\xa0\xa8H\x9f\xa9F\x9d\xa9D\x9c\xaaC'
+    b'\x99\xabA\x97\xac@\x94\xad>\x90\xae=\x8c\xaf<\x87\xb0;\x81\xb1;y\xb2:'
+    b'p\xb3:e\xb49Z\xb49O\xb49D\xb3:;\xb2:3\xb1;-\xb0;'
+    b'(\xaf<$\xae= \xad>\x1d\xac@\x1b\xabA\x18\xaaC\x17\xa9D\x15\xa9F'
+    b'\x14\xa8H\x12\xa8J\x11\xa8L\x10\xa8O\x10\xa8Q\x0f\xa8T\x0e\xa9V\r\xa9Y'
+    b'\r\xaa\\\x0c\xaa_\x0c\xabb\x0b\xacf\x0b\xadi\n\xafm\n\xb0q\n\xb2u'
+    b'\t\xb4z\xff\xff\xff\xff\xff\xff\xff\xff\xff\xa8\xb2v\xa8\xb0r\xa7\xafn\xa7\xaej'
+    b'\xa7\xacf\xa6\xabc\xa5\xab`\xa5\xaa]\xa4\xa9Z\xa3\xa9W\xa2\xa8T\xa2\xa8R'
+    b'\xa1\xa8O\x9f\xa8M\x9e\xa8K\x9d\xa8I\x9b\xa8G\x99\xa9E\x97\xaaD\x95\xaaB'
+    b'\x92\xabA\x8f\xac?\x8b\xad>\x87\xae=\x82\xaf<|\xb0<u\xb1;l\xb1;'
+    b'c\xb2:Z\xb2:Q\xb2:H\xb1;?\xb1;8\xb0<2\xaf<-\xae='
+    b')\xad>%\xac?"\xabA\x1f\xaaB\x1d\xaaD\x1b\xa9E\x19\xa8G\x17\xa8I'
+    b'\x16\xa8K\x15\xa8M\x13\xa8O\x12\xa8R\x12\xa8T\x11\xa9W\x10\xa9Z\x0f\xaa]'
+    b'\x0f\xab`\x0e\xabc\r\xacf\r\xaej\r\xafn\x0c\xb0r\x0c\xb2v\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xa6\xb3w\xa6\xb1s\xa5\xafo\xa5\xaek\xa4\xadg'
+    b'\xa4\xacd\xa3\xaba\xa2\xaa^\xa2\xa9[\xa1\xa9X\xa0\xa8U\x9f\xa8S\x9e\xa8P'
+    b'\x9c\xa8N\x9b\xa8L\x99\xa8J\x98\xa8H\x96\xa9F\x94\xa9D\x91\xaaC\x8e\xaaB'
+    b'\x8b\xab@\x87\xac?\x83\xad>~\xae=x\xae=q\xaf<j\xb0<b\xb0;'
+    b'Z\xb0;R\xb0;J\xb0<C\xaf<<\xae=6\xae=1\xad>-\xac?'
+    b')\xab@&\xaaB#\xaaC \xa9D\x1e\xa9F\x1c\xa8H\x1b\xa8J\x19\xa8L'
+    b'\x18\xa8N\x16\xa8P\x15\xa8S\x14\xa8U\x13\xa9X\x12\xa9[\x12\xaa^\x11\xaba'
+    b'\x10\xacd\x10\xadg\x0f\xaek\x0f\xafo\x0e\xb1s\x0e\xb3w\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xa5\xb3x\xa4\xb1t\xa3\xb0p\xa3\xael\xa2\xadh\xa2\xace'
+    b'\xa1\xabb\xa0\xaa_\x9f\xaa\\\x9e\xa9Y\x9d\xa9V\x9c\xa8T\x9b\xa8Q\x99\xa8O'
+    b'\x98\xa8M\x96\xa8K\x94\xa8I\x92\xa8G\x90\xa9F\x8d\xa9D\x8a\xaaC\x87\xabA'
+    b'\x83\xab@\x7f\xac?z\xad>u\xad>o\xae=h\xae=a\xae=Z\xaf='
+    b'S\xae=L\xae=E\xae=?\xad>:\xad>5\xac?1\xab@-\xabA'
+    b'*\xaaC\'\xa9D$\xa9F"\xa8G \xa8I\x1e\xa8K\x1c\xa8M\x1b\xa8O'
+    b'\x19\xa8Q\x18\xa8T\x17\xa9V\x16\xa9Y\x15\xaa\\\x14\xaa_\x13\xabb\x12\xace'
+    b'\x12\xadh\x11\xael\x11\xb0p\x10\xb1t\x0f\xb3x\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xa3\xb4z\xa2\xb2u\xa2\xb0q\xa1\xafm\xa0\xaej\x9f\xacf\x9f\xabc'
+    b'\x9e\xab`\x9d\xaa]\x9c\xa9Z\x9b\xa9W\x99\xa8U\x98\xa8S\x97\xa8P\x95\xa8N'
+    b'\x93\xa8L\x91\xa8J\x8f\xa8H\x8d\xa9G\x8a\xa9E\x87\xa9D\x84\xaaC\x80\xaaB'
+    b'|\xabAw\xac@r\xac?l\xac?g\xad>`\xad>Z\xad>T\xad>'
+    b'M\xad>H\xac?B\xac?=\xac@8\xabA4\xaaB0\xaaC-\xa9D'
+    b"*\xa9E'\xa9G%\xa8H#\xa8J!\xa8L\x1f\xa8N\x1d\xa8P\x1c\xa8S"
+    b'\x1b\xa8U\x19\xa9W\x18\xa9Z\x17\xaa]\x16\xab`\x15\xabc\x15\xacf\x14\xaej'
+    b'\x13\xafm\x12\xb0q\x12\xb2u\x11\xb4z\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xa0\xb2w\xa0\xb1s\x9f\xafo\x9e\xaek\x9d\xadh\x9d\xacd\x9c\xaba'
+    b'\x9b\xaa^\x99\xa9[\x98\xa9Y\x97\xa9V\x96\xa8T\x94\xa8R\x92\xa8O\x90\xa8M'
+    b'\x8e\xa8L\x8c\xa8J\x8a\xa8H\x87\xa9G\x84\xa9E\x81\xa9D}\xaaCy\xaaB'
+    b'u\xabAp\xab@k\xab@e\xac@`\xac?Z\xac?T\xac?O\xac@'
+    b'I\xab@D\xab@?\xabA;\xaaB7\xaaC3\xa9D0\xa9E-\xa9G'
+    b'*\xa8H(\xa8J&\xa8L$\xa8M"\xa8O \xa8R\x1e\xa8T\x1d\xa9V'
+    b'\x1c\xa9Y\x1b\xa9[\x19\xaa^\x18\xaba\x17\xacd\x17\xadh\x16\xaek\x15\xafo'
+    b'\x14\xb1s\x14\xb2w\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\x9f\xb3x\x9e\xb1t\x9d\xb0p\x9c\xael\x9b\xadi\x9a\xacf\x99\xabc\x98\xab`'
+    b'\x97\xaa]\x96\xa9Z\x95\xa9X\x93\xa8U\x91\xa8S\x90\xa8Q\x8e\xa8O\x8c\xa8M'
+    b'\x89\xa8K\x87\xa8J\x84\xa8H\x81\xa9G~\xa9Fz\xa9Dw\xaaDr\xaaC'
+    b'n\xaaBi\xaaBd\xabA_\xabAZ\xabAU\xabAP\xabAK\xaaB'
+    b'F\xaaBB\xaaC=\xaaD:\xa9D6\xa9F3\xa9G0\xa8H-\xa8J'
+    b'+\xa8K(\xa8M&\xa8O$\xa8Q#\xa8S!\xa8U\x1f\xa9X\x1e\xa9Z'
+    b'\x1d\xaa]\x1c\xab`\x1b\xabc\x1a\xacf\x19\xadi\x18\xael\x17\xb0p\x16\xb1t'
+    b'\x15\xb3x\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x9d\xb4z'
+    b'\x9c\xb2v\x9b\xb0r\x9a\xafn\x99\xaek\x98\xadg\x97\xacd\x96\xaba\x95\xaa^'
+    b'\x94\xaa\\\x92\xa9Y\x91\xa9W\x8f\xa8U\x8d\xa8R\x8b\xa8Q\x89\xa8O\x87\xa8M'
+    b'\x85\xa8K\x82\xa8J\x7f\xa8H|\xa8Gx\xa9Fu\xa9Eq\xa9Dl\xa9D'
+    b'h\xaaCc\xaaC_\xaaCZ\xaaCU\xaaCQ\xaaCL\xaaCH\xa9D'
+    b'C\xa9D?\xa9E<\xa9F8\xa8G5\xa8H2\xa8J/\xa8K-\xa8M'
+    b'+\xa8O)\xa8Q\'\xa8R%\xa8U#\xa9W"\xa9Y \xaa\\\x1f\xaa^'
+    b'\x1e\xaba\x1d\xacd\x1c\xadg\x1b\xaek\x1a\xafn\x19\xb0r\x18\xb2v\x17\xb4z'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x9a\xb3x'
+    b'\x99\xb1t\x99\xb0p\x98\xael\x97\xadi\x95\xacf\x94\xabc\x93\xab`\x92\xaa]'
+    b'\x90\xa9[\x8f\xa9Y\x8d\xa9V\x8b\xa8T\x89\xa8R\x87\xa8P\x85\xa8O\x82\xa8M'
+    b'\x80\xa8L}\xa8Jz\xa8Iv\xa8Hs\xa8Go\xa9Fk\xa9Fg\xa9E'
+    b'c\xa9E^\xa9DZ\xa9DV\xa9DQ\xa9EM\xa9EI\xa9FE\xa9F'
+    b'A\xa8G>\xa8H:\xa8I7\xa8J4\xa8L2\xa8M/\xa8O-\xa8P'
+    b'+\xa8R)\xa8T\'\xa9V%\xa9Y$\xa9["\xaa]!\xab` \xabc'
+    b'\x1f\xacf\x1d\xadi\x1c\xael\x1b\xb0p\x1b\xb1t\x1a\xb3x\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x99\xb4z\x98\xb2v'
+    b'\x97\xb1r\x96\xafn\x95\xaek\x94\xadh\x92\xace\x91\xabb\x90\xaa_\x8e\xaa]'
+    b'\x8d\xa9Z\x8b\xa9X\x89\xa8V\x87\xa8T\x85\xa8R\x83\xa8Q\x80\xa8O~\xa8M'
+    b'{\xa8Lx\xa8Ku\xa8Jq\xa8In\xa8Hj\xa8Hf\xa8Gb\xa9G'
+    b'^\xa9FZ\xa9FV\xa9FR\xa9GN\xa8GJ\xa8HF\xa8HC\xa8I'
+    b'?\xa8J<\xa8K9\xa8L6\xa8M4\xa8O1\xa8Q/\xa8R-\xa8T'
+    b'+\xa8V)\xa9X\'\xa9Z&\xaa]$\xaa_#\xabb"\xace \xadh'
+    b'\x1f\xaek\x1e\xafn\x1d\xb1r\x1c\xb2v\x1b\xb4z\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x96\xb3x\x95\xb1t'
+    b'\x94\xb0p\x93\xafm\x92\xaej\x90\xadg\x8f\xacd\x8e\xaba\x8c\xaa_\x8b\xaa\\'
+    b'\x89\xa9Z\x87\xa9X\x85\xa8V\x83\xa8T\x81\xa8R~\xa8Q|\xa8Oy\xa8N'
+    b'v\xa8Ms\xa8Lp\xa8Kl\xa8Ji\xa8Je\xa8Ib\xa8I^\xa8I'
+    b'Z\xa8HV\xa8IR\xa8IO\xa8IK\xa8JH\xa8JD\xa8KA\xa8L'
+    b'>\xa8M;\xa8N8\xa8O6\xa8Q3\xa8R1\xa8T/\xa8V-\xa9X'
+    b'+\xa9Z)\xaa\\(\xaa_&\xaba%\xacd$\xadg"\xaej!\xafm'
+    b' \xb0p\x1f\xb1t\x1e\xb3x\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x94\xb4z\x93\xb2v\x92\xb1s'
+    b'\x91\xb0o\x90\xael\x8f\xadi\x8d\xacf\x8c\xacc\x8a\xaba\x89\xaa^\x87\xaa\\'
+    b'\x85\xa9Z\x83\xa9X\x81\xa9V\x7f\xa8U}\xa8Sz\xa8Rw\xa8Pu\xa8O'
+    b'r\xa8No\xa8Mk\xa8Lh\xa8Le\xa8Ka\xa8K^\xa8KZ\xa8K'
+    b'V\xa8KS\xa8KO\xa8KL\xa8LI\xa8LE\xa8MB\xa8N?\xa8O'
+    b'=\xa8P:\xa8R7\xa8S5\xa8U3\xa9V1\xa9X/\xa9Z-\xaa\\'
+    b'+\xaa^*\xaba(\xacc\'\xacf%\xadi$\xael#\xb0o"\xb1s'
+    b'!\xb2v \xb4z\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x92\xb3y\x91\xb2u\x90\xb0r'
+    b'\x8e\xafn\x8d\xaek\x8c\xadh\x8a\xacf\x89\xabc\x87\xaba\x85\xaa^\x83\xaa\\'
+    b'\x81\xa9Z\x7f\xa9Y}\xa9W{\xa8Ux\xa8Tv\xa8Ss\xa8Qp\xa8P'
+    b'm\xa8Oj\xa8Og\xa8Nd\xa8Na\xa8M]\xa8MZ\xa8MW\xa8M'
+    b'S\xa8MP\xa8NM\xa8NJ\xa8OG\xa8OD\xa8PA\xa8Q>\xa8S'
+    b'<\xa8T9\xa8U7\xa9W5\xa9Y3\xa9Z1\xaa\\/\xaa^-\xaba'
+    b'+\xabc*\xacf(\xadh\'\xaek&\xafn$\xb0r#\xb2u"\xb3y'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x8f\xb3x\x8e\xb1t\x8d\xb0q'
+    b'\x8b\xafn\x8a\xaek\x89\xadh\x87\xacf\x85\xabc\x84\xaba\x82\xaa_\x80\xaa]'
+    b'~\xa9[|\xa9Yy\xa9Xw\xa9Vu\xa8Ur\xa8To\xa8Sl\xa8R'
+    b'j\xa8Qg\xa8Qc\xa8P`\xa8P]\xa8OZ\xa8OW\xa8OT\xa8P'
+    b'Q\xa8PM\xa8QJ\xa8QH\xa8RE\xa8SB\xa8T?\xa8U=\xa9V'
+    b';\xa9X8\xa9Y6\xa9[4\xaa]2\xaa_0\xaba/\xabc-\xacf'
+    b"+\xadh*\xaek)\xafn'\xb0q&\xb1t%\xb3x\xff\xff\xff\xff\xff\xff"
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x8c\xb3w\x8b\xb1t\x8a\xb0q'
+    b'\x88\xafn\x87\xaek\x85\xadh\x84\xacf\x82\xacc\x80\xaba~\xaa_|\xaa]'
+    b'z\xaa\\x\xa9Zv\xa9Ys\xa9Wq\xa9Vn\xa8Ul\xa8Ti\xa8T'
+    b'f\xa8Sc\xa8S`\xa8R]\xa8RZ\xa8RW\xa8RT\xa8RQ\xa8S'
+    b'N\xa8SK\xa8TH\xa8TF\xa8UC\xa9VA\xa9W>\xa9Y<\xa9Z'
+    b':\xaa\\8\xaa]6\xaa_4\xaba2\xacc0\xacf/\xadh-\xaek'
+    b',\xafn*\xb0q)\xb1t(\xb3w\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x8b\xb4z\x8a\xb2w\x88\xb1s\x87\xb0p'
+    b'\x86\xafn\x84\xaek\x82\xadh\x81\xacf\x7f\xacd}\xabb{\xab`y\xaa^'
+    b'w\xaa]u\xa9[r\xa9Zp\xa9Ym\xa9Xk\xa9Wh\xa9Ve\xa8V'
+    b'c\xa8U`\xa8U]\xa8UZ\xa8UW\xa8UT\xa8UQ\xa8UO\xa8V'
+    b'L\xa9VI\xa9WG\xa9XD\xa9YB\xa9Z?\xa9[=\xaa];\xaa^'
+    b'9\xab`7\xabb5\xacd3\xacf2\xadh0\xaek.\xafn-\xb0p'
+    b',\xb1s*\xb2w)\xb4z\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x88\xb4z\x87\xb2w\x86\xb1s\x84\xb0q'
+    b'\x83\xafn\x81\xaek\x7f\xadi~\xadg|\xacez\xabcx\xabav\xab`'
+    b's\xaa^q\xaa]o\xaa\\l\xa9[j\xa9Zg\xa9Ye\xa9Xb\xa9X'
+    b'_\xa9X]\xa9WZ\xa9WW\xa9WU\xa9XR\xa9XO\xa9XM\xa9Y'
+    b'J\xa9ZH\xa9[E\xaa\\C\xaa]A\xaa^>\xab`<\xaba:\xabc'
+    b'8\xace6\xadg5\xadi3\xaek1\xafn0\xb0q.\xb1s-\xb2w'
+    b',\xb4z\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x86\xb4z\x84\xb2w\x83\xb1t\x81\xb0q'
+    b'\x80\xafn~\xael|\xaejz\xadhy\xacfw\xacdu\xabcr\xaba'
+    b'p\xab`n\xaa_l\xaa^i\xaa]g\xaa\\d\xa9[b\xa9[_\xa9['
+    b']\xa9ZZ\xa9ZW\xa9ZU\xa9[R\xa9[P\xa9[M\xaa\\K\xaa]'
+    b'H\xaa^F\xaa_D\xab`B\xaba?\xabc=\xacd;\xacf:\xadh'
+    b'8\xaej6\xael4\xafn3\xb0q1\xb1t0\xb2w.\xb4z\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x83\xb4z\x82\xb3w\x80\xb1t~\xb0r'
+    b'}\xb0o{\xafmy\xaekw\xadiv\xadgt\xacfq\xacdo\xabc'
+    b'm\xabbk\xabai\xab`f\xaa_d\xaa^a\xaa^_\xaa^\\\xaa]'
+    b'Z\xaa]X\xaa]U\xaa^S\xaa^P\xaa^N\xaa_K\xab`I\xaba'
+    b'G\xabbE\xabcC\xacd@\xacf>\xadg=\xadi;\xaek9\xafm'
+    b'7\xb0o6\xb0r4\xb1t2\xb3w1\xb4z\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x7f\xb3x}\xb2u|\xb1s'
+    b'z\xb0px\xafnv\xaelu\xaeks\xadiq\xadho\xacfl\xace'
+    b'j\xacdh\xabcf\xabbc\xabba\xaba_\xaba\\\xabaZ\xaba'
+    b'X\xabaU\xabaS\xabaQ\xabbN\xabbL\xabcJ\xacdH\xace'
+    b'E\xacfC\xadhA\xadi?\xaek>\xael<\xafn:\xb0p8\xb1s'
+    b'7\xb2u5\xb3x\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff|\xb3y{\xb2vy\xb1t'
+    b'w\xb1ru\xb0pt\xafnr\xaelp\xaekn\xaejl\xadhj\xadg'
+    b'g\xacfe\xacfc\xacea\xace_\xacd\\\xacdZ\xacdX\xacd'
+    b'U\xacdS\xaceQ\xaceO\xacfM\xacfJ\xadgH\xadhF\xaej'
+    b'D\xaekB\xael@\xafn?\xb0p=\xb1r;\xb1t9\xb2v8\xb3y'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xffz\xb4zx\xb3xv\xb2v'
+    b'u\xb1ts\xb0rq\xb0po\xafom\xafmk\xaeli\xaekg\xaej'
+    b'e\xadic\xadia\xadh^\xadh\\\xadhZ\xadhX\xadhV\xadh'
+    b'S\xadhQ\xadiO\xadiM\xaejK\xaekI\xaelG\xafmE\xafo'
+    b'C\xb0pA\xb0r?\xb1t>\xb2v<\xb3x:\xb4z\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xffu\xb4zt\xb3x'
+    b'r\xb2vp\xb1tn\xb1sl\xb0qk\xb0pi\xafog\xafnd\xafm'
+    b'b\xael`\xael^\xael\\\xaekZ\xaekX\xaekV\xaelT\xael'
+    b'R\xaelP\xafmM\xafnK\xafoI\xb0pH\xb0qF\xb1sD\xb1t'
+    b'B\xb2v@\xb3x?\xb4z\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xffq\xb4z'
+    b'o\xb3xn\xb2wl\xb2uj\xb1th\xb1sf\xb0rd\xb0qb\xb0p'
+    b'`\xb0p^\xb0o\\\xb0oZ\xafoX\xb0oV\xb0oT\xb0pR\xb0p'
+    b'P\xb0qN\xb0rL\xb1sJ\xb1tH\xb2uF\xb2wE\xb3xC\xb4z'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xffk\xb4zi\xb3xh\xb3wf\xb2vd\xb2ub\xb2u`\xb1t'
+    b'^\xb1t\\\xb1sZ\xb1sX\xb1sV\xb1tT\xb1tR\xb2uP\xb2u'
+    b'N\xb2vL\xb3wK\xb3xI\xb4z\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xffc\xb4zb\xb3y`\xb3y^\xb3x'
+    b'\\\xb3xZ\xb3xX\xb3xV\xb3xT\xb3yR\xb3yQ\xb4z\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+)
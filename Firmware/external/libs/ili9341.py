@@ -1,6 +1,42 @@
 import machine
 import ustruct
 import time
+from array import array
+
+# Viper glyph and asset kernels (kernels.py, when kernels.ENABLED), or None to use the Python loops
+try:
+    import kernels
+    if not kernels.ENABLED:
+        raise ImportError("kernels disabled")
+    from kernels import glyph_rgb565, rle_rgb565_row
+except (ImportError, SyntaxError, ValueError):
+    glyph_rgb565 = None
+    rle_rgb565_row = None
+
+def asset_runs(data, i, x0, x1):
+    """
+    Decode the runs of one asset row that fall inside [x0, x1).
+    
+    Args:
+        data: Asset run data
+        i: Offset of the row in data
+        x0, x1: Column range to keep
+    
+    Yields:
+        (start, end, palette index) of each clipped run
+    """
+    x = 0
+    while x < x1:
+        c = data[i]
+        i += 1
+        n = (c & 0x0F) + 1
+        if n == 16:
+            n += data[i]
+            i += 1
+        end = x + n
+        if end > x0:
+            yield max(x, x0), min(end, x1), c >> 4
+        x = end
 
 class ILI9341:
     """
@@ -9,13 +45,19 @@ class ILI9341:
     Features:
     - Hardware SPI communication
     - Configurable display orientation
-    - Text rendering with built-in font
-    - Basic shapes (pixels, rectangles)
+    - Text rendering with built-in font (glyphs rasterized into one
+      RGB565 buffer and kept in a bounded LRU cache)
+    - Basic shapes (pixels, rectangles), with rectangle fills streamed
+      from a reusable chunk buffer inside a single CS-framed transfer
+    - Compressed screen assets (see build_assets.py) decoded row by row
+      into the same chunk buffer while they are streamed
     - Display initialization and control
     
     Constants:
     FONT_WIDTH : Width of built-in font characters (5 pixels)
     FONT_HEIGHT: Height of built-in font characters (8 pixels)
+    GLYPH_CACHE_BYTES: Default memory budget of the glyph cache
+    CHUNK_SIZE : Default size of the fill buffer in bytes
     
     Memory Access Control Flags:
     MADCTL_MY : Row address order (bottom to top)
@@ -36,6 +78,8 @@ class ILI9341:
     # Constants
     FONT_WIDTH = 5
     FONT_HEIGHT = 8
+    GLYPH_CACHE_BYTES = 8192
+    CHUNK_SIZE = 1024
     
     # Memory Access Control Flags
     MADCTL_MY   = 0x80  # Row Address Order
@@ -53,7 +97,8 @@ class ILI9341:
         'LANDSCAPE_INV': MADCTL_MV | MADCTL_MY | MADCTL_BGR
     }
 
-    def __init__(self, spi, dc, cs, WIDTH=320, HEIGHT=240, rst=None):
+    def __init__(self, spi, dc, cs, WIDTH=320, HEIGHT=240, rst=None,
+                 glyph_cache_bytes=GLYPH_CACHE_BYTES, chunk_size=CHUNK_SIZE):
         """
         Initialize ILI9341 display controller.
         
@@ -70,6 +115,10 @@ class ILI9341:
             WIDTH: Display width in pixels (default 320)
             HEIGHT: Display height in pixels (default 240)
             rst: Optional Reset pin
+            glyph_cache_bytes: Memory budget for cached glyph bitmaps
+                               (0 disables the cache)
+            chunk_size: Bytes per SPI write when filling rectangles
+                        (rounded down to a whole number of pixels)
         """
         self.spi = spi
         self.dc = dc
@@ -90,6 +139,23 @@ class ILI9341:
         self._color_mode = 0x55  # 16-bit color (0x55 = RGB565)
         self._debug = False
         
+        # Glyph cache: (code, fg, bg, scale) -> RGB565 bitmap, LRU ordered
+        self._glyph_cache = {}
+        self._glyph_lru = []
+        self._glyph_cache_bytes = 0
+        self._glyph_cache_limit = glyph_cache_bytes
+        
+        # Preallocated transfer buffers (no allocation on the draw path)
+        self._cmd_buf = bytearray(1)
+        self._window_buf = bytearray(4)
+        self._pixel_buf = bytearray(2)
+        self._chunk = bytearray(max(2, chunk_size & ~1))
+        self._chunk_mv = memoryview(self._chunk)
+        self._chunk_color = None
+        # Asset palette (byte-swapped RGB565) and kernel parameters
+        self._asset_pal = array('H', bytes(32))
+        self._asset_params = array('i', [0, 0, 0, 0])
+        
         # Initialize hardware
         self._init_pins()
         self._init_display()
@@ -139,9 +205,10 @@ class ILI9341:
     def _write_cmd(self, cmd):
         """Send command byte to display controller"""
         if self._debug: print(f"CMD: 0x{cmd:02X}")
+        self._cmd_buf[0] = cmd
         self.dc(0)  # Command mode
         self.cs(0)  # Select device
-        self.spi.write(bytearray([cmd]))
+        self.spi.write(self._cmd_buf)
         self.cs(1)  # Deselect device
 
     def _write_data(self, data):
@@ -169,12 +236,15 @@ class ILI9341:
             h: Window height in pixels
         """
         # Column address set
+        buf = self._window_buf
         self._write_cmd(0x2A)  # CASET
-        self._write_data(ustruct.pack(">HH", x, x + w - 1))
+        ustruct.pack_into(">HH", buf, 0, x, x + w - 1)
+        self._write_data(buf)
         
         # Row address set
         self._write_cmd(0x2B)  # RASET
-        self._write_data(ustruct.pack(">HH", y, y + h - 1))
+        ustruct.pack_into(">HH", buf, 0, y, y + h - 1)
+        self._write_data(buf)
         
         # Prepare for memory write
         self._write_cmd(0x2C)  # RAMWR
@@ -186,13 +256,31 @@ class ILI9341:
     def pixel(self, x, y, color):
         """Draw a single pixel at specified coordinates"""
         self.set_window(x, y, 1, 1)
-        self._write_data(ustruct.pack(">H", color))
+        ustruct.pack_into(">H", self._pixel_buf, 0, color)
+        self._write_data(self._pixel_buf)
+
+    def _fill_chunk(self, color):
+        """Refill the chunk buffer with a color, only if it changed"""
+        if color == self._chunk_color:
+            return
+        mv = self._chunk_mv
+        size = len(mv)
+        mv[0] = (color >> 8) & 0xFF
+        mv[1] = color & 0xFF
+        # Double the filled prefix until the buffer is full
+        n = 2
+        while n < size:
+            step = min(n, size - n)
+            mv[n:n + step] = mv[0:step]
+            n += step
+        self._chunk_color = color
 
     def fill_rect(self, x, y, w, h, color):
         """
         Draw a filled rectangle with specified color.
         
-        Optimized for large areas by sending data in chunks.
+        Streams the preallocated chunk buffer while CS is held low for the
+        whole window, so a full-screen fill is a single transfer.
         
         Args:
             x: Top-left X coordinate
@@ -201,29 +289,198 @@ class ILI9341:
             h: Rectangle height
             color: RGB565 color value
         """
-        self.set_window(x, y, w, h)
-        color_bytes = ustruct.pack(">H", color)
         pixel_count = w * h
+        if pixel_count <= 0:
+            return
+        self.set_window(x, y, w, h)
+        self._fill_chunk(color)
         
-        # Optimized block write parameters
-        chunk_size = 512  # Bytes per transmission
-        pixels_per_chunk = chunk_size // 2  # 2 bytes per pixel
-        full_chunks = pixel_count // pixels_per_chunk
-        remaining = pixel_count % pixels_per_chunk
+        chunk = self._chunk
+        full_chunks, remaining = divmod(pixel_count * 2, len(chunk))
+        if self._debug: print(f"FILL: {pixel_count} px")
         
-        # Send full chunks
-        chunk_data = color_bytes * pixels_per_chunk
+        self.dc(1)  # Data mode
+        self.cs(0)  # Select device for the whole window
         for _ in range(full_chunks):
-            self._write_data(chunk_data)
-        
-        # Send remaining pixels
+            self.spi.write(chunk)
         if remaining:
-            self._write_data(color_bytes * remaining)
+            self.spi.write(self._chunk_mv[:remaining])
+        self.cs(1)  # Deselect device
+
+    def blit_buffer(self, buf, x, y, w, h):
+        """
+        Copy a prebuilt RGB565 (big-endian) buffer to a window.
+        
+        Args:
+            buf: Buffer holding w * h pixels, row-major
+            x: Top-left X coordinate
+            y: Top-left Y coordinate
+            w: Buffer width in pixels
+            h: Buffer height in pixels
+        """
+        self.set_window(x, y, w, h)
+        self._write_data(buf)
+
+    def blit_asset(self, asset, x, y, palette=None, area=None):
+        """
+        Stream a compressed asset, or part of it, to a window.
+        
+        Rows are decoded into the chunk buffer (several rows per write
+        when they fit) inside a single CS-framed transfer, so the memory
+        used does not depend on the asset size.
+        
+        Args:
+            asset: (width, height, palette, rows, data) tuple, as written
+                   by build_assets.py
+            x: Destination top-left X coordinate
+            y: Destination top-left Y coordinate
+            palette: Colors replacing the asset palette, index by index
+                     (default: the asset's own colors)
+            area: (x, y, w, h) part of the asset to send (default: all)
+        """
+        width, height, colors, rows, data = asset
+        sx, sy, w, h = area if area else (0, 0, width, height)
+        if w <= 0 or h <= 0:
+            return
+        if palette:
+            colors = palette
+        pal = self._asset_pal
+        for i in range(len(colors)):
+            c = colors[i]
+            pal[i] = ((c & 0xFF) << 8) | ((c >> 8) & 0xFF)
+        
+        chunk = self._chunk
+        self._chunk_color = None  # The chunk no longer holds a fill color
+        per = len(chunk) >> 1
+        seg = w if w < per else per
+        # Whole rows per write, or one segment of a row if it does not fit
+        rows_per = per // seg if seg == w else 1
+        params = self._asset_params
+        
+        self.set_window(x, y, w, h)
+        self.dc(1)  # Data mode
+        self.cs(0)  # Select device for the whole window
+        row = sy
+        end = sy + h
+        while row < end:
+            n = min(rows_per, end - row)
+            x0 = sx
+            while x0 < sx + w:
+                x1 = min(x0 + seg, sx + w)
+                j = 0
+                for r in range(row, row + n):
+                    off = rows[2 * r] | (rows[2 * r + 1] << 8)
+                    if rle_rgb565_row is not None:
+                        params[0] = off
+                        params[1] = x0
+                        params[2] = x1
+                        params[3] = j
+                        rle_rgb565_row(data, chunk, pal, params)
+                        j += x1 - x0
+                    else:
+                        k = j << 1
+                        for a, b, idx in asset_runs(data, off, x0, x1):
+                            c = pal[idx]
+                            lo, hi = (c >> 8) & 0xFF, c & 0xFF
+                            for _ in range(a, b):
+                                chunk[k] = hi
+                                chunk[k + 1] = lo
+                                k += 2
+                        j += x1 - x0
+                self.spi.write(self._chunk_mv[:j << 1])
+                x0 = x1
+            row += n
+        self.cs(1)  # Deselect device
+
+    def clear_glyph_cache(self):
+        """Drop every cached glyph bitmap"""
+        self._glyph_cache = {}
+        self._glyph_lru = []
+        self._glyph_cache_bytes = 0
+
+    def _rasterize_glyph(self, code, fg, bg, scale):
+        """
+        Expand one font character into an RGB565 bitmap.
+        
+        Args:
+            code: ASCII code (32-126)
+            fg: Foreground color
+            bg: Background color
+            scale: Scaling factor
+            
+        Returns:
+            bytearray with (5 * scale) x (8 * scale) pixels, row-major
+        """
+        font = self.DEFAULT_FONT
+        start = (code - 32) * 5
+        if glyph_rgb565 is not None:
+            buf = bytearray(5 * scale * 2 * 8 * scale)
+            glyph_rgb565(font, buf, (start << 8) | scale, (fg << 16) | bg)
+            return buf
+        
+        fg_hi, fg_lo = (fg >> 8) & 0xFF, fg & 0xFF
+        bg_hi, bg_lo = (bg >> 8) & 0xFF, bg & 0xFF
+        row_bytes = 5 * scale * 2
+        buf = bytearray(row_bytes * 8 * scale)
+        
+        i = 0
+        for row_idx in range(8):
+            shift = 7 - row_idx
+            row_start = i
+            # Build one scaled row
+            for col_idx in range(5):
+                if (font[start + col_idx] >> shift) & 0x01:
+                    hi, lo = fg_hi, fg_lo
+                else:
+                    hi, lo = bg_hi, bg_lo
+                for _ in range(scale):
+                    buf[i] = hi
+                    buf[i + 1] = lo
+                    i += 2
+            # Repeat it for the remaining scaled lines
+            for _ in range(scale - 1):
+                buf[i:i + row_bytes] = buf[row_start:row_start + row_bytes]
+                i += row_bytes
+        
+        return buf
+
+    def _glyph(self, code, fg, bg, scale):
+        """
+        Return the bitmap of a character, using the LRU glyph cache.
+        
+        Glyphs larger than the whole cache budget are rasterized but not
+        stored.
+        """
+        key = (code, fg, bg, scale)
+        lru = self._glyph_lru
+        buf = self._glyph_cache.get(key)
+        if buf is not None:
+            if lru[-1] != key:
+                lru.remove(key)
+                lru.append(key)
+            return buf
+        
+        buf = self._rasterize_glyph(code, fg, bg, scale)
+        size = len(buf)
+        if size > self._glyph_cache_limit:
+            return buf
+        
+        # Evict least recently used glyphs until the new one fits
+        while self._glyph_cache_bytes + size > self._glyph_cache_limit:
+            old = lru.pop(0)
+            self._glyph_cache_bytes -= len(self._glyph_cache.pop(old))
+        self._glyph_cache[key] = buf
+        self._glyph_cache_bytes += size
+        lru.append(key)
+        return buf
 
     def draw_char(self, x, y, char, fg_color=None, bg_color=None, scale=None):
         """
         Render a single character using built-in font.
         
+        The glyph is expanded into a single RGB565 buffer (cached by
+        character, colors and scale) and sent with one window write.
+        
         Args:
             x: Top-left X coordinate
             y: Top-left Y coordinate
@@ -244,32 +501,10 @@ class ILI9341:
         if code < 32 or code > 126:
             code = 32  # Replace unsupported with space
         
-        # Calculate font data position
-        start_index = (code - 32) * 5
-        font_data = self.DEFAULT_FONT[start_index:start_index+5]
-        
         char_width = 5 * scale
         char_height = 8 * scale
         
-        # Render character
-        for col_idx in range(5):
-            byte = font_data[col_idx]
-            
-            for row_idx in range(8):
-                pixel_on = (byte >> (7 - row_idx)) & 0x01
-                color = fg if pixel_on else bg
-                
-                # Draw scaled pixel
-                if scale == 1:
-                    self.pixel(x + col_idx, y + row_idx, color)
-                else:
-                    self.fill_rect(
-                        x + col_idx * scale,
-                        y + row_idx * scale,
-                        scale,
-                        scale,
-                        color
-                    )
+        self.blit_buffer(self._glyph(code, fg, bg, scale), x, y, char_width, char_height)
         
         return char_width, char_height
 
@@ -0,0 +1,236 @@
+"""
+Viper Kernels for the Display and Touch Drivers
+
+Machine-code versions of the inner loops of ili9341.py, canvas.py and
+tsc2046.py. Each driver imports them inside a try block and keeps its
+pure-Python loop as the fallback, used when this module is missing or
+cannot be loaded (firmware built without the native emitter, .mpy for
+another architecture).
+
+Viper functions take at most four arguments, so offsets and sizes are
+packed into small integers or a parameter array.
+
+Kernels:
+- glyph_rgb565: expand a 5x8 font character into a scaled RGB565 bitmap
+- expand_gs4_rows: expand GS4 canvas rows into RGB565 through a LUT
+- tsc_medians: decode a TSC2046 burst and take the median of each axis
+- rle_rgb565_row / rle_gs4_row: decode one row of a compressed screen
+  asset (format in build_assets.py) into RGB565 or into the GS4 canvas
+- rle_cover_row: mark the canvas palette indices of one asset row in the
+  canvas coverage tiles
+
+The drivers only use these kernels when ENABLED is True. It stays False
+until pico_bench.py shows them faster than the Python loops on the
+board: on the host they run slower, and no board timings exist yet.
+"""
+
+import micropython
+
+# Checked by the drivers when they are imported (pico_bench.py measures both paths either way)
+ENABLED = False
+
+
+@micropython.viper
+def glyph_rgb565(font: ptr8, buf: ptr16, start_scale: int, colors: int):
+    """
+    Args:
+        font: Column-major font table (bit 7 on the first row, as drawn by ili9341.py)
+        buf: Output, (5 * scale) x (8 * scale) big-endian RGB565 pixels
+        start_scale: (offset of the character in font << 8) | scale
+        colors: (foreground << 16) | background
+    """
+    start = start_scale >> 8
+    scale = start_scale & 0xFF
+    fg = (colors >> 16) & 0xFFFF
+    bg = colors & 0xFFFF
+    # The buffer is little-endian 16-bit: store the colors byte-swapped
+    fg = ((fg & 0xFF) << 8) | (fg >> 8)
+    bg = ((bg & 0xFF) << 8) | (bg >> 8)
+    width = 5 * scale
+    i = 0
+    row = 0
+    while row < 8:
+        shift = 7 - row
+        line = i
+        col = 0
+        while col < 5:
+            c = fg if (font[start + col] >> shift) & 1 else bg
+            k = 0
+            while k < scale:
+                buf[i] = c
+                i += 1
+                k += 1
+            col += 1
+        # Repeat the row for the remaining scaled lines
+        rep = 1
+        while rep < scale:
+            k = 0
+            while k < width:
+                buf[i] = buf[line + k]
+                i += 1
+                k += 1
+            rep += 1
+        row += 1
+
+
+@micropython.viper
+def expand_gs4_rows(src: ptr8, dst: ptr32, lut: ptr32, params: ptr32):
+    """
+    Args:
+        src: GS4_HMSB buffer
+        dst: Output, 4 RGB565 bytes per source byte, rows back to back
+        lut: Byte -> 4 RGB565 bytes table, read as 32-bit words
+        params: [first source byte, bytes per row, source stride, rows]
+    """
+    off = params[0]
+    count = params[1]
+    stride = params[2]
+    rows = params[3]
+    j = 0
+    r = 0
+    while r < rows:
+        i = off
+        end = off + count
+        while i < end:
+            dst[j] = lut[src[i]]
+            i += 1
+            j += 1
+        off += stride
+        r += 1
+
+
+@micropython.viper
+def tsc_medians(rx: ptr8, samples: int, out: ptr16):
+    """
+    Args:
+        rx: Burst reply, 9 bytes (X, Y, Z commands) per sample
+        samples: Number of samples (odd)
+        out: Output, out[0..2] = medians of X, Y, Z; out[3..] is scratch
+             for the samples
+    """
+    axis = 0
+    while axis < 3:
+        # Decode the 12-bit values of this axis and insertion-sort them
+        n = 0
+        i = 3 * axis
+        while n < samples:
+            v = ((rx[i + 1] << 4) | (rx[i + 2] >> 4)) & 0xFFF
+            k = n
+            while k > 0 and out[3 + k - 1] > v:
+                out[3 + k] = out[3 + k - 1]
+                k -= 1
+            out[3 + k] = v
+            n += 1
+            i += 9
+        out[axis] = out[3 + (samples >> 1)]
+        axis += 1
+
+
+@micropython.viper
+def rle_rgb565_row(data: ptr8, dst: ptr16, pal: ptr16, params: ptr32):
+    """
+    Args:
+        data: Asset run data
+        dst: Output, big-endian RGB565 pixels
+        pal: Asset palette index -> byte-swapped RGB565 color
+        params: [offset of the row in data, first column, end column,
+                 first output pixel]
+    """
+    i = params[0]
+    x0 = params[1]
+    x1 = params[2]
+    j = params[3]
+    x = 0
+    while x < x1:
+        c = data[i]
+        i += 1
+        n = (c & 0x0F) + 1
+        if n == 16:
+            n += data[i]
+            i += 1
+        end = x + n
+        if end > x0:
+            a = x if x > x0 else x0
+            b = end if end < x1 else x1
+            color = pal[c >> 4]
+            while a < b:
+                dst[j] = color
+                j += 1
+                a += 1
+        x = end
+
+
+@micropython.viper
+def rle_gs4_row(data: ptr8, dst: ptr8, lut: ptr8, params: ptr32):
+    """
+    Args:
+        data: Asset run data
+        dst: GS4_HMSB buffer (even pixels in the high nibble)
+        lut: Asset palette index -> canvas palette index
+        params: [offset of the row in data, first column, end column,
+                 first output pixel (y * 2 * stride + x)]
+    """
+    i = params[0]
+    x0 = params[1]
+    x1 = params[2]
+    p = params[3]
+    x = 0
+    while x < x1:
+        c = data[i]
+        i += 1
+        n = (c & 0x0F) + 1
+        if n == 16:
+            n += data[i]
+            i += 1
+        end = x + n
+        if end > x0:
+            a = x if x > x0 else x0
+            b = end if end < x1 else x1
+            v = lut[c >> 4]
+            while a < b:
+                k = p >> 1
+                if p & 1:
+                    dst[k] = (dst[k] & 0xF0) | v
+                else:
+                    dst[k] = (dst[k] & 0x0F) | (v << 4)
+                p += 1
+                a += 1
+        x = end
+
+
+@micropython.viper
+def rle_cover_row(data: ptr8, cover: ptr16, lut: ptr8, params: ptr32):
+    """
+    Args:
+        data: Asset run data
+        cover: Canvas coverage, one bitmask of palette indices per tile
+        lut: Asset palette index -> canvas palette index
+        params: [offset of the row in data, first column, end column,
+                 (unused), destination X minus first column,
+                 first tile of the destination tile row, log2 of the tile size]
+    """
+    i = params[0]
+    x0 = params[1]
+    x1 = params[2]
+    dx = params[4]
+    base = params[5]
+    shift = params[6]
+    x = 0
+    while x < x1:
+        c = data[i]
+        i += 1
+        n = (c & 0x0F) + 1
+        if n == 16:
+            n += data[i]
+            i += 1
+        end = x + n
+        if end > x0:
+            a = x if x > x0 else x0
+            b = end if end < x1 else x1
+            bit = 1 << lut[c >> 4]
+            t = base + ((dx + a) >> shift)
+            last = base + ((dx + b - 1) >> shift)
+            while t <= last:
+                cover[t] = cover[t] | bit
+                t += 1
+        x = end
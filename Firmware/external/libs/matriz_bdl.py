@@ -5,7 +5,6 @@ from machine import Pin
 # Configuração inicial
 NUM_LEDS = 25 # define que é uma matriz com 25 LEDs
 ledsPIN = 7
-np = neopixel.NeoPixel(Pin(ledsPIN), NUM_LEDS)
 
 #define a posição dos LEDs na matriz da BotDogLab
 LED_MATRIX = [
@@ -16,16 +15,118 @@ LED_MATRIX = [
     [4, 3, 2, 1, 0]
 ]
 
+APAGADO = (0, 0, 0)
+
+# Sprites: máscara de 25 bits em que o bit i acende o LED i da fita. As coordenadas (x, y), com y = 0 embaixo, são
+# convertidas pela LED_MATRIX uma única vez, quando o sprite é criado
+def sprite(posicoes):
+    mascara = 0
+    for x, y in posicoes:
+        mascara |= 1 << LED_MATRIX[4-y][x]
+    return mascara
+
+TUDO = (1 << NUM_LEDS) - 1
+CORACAO = sprite([(2, 0), (1, 1), (2, 1), (3, 1), (0, 2), (1, 2), (2, 2), (3, 2), (4, 2), (0, 3), (1, 3), (2, 3), (3, 3), (4, 3), (1, 4), (3, 4)])
+CORACAO_PEQUENO = sprite([(2, 1), (1, 2), (2, 2), (3, 2), (1, 3), (3, 3)])
+SORRISO = sprite([(1, 0), (2, 0), (3, 0), (0, 1), (4, 1), (1, 3), (3, 3)])
+TRISTE = sprite([(0, 0), (4, 0), (1, 1), (2, 1), (3, 1), (1, 3), (3, 3)])
+X_GRANDE = sprite([(0, 0), (4, 0), (1, 1), (3, 1), (2, 2), (1, 3), (3, 3), (0, 4), (4, 4)])
+X_PEQUENO = sprite([(1, 1), (3, 1), (2, 2), (1, 3), (3, 3)])
+GIRAFA = sprite([(1, 0), (3, 0), (1, 1), (2, 1), (3, 1), (1, 2), (1, 3), (0, 4), (1, 4)])
+
+# Matriz com buffer de quadro: pixel(), fill() e sprite() só alteram o buffer do NeoPixel; show() envia o quadro
+# inteiro numa única escrita (e nenhuma se nada mudou desde o último show())
+class Matriz:
+    def __init__(self, pino=ledsPIN):
+        self.np = neopixel.NeoPixel(Pin(pino), NUM_LEDS)
+        self._alterada = True
+
+    def pixel(self, x, y, cor):
+        if 0 <= x <= 4 and 0 <= y <= 4: # verifica se os valores de x e y estão dentro do range
+            self.np[LED_MATRIX[4-y][x]] = cor
+            self._alterada = True
+        else:
+            print("Invalid coordinates.")
+
+    def fill(self, cor=APAGADO):
+        self.np.fill(cor)
+        self._alterada = True
+
+    # Acende com a cor os LEDs da máscara; os demais ficam como estão
+    def sprite(self, mascara, cor):
+        np = self.np
+        i = 0
+        while mascara:
+            if mascara & 1:
+                np[i] = cor
+            mascara >>= 1
+            i += 1
+        self._alterada = True
+
+    def show(self):
+        if self._alterada:
+            self.np.write()
+            self._alterada = False
+
+# Player de animações para o uasyncio: cada quadro é (máscara, cor, duração em ms) e é desenhado sobre a matriz
+# apagada. tocar() troca a animação na hora, sem esperar o quadro atual terminar. Um quadro com duração 0 fica na tela
+# até a próxima animação. Uso: asyncio.create_task(animador.tarefa())
+class Animador:
+    def __init__(self, matriz):
+        import uasyncio as asyncio
+        self.matriz = matriz
+        self._quadros = ()
+        self._repetir = False
+        self._nova = asyncio.Event()
+
+    def tocar(self, quadros, repetir=True):
+        self._quadros = quadros
+        self._repetir = repetir
+        self._nova.set()
+
+    def apagar(self):
+        self.tocar(((0, APAGADO, 0),), repetir=False)
+
+    async def tarefa(self):
+        import uasyncio as asyncio
+        matriz = self.matriz
+        nova = self._nova
+        while True:
+            nova.clear()
+            quadros = self._quadros
+            interrompida = False
+            for mascara, cor, ms in quadros:
+                matriz.fill()
+                matriz.sprite(mascara, cor)
+                matriz.show()
+                if ms <= 0:
+                    await nova.wait()
+                    interrompida = True
+                    break
+                try:
+                    await asyncio.wait_for_ms(nova.wait(), ms)
+                    interrompida = True
+                    break
+                except asyncio.TimeoutError:
+                    pass
+            if not interrompida and not (self._repetir and quadros):
+                await nova.wait()
+
+# Matriz usada pelas funções abaixo, criada no primeiro uso (importar o módulo não mexe nos LEDs)
+_matriz = None
+
+def matriz():
+    global _matriz
+    if _matriz is None:
+        _matriz = Matriz()
+    return _matriz
+
 def leds(ledsx, ledsy, ledsr=10, ledsg=10, ledsb=10):
     # os valores r=g=b=10 são assumidos por padrão se não forem atribuidos
-    
-    if 0 <= ledsx <= 4 and 0 <= ledsy <= 4: # verifica se os valores de x e y estão den6tro do range
-        led_index = LED_MATRIX[4-ledsy][ledsx]
-        np[led_index] = (ledsr, ledsg, ledsb)
-        np.write()
-    else:
-        print("Invalid coordinates.")
-        
+    m = matriz()
+    m.pixel(ledsx, ledsy, (ledsr, ledsg, ledsb))
+    m.show()
+
 # Examplo de uso
 
 #leds(2, 2)
@@ -34,51 +135,41 @@ def leds(ledsx, ledsy, ledsr=10, ledsg=10, ledsb=10):
 #FIM leds
 
 def apaga(r=0, g=0, b=0):
-    # apaga a matriz de LEDs
-    posicao_x_y_LED_aceso = [(0, 0), (1, 0), (2, 0), (3, 0), (4, 0), (0, 1), (1, 1), (2, 1), (3, 1), (4, 1), (0, 2), (1, 2), (2, 2), (3, 2), (4, 2), (0, 3), (1, 3), (2, 3), (3, 3), (4, 3), (0, 4), (1, 4), (2, 4), (3, 4), (4, 4)]
-    for x, y in posicao_x_y_LED_aceso:
-         leds(x, y, r, g, b)  # Acende os LEDs nas posições especificadas com as cores fornecidas   
+    # apaga a matriz de LEDs (uma única escrita na fita)
+    m = matriz()
+    m.fill((r, g, b))
+    m.show()
 
+def desenha(mascara, r, g, b):
+    # Acende os LEDs do sprite com as cores fornecidas
+    m = matriz()
+    m.sprite(mascara, (r, g, b))
+    m.show()
 
 def coracao(r=25, g=0, b=0):
-    posicao_x_y_LED_aceso = [(2, 0), (1, 1), (2, 1), (3, 1), (0, 2), (1, 2), (2, 2), (3, 2), (4, 2), (0, 3), (1, 3), (2, 3), (3, 3), (4, 3), (1, 4), (3, 4)]
-    for x, y in posicao_x_y_LED_aceso:
-         leds(x, y, r, g, b)  # Acende os LEDs nas posições especificadas com as cores fornecidas     
-#         bdl.leds(x, y, r, g, b)  # Acende os LEDs nas posições especificadas com as cores fornecidas
+    desenha(CORACAO, r, g, b)
 
 def coracao_pequeno(r=25, g=0, b=0):
-    posicao_x_y_LED_aceso = [(2, 1), (1, 2), (2, 2), (3, 2), (1, 3), (3, 3)]
-    for x, y in posicao_x_y_LED_aceso:
-         leds(x, y, r, g, b)  # Acende os LEDs nas posições especificadas com as cores fornecidas
-         
+    desenha(CORACAO_PEQUENO, r, g, b)
+
 def sorriso(r=0, g=0, b=25):
-    posicao_x_y_LED_aceso = [(1, 0), (2, 0), (3, 0), (0, 1), (4, 1), (1, 3), (3, 3)]
-    for x, y in posicao_x_y_LED_aceso:
-         leds(x, y, r, g, b)  # Acende os LEDs nas posições especificadas com as cores fornecidas       
+    desenha(SORRISO, r, g, b)
 
 def triste(r=0, g=25, b=25):
-    posicao_x_y_LED_aceso =  [(0, 0), (4, 0), (1, 1), (2, 1), (3, 1), (1, 3), (3, 3)]
-    for x, y in posicao_x_y_LED_aceso:
-         leds(x, y, r, g, b)  # Acende os LEDs nas posições especificadas com as cores fornecidas
+    desenha(TRISTE, r, g, b)
 
 def X(r=0, g=25, b=25):
-    posicao_x_y_LED_aceso =  [(0, 0), (4, 0), (1, 1), (3, 1), (2, 2), (1, 3), (3, 3), (0, 4), (4, 4)]
-    for x, y in posicao_x_y_LED_aceso:
-         leds(x, y, r, g, b)  # Acende os LEDs nas posições especificadas com as cores fornecidas
+    desenha(X_GRANDE, r, g, b)
 
 def x(r=0, g=25, b=25):
-    posicao_x_y_LED_aceso =  [(1, 1), (3, 1), (2, 2), (1, 3), (3, 3)]
-    for x, y in posicao_x_y_LED_aceso:
-         leds(x, y, r, g, b)  # Acende os LEDs nas posições especificadas com as cores fornecidas
+    desenha(X_PEQUENO, r, g, b)
 
-def girafa(r=20, g=20, b=0): 
-    posicao_x_y_LED_aceso =  [(1, 0), (3, 0), (1, 1), (2, 1), (3, 1), (1, 2), (1, 3), (0, 4), (1, 4)]
-    for x, y in posicao_x_y_LED_aceso:
-         leds(x, y, r, g, b)  # Acende os LEDs nas posições especificadas com as cores fornecidas
+def girafa(r=20, g=20, b=0):
+    desenha(GIRAFA, r, g, b)
 
 
 # Exemplo de uso
-#sorriso()  # Acende o coração com as cores padrão (r=25, g=0, b=0)
-apaga()  # Acende o coração na cor branca
+#sorriso()  # Acende o sorriso com as cores padrão (r=0, g=0, b=25)
+#apaga()    # Apaga a matriz
 
 #FIM coracao
@@ -0,0 +1,113 @@
+"""
+Background Sensor Sampler
+
+Features:
+- One uasyncio task per source, each with its own refresh period
+- Sources are coroutine functions (e.g. BH1750.measurement_async,
+  AHT10.measure_async), so conversions never block the event loop
+- Latest value and its time.ticks_ms timestamp kept in a cache: readers
+  get them instantly, without touching the bus
+- A failed read (OSError from the I2C bus, or any other exception, such
+  as a bad frame failing to decode) keeps the previous value and is
+  counted and recorded, the source keeps running
+
+Usage:
+    sampler = Sampler()
+    sampler.add('lux', bh1750.measurement_async, 1000)
+    sampler.add('ambient', aht.measure_async, 5000)
+    tasks = sampler.start()
+    ...
+    lux = sampler.get('lux')
+"""
+
+import time
+
+
+class Sampler:
+    """
+    Cache of periodically refreshed readings.
+
+    Attributes:
+        errors: Failed reads per source name
+        last_error: Exception of the latest failed read per source name
+    """
+
+    def __init__(self):
+        self._sources = {}
+        self.errors = {}
+        self.last_error = {}
+
+    def add(self, name, read, period_ms):
+        """
+        Register a source.
+
+        Args:
+            name: Key used by get()/reading()
+            read: Coroutine function returning the new value
+            period_ms: Time between the start of two reads
+        """
+        # [read, period, value, timestamp]
+        self._sources[name] = [read, period_ms, None, None]
+        self.errors[name] = 0
+        self.last_error[name] = None
+
+    def names(self):
+        return list(self._sources)
+
+    def get(self, name, default=None):
+        """Latest value of a source, or default if it was never read"""
+        source = self._sources.get(name)
+        if source is None or source[3] is None:
+            return default
+        return source[2]
+
+    def reading(self, name):
+        """
+        Latest value with its timestamp.
+
+        Returns:
+            (value, ticks_ms) or None if the source was never read
+        """
+        source = self._sources.get(name)
+        if source is None or source[3] is None:
+            return None
+        return source[2], source[3]
+
+    def age_ms(self, name):
+        """Milliseconds since the latest value, or None if never read"""
+        source = self._sources.get(name)
+        if source is None or source[3] is None:
+            return None
+        return time.ticks_diff(time.ticks_ms(), source[3])
+
+    def start(self):
+        """
+        Start one task per source.
+
+        Returns:
+            List of the created tasks (cancel them to stop sampling)
+        """
+        import uasyncio as asyncio
+        return [asyncio.create_task(self._run(name)) for name in self._sources]
+
+    async def refresh(self, name):
+        """Read a source now and update the cache; returns True on success"""
+        source = self._sources[name]
+        try:
+            value = await source[0]()
+        except Exception as e:
+            self.errors[name] += 1
+            self.last_error[name] = e
+            return False
+        source[2] = value
+        source[3] = time.ticks_ms()
+        return True
+
+    async def _run(self, name):
+        import uasyncio as asyncio
+        period = self._sources[name][1]
+        while True:
+            start = time.ticks_ms()
+            await self.refresh(name)
+            elapsed = time.ticks_diff(time.ticks_ms(), start)
+            await asyncio.sleep_ms(max(0, period - elapsed))
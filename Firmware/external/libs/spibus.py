@@ -0,0 +1,163 @@
+"""
+Shared SPI Bus Arbiter
+
+Features:
+- Owns the machine.SPI object shared by several devices (e.g. ILI9341
+  and TSC2046 on SPI0)
+- Each device registers its baudrate and mode and gets a proxy that
+  drivers use in place of machine.SPI
+- The bus is reconfigured (spi.init) only when the active device changes
+- asyncio lock to serialize multi-transfer sequences between tasks
+- Statistics per device: activations, bytes and bus time
+
+Usage:
+    bus = SPIBus(machine.SPI(0, sck=..., mosi=..., miso=...))
+    display = ILI9341(bus.device('lcd', 50_000_000), dc=..., cs=...)
+    touch = TSC2046(bus.device('touch', 1_000_000), cs=...)
+    async with bus.lock:
+        ...
+    print(bus.report())
+"""
+
+import time
+
+
+class SPIDevice:
+    """
+    Proxy for one device on a shared SPI bus.
+
+    Implements the machine.SPI transfer methods used by the drivers;
+    each call makes sure the bus is configured for this device first.
+
+    Attributes:
+        name: Device name used in reports
+        activations: Times the bus was reconfigured for this device
+        busy_us: Total time spent in transfers (microseconds)
+        nbytes: Total bytes transferred
+    """
+
+    def __init__(self, bus, name, baudrate, polarity=0, phase=0):
+        self.bus = bus
+        self.name = name
+        self.baudrate = baudrate
+        self.polarity = polarity
+        self.phase = phase
+        self.activations = 0
+        self.busy_us = 0
+        self.nbytes = 0
+
+    def _select(self):
+        """Configure the bus for this device if another one used it last"""
+        bus = self.bus
+        if bus._active is not self:
+            bus._activate(self)
+
+    def init(self, baudrate=None, polarity=None, phase=None):
+        """Change the preferred configuration (applied on next transfer)"""
+        if baudrate is not None:
+            self.baudrate = baudrate
+        if polarity is not None:
+            self.polarity = polarity
+        if phase is not None:
+            self.phase = phase
+        if self.bus._active is self:
+            self.bus._active = None
+
+    def write(self, buf):
+        """Write bytes (see machine.SPI.write)"""
+        self._select()
+        t0 = time.ticks_us()
+        self.bus.spi.write(buf)
+        self.busy_us += time.ticks_diff(time.ticks_us(), t0)
+        self.nbytes += len(buf)
+
+    def readinto(self, buf, write=0x00):
+        """Read into a buffer while sending a fixed byte (see machine.SPI.readinto)"""
+        self._select()
+        t0 = time.ticks_us()
+        self.bus.spi.readinto(buf, write)
+        self.busy_us += time.ticks_diff(time.ticks_us(), t0)
+        self.nbytes += len(buf)
+
+    def write_readinto(self, write_buf, read_buf):
+        """Full-duplex transfer (see machine.SPI.write_readinto)"""
+        self._select()
+        t0 = time.ticks_us()
+        self.bus.spi.write_readinto(write_buf, read_buf)
+        self.busy_us += time.ticks_diff(time.ticks_us(), t0)
+        self.nbytes += len(write_buf)
+
+
+class SPIBus:
+    """
+    Arbiter for a machine.SPI shared by several devices.
+
+    Attributes:
+        spi: The underlying machine.SPI
+        devices: Registered SPIDevice proxies
+        reconfigs: Total number of spi.init calls made
+    """
+
+    def __init__(self, spi):
+        """
+        Args:
+            spi: Initialized machine.SPI (pins already assigned)
+        """
+        self.spi = spi
+        self.devices = []
+        self.reconfigs = 0
+        self._active = None
+        self._lock = None
+
+    def device(self, name, baudrate, polarity=0, phase=0):
+        """
+        Register a device and return its proxy.
+
+        Args:
+            name: Name used in reports
+            baudrate: Preferred clock in Hz
+            polarity: Clock polarity (CPOL)
+            phase: Clock phase (CPHA)
+
+        Returns:
+            SPIDevice to pass to the driver as its SPI object
+        """
+        dev = SPIDevice(self, name, baudrate, polarity, phase)
+        self.devices.append(dev)
+        return dev
+
+    def _activate(self, dev):
+        """Reconfigure the bus for a device"""
+        self.spi.init(baudrate=dev.baudrate, polarity=dev.polarity, phase=dev.phase)
+        self._active = dev
+        self.reconfigs += 1
+        dev.activations += 1
+
+    @property
+    def lock(self):
+        """asyncio.Lock serializing bus users (created on first use)"""
+        if self._lock is None:
+            import uasyncio as asyncio
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    def reset_stats(self):
+        """Zero every counter"""
+        self.reconfigs = 0
+        for dev in self.devices:
+            dev.activations = 0
+            dev.busy_us = 0
+            dev.nbytes = 0
+
+    def report(self):
+        """
+        Format the bus statistics.
+
+        Returns:
+            Multi-line string with one line per device
+        """
+        lines = ["SPI: {} reconfig".format(self.reconfigs)]
+        for dev in self.devices:
+            lines.append("  {}: {} Hz, {} activations, {} B, {} us".format(
+                dev.name, dev.baudrate, dev.activations, dev.nbytes, dev.busy_us))
+        return "\n".join(lines)
@@ -33,6 +33,13 @@ class SSD1306(framebuf.FrameBuffer):
         self.pages = self.height // 8
         self.buffer = bytearray(self.pages * self.width)
         super().__init__(self.buffer, self.width, self.height, framebuf.MONO_VLSB)
+        # copy of what the display RAM holds, used by show() to send only what changed
+        self._sent = bytearray(len(self.buffer))
+        self._buf_mv = memoryview(self.buffer)
+        self._window = bytearray(6)
+        # first and last changed column of a page, filled by _changed_columns
+        self._cols = [0, 0]
+        self._full = True
         self.init_display()
 
     def init_display(self):
@@ -85,20 +92,82 @@ class SSD1306(framebuf.FrameBuffer):
     def invert(self, invert):
         self.write_cmd(SET_NORM_INV | (invert & 1))
 
-    def show(self):
-        x0 = 0
-        x1 = self.width - 1
+    def invalidate(self):
+        # next show() resends the whole frame (e.g. after the display lost its RAM)
+        self._full = True
+
+    def set_window(self, x0, x1, p0, p1):
         if self.width == 64:
             # displays with width of 64 pixels are shifted by 32
             x0 += 32
             x1 += 32
-        self.write_cmd(SET_COL_ADDR)
-        self.write_cmd(x0)
-        self.write_cmd(x1)
-        self.write_cmd(SET_PAGE_ADDR)
-        self.write_cmd(0)
-        self.write_cmd(self.pages - 1)
-        self.write_data(self.buffer)
+        w = self._window
+        w[0] = SET_COL_ADDR
+        w[1] = x0
+        w[2] = x1
+        w[3] = SET_PAGE_ADDR
+        w[4] = p0
+        w[5] = p1
+        self.write_cmds(w)
+
+    def _changed_columns(self, a, b):
+        # stores in self._cols the first and last column (relative to a) that differ from
+        # the sent copy; False if none does. Compared byte by byte in place, so checking
+        # the pages allocates nothing
+        buf = self.buffer
+        sent = self._sent
+        i = a
+        while i < b and buf[i] == sent[i]:
+            i += 1
+        if i == b:
+            return False
+        j = b - 1
+        while buf[j] == sent[j]:
+            j -= 1
+        self._cols[0] = i - a
+        self._cols[1] = j - a
+        return True
+
+    def show(self, full=False):
+        # Only pages that changed since the last show are sent, narrowed to the
+        # changed columns. Consecutive changed pages go in one window.
+        width = self.width
+        mv = self._buf_mv
+        if full or self._full:
+            self.set_window(0, width - 1, 0, self.pages - 1)
+            self.write_data(self.buffer)
+            self._sent[:] = self.buffer
+            self._full = False
+            return
+        buf = self.buffer
+        sent = self._sent
+        cols = self._cols
+        page = 0
+        while page < self.pages:
+            if not self._changed_columns(page * width, (page + 1) * width):
+                page += 1
+                continue
+            x0, x1 = cols
+            p0 = page
+            page += 1
+            while page < self.pages and self._changed_columns(page * width, (page + 1) * width):
+                x0 = min(x0, cols[0])
+                x1 = max(x1, cols[1])
+                page += 1
+            self.set_window(x0, x1, p0, page - 1)
+            rows = [mv[p * width + x0:p * width + x1 + 1] for p in range(p0, page)]
+            self.write_datav(rows)
+            for p in range(p0, page):
+                for i in range(p * width + x0, p * width + x1 + 1):
+                    sent[i] = buf[i]
+
+    def text_lines(self, lines, clear=True):
+        # draw several (text, x, y) lines and flush them together
+        if clear:
+            self.fill(0)
+        for s, x, y in lines:
+            self.text(s, x, y, 1)
+        self.show()
 
 
 class SSD1306_I2C(SSD1306):
@@ -107,6 +176,7 @@ class SSD1306_I2C(SSD1306):
         self.addr = addr
         self.temp = bytearray(2)
         self.write_list = [b"\x40", None]  # Co=0, D/C#=1
+        self.cmd_list = [b"\x00", None]  # Co=0, D/C#=0
         super().__init__(width, height, external_vcc)
 
     def write_cmd(self, cmd):
@@ -114,10 +184,18 @@ class SSD1306_I2C(SSD1306):
         self.temp[1] = cmd
         self.i2c.writeto(self.addr, self.temp)
 
+    def write_cmds(self, buf):
+        # several commands in one transfer
+        self.cmd_list[1] = buf
+        self.i2c.writevto(self.addr, self.cmd_list)
+
     def write_data(self, buf):
         self.write_list[1] = buf
         self.i2c.writevto(self.addr, self.write_list)
 
+    def write_datav(self, bufs):
+        self.i2c.writevto(self.addr, [b"\x40"] + bufs)
+
 
 class SSD1306_SPI(SSD1306):
     def __init__(self, width, height, spi, dc, res, cs, external_vcc=False):
@@ -146,10 +224,27 @@ class SSD1306_SPI(SSD1306):
         self.spi.write(bytearray([cmd]))
         self.cs(1)
 
+    def write_cmds(self, buf):
+        self.spi.init(baudrate=self.rate, polarity=0, phase=0)
+        self.cs(1)
+        self.dc(0)
+        self.cs(0)
+        self.spi.write(buf)
+        self.cs(1)
+
     def write_data(self, buf):
         self.spi.init(baudrate=self.rate, polarity=0, phase=0)
         self.cs(1)
         self.dc(1)
         self.cs(0)
         self.spi.write(buf)
-        self.cs(1)
\ No newline at end of file
+        self.cs(1)
+
+    def write_datav(self, bufs):
+        self.spi.init(baudrate=self.rate, polarity=0, phase=0)
+        self.cs(1)
+        self.dc(1)
+        self.cs(0)
+        for buf in bufs:
+            self.spi.write(buf)
+        self.cs(1)
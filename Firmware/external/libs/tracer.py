@@ -0,0 +1,141 @@
+"""
+Latency Tracer
+
+Features:
+- Spans identified by small integers, named once at construction
+- begin()/end() may be called from different tasks (one open instance
+  per span), so a span can cover e.g. touch release -> GATT write
+- Durations (time.ticks_us) stored in a preallocated ring buffer: no
+  allocation per event, the oldest events are overwritten
+- p50/p95/max per span, as text for the serial console or as compact
+  16-character lines for the SSD1306
+- When disabled, begin()/end() return after a single attribute test, so
+  the calls can stay in production code
+
+Usage:
+    tracer = Tracer(('touch', 'gatt'), size=256, enabled=True)
+    tracer.begin(0)
+    ...
+    tracer.end(0)
+    print(tracer.report())
+"""
+
+import time
+from array import array
+
+
+class Tracer:
+    """
+    Ring buffer of span durations.
+
+    Attributes:
+        names: Span names, indexed by span id
+        enabled: Record events (can be toggled at run time)
+        count: Events recorded since the last reset (may exceed size)
+    """
+
+    def __init__(self, names, size=256, enabled=True):
+        """
+        Args:
+            names: Sequence of span names (span id = index, at most 255)
+            size: Events kept in the ring buffer
+            enabled: Start recording right away
+        """
+        self.names = names
+        self.enabled = enabled
+        self.count = 0
+        self._size = size
+        self._pos = 0
+        self._span = bytearray(size)
+        self._us = array('I', bytes(4 * size))
+        # Start of the open instance of each span (ticks_us), and whether it is open
+        self._start = array('I', bytes(4 * len(names)))
+        self._open = bytearray(len(names))
+
+    def begin(self, span):
+        """Open a span, restarting it if it was already open"""
+        if not self.enabled:
+            return
+        self._start[span] = time.ticks_us()
+        self._open[span] = 1
+
+    def end(self, span):
+        """Close a span and record its duration (ignored if it is not open)"""
+        if not self.enabled or not self._open[span]:
+            return
+        self._open[span] = 0
+        self.record(span, time.ticks_diff(time.ticks_us(), self._start[span]))
+
+    def cancel(self, span):
+        """Close a span without recording it"""
+        self._open[span] = 0
+
+    def record(self, span, us):
+        """Store a duration measured elsewhere"""
+        if not self.enabled:
+            return
+        pos = self._pos
+        self._span[pos] = span
+        self._us[pos] = us if us > 0 else 0
+        pos += 1
+        self._pos = 0 if pos == self._size else pos
+        self.count += 1
+
+    def reset(self):
+        """Forget every recorded event and open span"""
+        self._pos = 0
+        self.count = 0
+        for i in range(len(self._open)):
+            self._open[i] = 0
+
+    def stats(self):
+        """
+        Percentiles of the events in the ring buffer (allocates; call on demand).
+
+        Returns:
+            List of (name, n, p50_us, p95_us, max_us), one per span with events
+        """
+        n = min(self.count, self._size)
+        out = []
+        for span, name in enumerate(self.names):
+            values = sorted(self._us[i] for i in range(n) if self._span[i] == span)
+            if not values:
+                continue
+            k = len(values)
+            # Nearest-rank percentiles
+            p50 = values[(50 * k + 99) // 100 - 1]
+            p95 = values[(95 * k + 99) // 100 - 1]
+            out.append((name, k, p50, p95, values[-1]))
+        return out
+
+    def report(self):
+        """
+        Format the statistics for the serial console.
+
+        Returns:
+            Multi-line string with one line per span (times in microseconds)
+        """
+        lines = ["Trace: {} events (last {})".format(self.count, min(self.count, self._size))]
+        for name, k, p50, p95, top in self.stats():
+            lines.append("  {}: n={} p50={} p95={} max={} us".format(name, k, p50, p95, top))
+        return "\n".join(lines)
+
+    def lines(self, width=16):
+        """
+        Compact summary for a small display.
+
+        Returns:
+            List of strings "name p50 p95" (milliseconds), one per span
+        """
+        out = []
+        for name, k, p50, p95, top in self.stats():
+            text = "{} {} {}".format(name[:5], _ms(p50), _ms(p95))
+            out.append(text[:width])
+        return out
+
+
+def _ms(us):
+    """Milliseconds with one decimal below 100 ms, whole above"""
+    if us < 100_000:
+        return "{:.1f}".format(us / 1000)
+    return str(us // 1000)
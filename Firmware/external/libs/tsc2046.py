@@ -5,18 +5,31 @@ Features:
 - SPI interface communication
 - Coordinate system with (0,0) at bottom-left
 - Touch pressure detection
-- Hardware IRQ support
-- Configurable calibration
+- Hardware IRQ support, with an asyncio pen-down wait
+- Burst reads: N samples of X, Y and Z in one CS-held transfer, with
+  preallocated buffers and median filtering
+- Configurable calibration, with integer mapping to screen pixels
 
 Coordinate System:
 - X: 0.0 (left) to 1.0 (right)
 - Y: 0.0 (bottom) to 1.0 (top)
 - Z: Touch pressure (higher values = more pressure)
+- read_point(): integer pixels, optionally with X/Y swapped
 """
 
 import machine
 import ustruct
 import time
+from array import array
+
+# Viper burst decoder (kernels.py, when kernels.ENABLED), or None to use the Python loop
+try:
+    import kernels
+    if not kernels.ENABLED:
+        raise ImportError("kernels disabled")
+    from kernels import tsc_medians
+except (ImportError, SyntaxError, ValueError):
+    tsc_medians = None
 
 class TSC2046:
     """
@@ -26,31 +39,55 @@ class TSC2046:
     CMD_X: Command to read X-axis (0x90)
     CMD_Y: Command to read Y-axis (0xD0)
     CMD_Z: Command to read pressure (0xB0)
+    Z_THRESHOLD: Minimum pressure considered a touch
     """
     
     # Command definitions
     CMD_X = 0x90
     CMD_Y = 0xD0
     CMD_Z = 0xB0
+    Z_THRESHOLD = 100
 
-    def __init__(self, spi, cs, irq=None):
+    def __init__(self, spi, cs, irq=None, samples=5):
         """
         Initialize touch controller.
         
         Args:
             spi: Initialized SPI bus
             cs: Chip Select pin
-            irq: Optional Interrupt pin
+            irq: Optional Interrupt pin (PENIRQ, active low)
+            samples: Samples per axis taken by read_burst()
         """
         self.spi = spi
         self.cs = cs
         self.irq = irq
         self._calib = (0, 4095, 0, 4095)  # Default calibration (x_min, x_max, y_min, y_max)
+        self._screen = (4096, 4096, False)  # read_point() mapping (width, height, swap_xy)
+        self._flag = None  # asyncio.ThreadSafeFlag, created on first wait_touch()
+
+        # Burst buffers: each sample is 3 commands of 3 bytes (cmd + 2 reply)
+        self._samples = samples
+        self._tx = bytearray(bytes([self.CMD_X, 0, 0, self.CMD_Y, 0, 0, self.CMD_Z, 0, 0]) * samples)
+        self._rx = bytearray(len(self._tx))
+        self._xs = [0] * samples
+        self._ys = [0] * samples
+        self._zs = [0] * samples
+        # Kernel output: 3 medians + one scratch slot per sample
+        self._med = array('H', bytes(2 * (3 + samples)))
+        # Single-axis read buffers (read(), is_touched())
+        self._cmd = bytearray(1)
+        self._axis = bytearray(2)
 
         # Initialize pins
         self.cs.init(machine.Pin.OUT, value=1)
         if self.irq:
             self.irq.init(machine.Pin.IN, machine.Pin.PULL_UP)
+            self.irq.irq(trigger=machine.Pin.IRQ_FALLING, handler=self._on_pen_down)
+
+    def _on_pen_down(self, pin):
+        """IRQ handler: wake the task waiting in wait_touch()"""
+        if self._flag is not None:
+            self._flag.set()
 
     def _enable_cs(self):
         """Activate chip select with proper timing"""
@@ -74,10 +111,11 @@ class TSC2046:
         Returns:
             12-bit raw ADC value (0-4095)
         """
+        self._cmd[0] = cmd
+        buf = self._axis
         self._enable_cs()
-        self.spi.write(bytearray([cmd]))
+        self.spi.write(self._cmd)
         time.sleep_us(1)
-        buf = bytearray(2)
         self.spi.readinto(buf)
         self._disable_cs()
         return ((buf[0] << 4) | (buf[1] >> 4)) & 0xFFF
@@ -132,4 +170,102 @@ class TSC2046:
         Returns:
             True if touched, False otherwise
         """
-        return self.irq.value() == 0 if self.irq else (self.read()[2] > 100)
\ No newline at end of file
+        return self.irq.value() == 0 if self.irq else (self.read()[2] > 100)
+
+    def set_screen(self, width, height, swap_xy=False):
+        """
+        Configure the pixel mapping used by read_point().
+        
+        Args:
+            width: Screen width in pixels
+            height: Screen height in pixels
+            swap_xy: Map the touch Y axis to screen X and vice versa
+                     (for panels mounted rotated relative to the touch film)
+        """
+        self._screen = (width, height, swap_xy)
+
+    def read_burst(self):
+        """
+        Read all axes several times in a single CS-held transfer.
+        
+        Returns:
+            (x, y, z): Median of the raw 12-bit samples of each axis
+        """
+        rx = self._rx
+        xs, ys, zs = self._xs, self._ys, self._zs
+        
+        self._enable_cs()
+        self.spi.write_readinto(self._tx, rx)
+        self._disable_cs()
+        
+        if tsc_medians is not None:
+            med = self._med
+            tsc_medians(rx, self._samples, med)
+            return med[0], med[1], med[2]
+        
+        i = 0
+        for n in range(self._samples):
+            xs[n] = ((rx[i + 1] << 4) | (rx[i + 2] >> 4)) & 0xFFF
+            ys[n] = ((rx[i + 4] << 4) | (rx[i + 5] >> 4)) & 0xFFF
+            zs[n] = ((rx[i + 7] << 4) | (rx[i + 8] >> 4)) & 0xFFF
+            i += 9
+        xs.sort()
+        ys.sort()
+        zs.sort()
+        mid = self._samples // 2
+        return xs[mid], ys[mid], zs[mid]
+
+    def read_point(self):
+        """
+        Read a filtered touch position in screen pixels (integer math only).
+        
+        Uses one burst read for coordinates and pressure, so there is no
+        need to call is_touched() first.
+        
+        Returns:
+            (px, py, z) clamped to the screen set by set_screen(), or None
+            if the pressure is below Z_THRESHOLD
+        """
+        x, y, z = self.read_burst()
+        if z <= self.Z_THRESHOLD:
+            return None
+        
+        x_min, x_max, y_min, y_max = self._calib
+        width, height, swap_xy = self._screen
+        
+        # Same orientation as read(): X grows right, Y is inverted
+        if swap_xy:
+            px = (y_max - y) * width // (y_max - y_min)
+            py = (x - x_min) * height // (x_max - x_min)
+        else:
+            px = (x - x_min) * width // (x_max - x_min)
+            py = (y_max - y) * height // (y_max - y_min)
+        
+        # Clamp to valid range
+        px = 0 if px < 0 else (width - 1 if px >= width else px)
+        py = 0 if py < 0 else (height - 1 if py >= height else py)
+        
+        return px, py, z
+
+    async def wait_touch(self, poll_ms=10):
+        """
+        Wait until the screen is touched.
+        
+        With an IRQ pin the task sleeps until PENIRQ falls; otherwise it
+        polls the pressure every poll_ms. Either way it returns only once
+        a burst read confirms the pressure, filtering IRQ glitches.
+        
+        Returns:
+            (px, py, z): Same as read_point()
+        """
+        import uasyncio as asyncio
+        
+        if self.irq and self._flag is None:
+            self._flag = asyncio.ThreadSafeFlag()
+        while True:
+            if self.irq and self.irq.value():
+                await self._flag.wait()
+            point = self.read_point()
+            if point:
+                return point
+            await asyncio.sleep_ms(poll_ms)
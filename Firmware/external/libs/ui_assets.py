@@ -0,0 +1,313 @@
+"""
+Screen Assets of the Touch Interface
+
+Generated by Firmware/build_assets.py from the drawing functions of
+main.py: do not edit, run the builder again after changing them. The
+format is described in build_assets.py; ILI9341.blit_asset() and
+Canvas.blit_asset() draw these tuples.
+"""
+
+
+# 320x240, 2 colors, 4853 bytes of runs
+TELA = (
+    320, 240,
+    (0x0000, 0xFFFF),
+    (
+        b'\x00\x00\x08\x00\x10\x00\x18\x00 \x00(\x008\x00H\x00X\x00h\x00x\x00\x88\x00'
+        b'\x98\x00\xa8\x00\xb8\x00\xc8\x00\xd8\x00\xe8\x00\xf8\x00\x08\x01\x18\x01(\x018\x01H\x01'
+        b'X\x01h\x01x\x01\x88\x01\x98\x01\xbd\x01\xe2\x01\x07\x025\x02c\x02\x91\x02\xbd\x02'
+        b'\xe9\x02\x15\x03C\x03q\x03\x9f\x03\xcd\x03\xfb\x03)\x04W\x04\x85\x04\xb3\x04\xd8\x04'
+        b'\xfd\x04"\x052\x05B\x05R\x05b\x05r\x05\x82\x05\x92\x05\xa2\x05\xb2\x05\xc2\x05'
+        b'\xd2\x05\xe2\x05\xf2\x05\x02\x06\x12\x06"\x062\x06B\x06R\x06b\x06r\x06\x82\x06'
+        b'\x92\x06\xa2\x06\xb2\x06\xc2\x06\xca\x06\xd2\x06\xda\x06\xe2\x06\xea\x06\xf2\x06\xfa\x06\x02\x07'
+        b'\n\x07\x12\x07"\x072\x07B\x07R\x07b\x07r\x07\x82\x07\x92\x07\xa2\x07\xb2\x07'
+        b'\xc2\x07\xd2\x07\xe2\x07\xf2\x07\x02\x08\x12\x08"\x082\x08B\x08R\x08b\x08r\x08'
+        b'\x82\x08\xa6\x08\xca\x08\xee\x08\x1c\tJ\tx\t\xa4\t\xd0\t\xfc\t*\nX\n'
+        b'\x86\n\xb4\n\xe2\n\x10\x0b>\x0bl\x0b\x9a\x0b\xc6\x0b\xf2\x0b\x1e\x0c.\x0c>\x0c'
+        b'N\x0c^\x0cn\x0c~\x0c\x8e\x0c\x9e\x0c\xae\x0c\xbe\x0c\xce\x0c\xde\x0c\xee\x0c\xfe\x0c'
+        b'\x0e\r\x1e\r.\r>\rN\r^\rn\r~\r\x8e\r\x9e\r\xae\r\xbe\r'
+        b'\xc6\r\xce\r\xd6\r\xde\r\xe6\r\xea\r\xee\r\xf2\r\xf6\r\xfa\r\x01\x0e\x08\x0e'
+        b'\x0f\x0e\x16\x0e\x1d\x0e&\x0e/\x0e8\x0eA\x0eJ\x0eS\x0e\\\x0ee\x0en\x0e'
+        b'w\x0e\x80\x0e\x89\x0e\x92\x0e\x9b\x0e\xa4\x0e\xad\x0e\xb6\x0e\xbf\x0e\xe8\x0e\x11\x0f:\x0f'
+        b'l\x0f\x9e\x0f\xd0\x0f\xfa\x0f$\x10N\x10\x81\x10\xb4\x10\xe7\x10\x15\x11C\x11q\x11'
+        b'\x8a\x11\xa3\x11\xbc\x11\xd3\x11\xea\x11\x01\x12\n\x12\x13\x12\x1c\x12%\x12.\x127\x12'
+        b'@\x12I\x12R\x12[\x12d\x12m\x12v\x12\x7f\x12\x88\x12\x91\x12\x9a\x12\xa3\x12'
+        b'\xac\x12\xb5\x12\xbe\x12\xc5\x12\xcc\x12\xd3\x12\xda\x12\xe1\x12\xe5\x12\xe9\x12\xed\x12\xf1\x12'
+    ),
+    (
+        b'\x0f@\x1f@\x0f@\x1f@\x0f@\x1f@\x0f@\x1f@\x0f@\x1f@\x0f@\x1f@'
+        b'\x0f@\x1f@\x0f@\x1f@\x0f@\x1f@\x0f@\x1f@\x04\x1f6\x04\x14\x0f6\x14'
+        b'\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14'
+        b'\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14'
+        b'\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14'
+        b'\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14'
+        b'\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14'
+        b'\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14'
+        b'\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14'
+        b'\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14'
+        b'\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14'
+        b'\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14'
+        b'\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14'
+        b'\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14'
+        b'\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14'
+        b'\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14'
+        b'\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14'
+        b'\x04\x1f\x04\x08\x19\x08\x1f\x06\x04\x14\x0f\x04\x18\x06\x1e\x0f\x03\x14\x04\x1f\x04\x08\x19\x08'
+        b'\x1f\x06\x04\x14\x0f\x04\x18\x0f\x00\x12\x0f\x06\x14\x04\x1f\x04\x08\x19\x08\x1f\x06\x04\x14\x0f'
+        b'\x04\x18\x06\x1e\x0f\x03\x14\x04\x1f\x04\x08\x19\x08\x1f\x06\x04\x14\x0f\x04\x18\x0f\x00\x12\x0f'
+        b'\x06\x14\x04\x1f\x04\x08\x19\x08\x1f\x06\x04\x14\x0f\x04\x18\x06\x1e\x0f\x03\x14\x04\x1f\x04\x08'
+        b'\x19\x08\x1f\x06\x04\x14\x0f\x04\x18\x0f\x00\x12\x0f\x06\x14\x04\x1f\x04\x02\x15\x02\x19\x02\x1f'
+        b'\t\x04\x14\x0f\x04\x12\x05\x12\x06\x12\x0f\x0c\x14\x04\x1f\x04\x02\x15\x02\x13\x02\x18\x02\x1f'
+        b'\x03\x04\x14\x0f\x04\x12\x05\x12\x0c\x12\x0f\x06\x14\x04\x1f\x04\x02\x15\x02\x19\x02\x1f\t\x04'
+        b'\x14\x0f\x04\x12\x05\x12\x06\x12\x0f\x0c\x14\x04\x1f\x04\x02\x15\x02\x13\x02\x18\x02\x1f\x03\x04'
+        b'\x14\x0f\x04\x12\x05\x12\x0c\x12\x0f\x06\x14\x04\x1f\x04\x02\x15\x02\x19\x02\x1f\t\x04\x14\x0f'
+        b'\x04\x12\x05\x12\x06\x12\x0f\x0c\x14\x04\x1f\x04\x02\x15\x02\x13\x02\x18\x02\x1f\x03\x04\x14\x0f'
+        b'\x04\x12\x05\x12\x0c\x12\x0f\x06\x14\x04\x1f\x04\x02\x18\x02\x16\x02\x1f\t\x04\x14\x0f\x04\x12'
+        b'\x08\x12\x06\x12\x0f\t\x14\x04\x1f\x04\x02\x18\x02\x1c\x02\x1f\x03\x04\x14\x0f\x04\x12\x08\x12'
+        b'\x00\x1e\x0f\x03\x14\x04\x1f\x04\x02\x18\x02\x16\x02\x1f\t\x04\x14\x0f\x04\x12\x08\x12\x06\x12'
+        b'\x0f\t\x14\x04\x1f\x04\x02\x18\x02\x1c\x02\x1f\x03\x04\x14\x0f\x04\x12\x08\x12\x00\x1e\x0f\x03'
+        b'\x14\x04\x1f\x04\x02\x18\x02\x16\x02\x1f\t\x04\x14\x0f\x04\x12\x08\x12\x06\x12\x0f\t\x14\x04'
+        b'\x1f\x04\x02\x18\x02\x1c\x02\x1f\x03\x04\x14\x0f\x04\x12\x08\x12\x00\x1e\x0f\x03\x14\x04\x1f\x04'
+        b'\x02\x18\x02\x16\x02\x1f\t\x04\x14\x0f\x04\x12\x08\x12\t\x12\x0f\x06\x14\x04\x1f\x04\x02\x18'
+        b'\x02\x19\x02\x1f\x06\x04\x14\x0f\x04\x12\x08\x12\x00\x12\x05\x12\x0f\x06\x14\x04\x1f\x04\x02\x18'
+        b'\x02\x16\x02\x1f\t\x04\x14\x0f\x04\x12\x08\x12\t\x12\x0f\x06\x14\x04\x1f\x04\x02\x18\x02\x19'
+        b'\x02\x1f\x06\x04\x14\x0f\x04\x12\x08\x12\x00\x12\x05\x12\x0f\x06\x14\x04\x1f\x04\x02\x18\x02\x16'
+        b'\x02\x1f\t\x04\x14\x0f\x04\x12\x08\x12\t\x12\x0f\x06\x14\x04\x1f\x04\x02\x18\x02\x19\x02\x1f'
+        b'\x06\x04\x14\x0f\x04\x12\x08\x12\x00\x12\x05\x12\x0f\x06\x14\x04\x1f\x04\x02\x18\x02\x16\x02\x1f'
+        b'\t\x04\x14\x0f\x04\x12\x08\x12\x0c\x12\x0f\x03\x14\x04\x1f\x04\x02\x18\x02\x16\x02\x1f\t\x04'
+        b'\x14\x0f\x04\x12\x08\x12\x03\x12\x02\x12\x0f\x06\x14\x04\x1f\x04\x02\x18\x02\x16\x02\x1f\t\x04'
+        b'\x14\x0f\x04\x12\x08\x12\x0c\x12\x0f\x03\x14\x04\x1f\x04\x02\x18\x02\x16\x02\x1f\t\x04\x14\x0f'
+        b'\x04\x12\x08\x12\x03\x12\x02\x12\x0f\x06\x14\x04\x1f\x04\x02\x18\x02\x16\x02\x1f\t\x04\x14\x0f'
+        b'\x04\x12\x08\x12\x0c\x12\x0f\x03\x14\x04\x1f\x04\x02\x18\x02\x16\x02\x1f\t\x04\x14\x0f\x04\x12'
+        b'\x08\x12\x03\x12\x02\x12\x0f\x06\x14\x04\x1f\x04\x02\x15\x02\x16\x05\x1f\t\x04\x14\x0f\x04\x12'
+        b'\x05\x12\x03\x12\x08\x12\x0f\x03\x14\x04\x1f\x04\x02\x15\x02\x1c\x02\x1f\x06\x04\x14\x0f\x04\x12'
+        b'\x05\x12\t\x15\x0f\x06\x14\x04\x1f\x04\x02\x15\x02\x16\x05\x1f\t\x04\x14\x0f\x04\x12\x05\x12'
+        b'\x03\x12\x08\x12\x0f\x03\x14\x04\x1f\x04\x02\x15\x02\x1c\x02\x1f\x06\x04\x14\x0f\x04\x12\x05\x12'
+        b'\t\x15\x0f\x06\x14\x04\x1f\x04\x02\x15\x02\x16\x05\x1f\t\x04\x14\x0f\x04\x12\x05\x12\x03\x12'
+        b'\x08\x12\x0f\x03\x14\x04\x1f\x04\x02\x15\x02\x1c\x02\x1f\x06\x04\x14\x0f\x04\x12\x05\x12\t\x15'
+        b'\x0f\x06\x14\x04\x1f\x04\x08\x1c\x02\x1f\t\x04\x14\x0f\x04\x18\t\x18\x0f\x06\x14\x04\x1f\x04'
+        b'\x08\x16\x0e\x1f\x03\x04\x14\x0f\x04\x18\x0f\x00\x12\x0f\x06\x14\x04\x1f\x04\x08\x1c\x02\x1f\t'
+        b'\x04\x14\x0f\x04\x18\t\x18\x0f\x06\x14\x04\x1f\x04\x08\x16\x0e\x1f\x03\x04\x14\x0f\x04\x18\x0f'
+        b'\x00\x12\x0f\x06\x14\x04\x1f\x04\x08\x1c\x02\x1f\t\x04\x14\x0f\x04\x18\t\x18\x0f\x06\x14\x04'
+        b'\x1f\x04\x08\x16\x0e\x1f\x03\x04\x14\x0f\x04\x18\x0f\x00\x12\x0f\x06\x14\x04\x1f6\x04\x14\x0f'
+        b'6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f'
+        b'6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f'
+        b'6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f'
+        b'6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f'
+        b'6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f'
+        b'6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f'
+        b'6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f'
+        b'6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f'
+        b'6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f'
+        b'6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f'
+        b'6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f'
+        b'6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f'
+        b'6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f'
+        b'6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f'
+        b'6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f'
+        b'6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f'
+        b'6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f'
+        b'6\x14\x0f@\x1f@\x0f@\x1f@\x0f@\x1f@\x0f@\x1f@\x0f@\x1f@\x0f@'
+        b'\x1f@\x0f@\x1f@\x0f@\x1f@\x0f@\x1f@\x0f@\x1f@\x1f@\x0f@\x1f@'
+        b'\x0f@\x1f@\x0f@\x1f@\x0f@\x1f@\x0f@\x1f@\x0f@\x1f@\x0f@\x1f@'
+        b'\x0f@\x1f@\x0f@\x1f@\x0f@\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f'
+        b'6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f'
+        b'6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f'
+        b'6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f'
+        b'6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f'
+        b'6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f'
+        b'6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f'
+        b'6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f'
+        b'6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f'
+        b'6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f'
+        b'6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f'
+        b'6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f'
+        b'6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f'
+        b'6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f'
+        b'6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f'
+        b'6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f\x07\x18\x06\x18'
+        b'\x0f\x06\x14\x04\x1f\x07\x08\x13\x0e\x1f\x03\x04\x14\x0f\x07\x18\x06\x18\x0f\x06\x14\x04\x1f\x07'
+        b'\x08\x1c\x02\x1f\x06\x04\x14\x0f\x07\x18\x06\x18\x0f\x06\x14\x04\x1f\x07\x08\x13\x0e\x1f\x03\x04'
+        b'\x14\x0f\x07\x18\x06\x18\x0f\x06\x14\x04\x1f\x07\x08\x1c\x02\x1f\x06\x04\x14\x0f\x07\x18\x06\x18'
+        b'\x0f\x06\x14\x04\x1f\x07\x08\x13\x0e\x1f\x03\x04\x14\x0f\x07\x18\x06\x18\x0f\x06\x14\x04\x1f\x07'
+        b'\x08\x1c\x02\x1f\x06\x04\x14\x0f\x04\x12\x08\x12\x06\x12\x0f\t\x14\x04\x1f\x04\x02\x18\x02\x13'
+        b'\x02\x1f\x0c\x04\x14\x0f\x04\x12\x08\x12\x00\x12\x08\x12\x0f\x03\x14\x04\x1f\x04\x02\x18\x02\x19'
+        b'\x02\x1f\x06\x04\x14\x0f\x04\x12\x08\x12\x06\x12\x0f\t\x14\x04\x1f\x04\x02\x18\x02\x13\x02\x1f'
+        b'\x0c\x04\x14\x0f\x04\x12\x08\x12\x00\x12\x08\x12\x0f\x03\x14\x04\x1f\x04\x02\x18\x02\x19\x02\x1f'
+        b'\x06\x04\x14\x0f\x04\x12\x08\x12\x06\x12\x0f\t\x14\x04\x1f\x04\x02\x18\x02\x13\x02\x1f\x0c\x04'
+        b'\x14\x0f\x04\x12\x08\x12\x00\x12\x08\x12\x0f\x03\x14\x04\x1f\x04\x02\x18\x02\x19\x02\x1f\x06\x04'
+        b'\x14\x0f\x04\x12\x08\x12\x06\x12\x0f\t\x14\x04\x1f\x04\x02\x18\x02\x16\x02\x1f\t\x04\x14\x0f'
+        b'\x04\x12\x08\x12\x0c\x12\x0f\x03\x14\x04\x1f\x04\x02\x18\x02\x10\x0e\x1f\x03\x04\x14\x0f\x04\x12'
+        b'\x08\x12\x06\x12\x0f\t\x14\x04\x1f\x04\x02\x18\x02\x16\x02\x1f\t\x04\x14\x0f\x04\x12\x08\x12'
+        b'\x0c\x12\x0f\x03\x14\x04\x1f\x04\x02\x18\x02\x10\x0e\x1f\x03\x04\x14\x0f\x04\x12\x08\x12\x06\x12'
+        b'\x0f\t\x14\x04\x1f\x04\x02\x18\x02\x16\x02\x1f\t\x04\x14\x0f\x04\x12\x08\x12\x0c\x12\x0f\x03'
+        b'\x14\x04\x1f\x04\x02\x18\x02\x10\x0e\x1f\x03\x04\x14\x0f\x04\x12\x08\x12\x06\x12\x0f\t\x14\x04'
+        b'\x1f\x04\x02\x18\x02\x19\x02\x1f\x06\x04\x14\x0f\x04\x12\x08\x12\t\x12\x0f\x06\x14\x04\x1f\x04'
+        b'\x02\x18\x02\x10\x02\x15\x02\x1f\x06\x04\x14\x0f\x04\x12\x08\x12\x06\x12\x0f\t\x14\x04\x1f\x04'
+        b'\x02\x18\x02\x19\x02\x1f\x06\x04\x14\x0f\x04\x12\x08\x12\t\x12\x0f\x06\x14\x04\x1f\x04\x02\x18'
+        b'\x02\x10\x02\x15\x02\x1f\x06\x04\x14\x0f\x04\x12\x08\x12\x06\x12\x0f\t\x14\x04\x1f\x04\x02\x18'
+        b'\x02\x19\x02\x1f\x06\x04\x14\x0f\x04\x12\x08\x12\t\x12\x0f\x06\x14\x04\x1f\x04\x02\x18\x02\x10'
+        b'\x02\x15\x02\x1f\x06\x04\x14\x0f\x04\x12\x08\x12\x06\x12\x0f\t\x14\x04\x1f\x04\x02\x18\x02\x1c'
+        b'\x02\x1f\x03\x04\x14\x0f\x04\x12\x08\x12\x06\x12\x0f\t\x14\x04\x1f\x04\x02\x18\x02\x13\x02\x12'
+        b'\x02\x1f\x06\x04\x14\x0f\x04\x12\x08\x12\x06\x12\x0f\t\x14\x04\x1f\x04\x02\x18\x02\x1c\x02\x1f'
+        b'\x03\x04\x14\x0f\x04\x12\x08\x12\x06\x12\x0f\t\x14\x04\x1f\x04\x02\x18\x02\x13\x02\x12\x02\x1f'
+        b'\x06\x04\x14\x0f\x04\x12\x08\x12\x06\x12\x0f\t\x14\x04\x1f\x04\x02\x18\x02\x1c\x02\x1f\x03\x04'
+        b'\x14\x0f\x04\x12\x08\x12\x06\x12\x0f\t\x14\x04\x1f\x04\x02\x18\x02\x13\x02\x12\x02\x1f\x06\x04'
+        b'\x14\x0f\x04\x12\x08\x12\x03\x15\x0f\t\x14\x04\x1f\x04\x02\x18\x02\x10\x02\x18\x02\x1f\x03\x04'
+        b'\x14\x0f\x04\x12\x08\x12\t\x12\x0f\x06\x14\x04\x1f\x04\x02\x18\x02\x16\x05\x1f\x06\x04\x14\x0f'
+        b'\x04\x12\x08\x12\x03\x15\x0f\t\x14\x04\x1f\x04\x02\x18\x02\x10\x02\x18\x02\x1f\x03\x04\x14\x0f'
+        b'\x04\x12\x08\x12\t\x12\x0f\x06\x14\x04\x1f\x04\x02\x18\x02\x16\x05\x1f\x06\x04\x14\x0f\x04\x12'
+        b'\x08\x12\x03\x15\x0f\t\x14\x04\x1f\x04\x02\x18\x02\x10\x02\x18\x02\x1f\x03\x04\x14\x0f\x04\x12'
+        b'\x08\x12\t\x12\x0f\x06\x14\x04\x1f\x04\x02\x18\x02\x16\x05\x1f\x06\x04\x14\x0f\x04\x12\x08\x12'
+        b'\x06\x12\x0f\t\x14\x04\x1f\x04\x02\x18\x02\x13\x08\x1f\x06\x04\x14\x0f\x04\x12\x08\x12\x00\x1e'
+        b'\x0f\x03\x14\x04\x1f\x04\x02\x18\x02\x19\x02\x1f\x06\x04\x14\x0f\x04\x12\x08\x12\x06\x12\x0f\t'
+        b'\x14\x04\x1f\x04\x02\x18\x02\x13\x08\x1f\x06\x04\x14\x0f\x04\x12\x08\x12\x00\x1e\x0f\x03\x14\x04'
+        b'\x1f\x04\x02\x18\x02\x19\x02\x1f\x06\x04\x14\x0f\x04\x12\x08\x12\x06\x12\x0f\t\x14\x04\x1f\x04'
+        b'\x02\x18\x02\x13\x08\x1f\x06\x04\x14\x0f\x04\x12\x08\x12\x00\x1e\x0f\x03\x14\x04\x1f\x04\x02\x18'
+        b'\x02\x19\x02\x1f\x06\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f'
+        b'6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f'
+        b'6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f'
+        b'6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f'
+        b'6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f'
+        b'6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f'
+        b'6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f'
+        b'6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f'
+        b'6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f'
+        b'6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f'
+        b'6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f'
+        b'6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f'
+        b'6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f'
+        b'6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f'
+        b'6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f'
+        b'6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f'
+        b'6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x14\x0f'
+        b'6\x14\x04\x1f6\x04\x14\x0f6\x14\x04\x1f6\x04\x1f@\x0f@\x1f@\x0f@\x1f@'
+        b'\x0f@\x1f@\x0f@\x1f@\x0f@\x1f@\x0f@\x1f@\x0f@\x1f@\x0f@\x1f@'
+        b'\x0f@\x1f@\x0f@\x1f\xff\x1f!\x1f\xff\x1f!\x1f\xff\x1f!\x1f\xff\x1f!\x1f\xff'
+        b'\x1f!\x14\x0f\x86\x19\x0f\x86\x14\x14\x0f\x86\x19\x0f\x86\x14\x14\x0f\x86\x19\x0f\x86\x14\x14'
+        b'\x0f\x86\x19\x0f\x86\x14\x14\x0f\x86\x19\x0f\x86\x14\x14\x0f\x86\x19\x04\x1f|\x04\x14\x14\x0f'
+        b'\x86\x19\x04\x1f|\x04\x14\x14\x0f\x86\x19\x04\x1f|\x04\x14\x14\x0f\x86\x19\x04\x1f|\x04'
+        b'\x14\x14\x0f\x86\x19\x04\x1f|\x04\x14\x14\x0f\x86\x19\x04\x1f|\x04\x14\x14\x0f\x86\x19\x04'
+        b'\x1f|\x04\x14\x14\x0f\x86\x19\x04\x1f|\x04\x14\x14\x0f\x86\x19\x04\x1f|\x04\x14\x14\x0f'
+        b'\x86\x19\x04\x1f|\x04\x14\x14\x0f\x86\x19\x04\x1f|\x04\x14\x14\x0f\x86\x19\x04\x1f|\x04'
+        b'\x14\x14\x0f\x86\x19\x04\x1f|\x04\x14\x14\x0f\x86\x19\x04\x1f|\x04\x14\x14\x0f\x86\x19\x04'
+        b'\x1f|\x04\x14\x14\x0f\x86\x19\x04\x1f|\x04\x14\x14\x0f\x86\x19\x04\x1f|\x04\x14\x14\x0f'
+        b'\x86\x19\x04\x1f|\x04\x14\x14\x0f\x0e\x12\x0f\x00\x18\x06\x18\x03\x12\x08\x12\x03\x1b\x00\x12'
+        b'\x0f\x15\x19\x04\x1f\x07\x02\x18\x02\x10\x0b\x16\x08\x13\x02\x1f\x03\x05\x16\x08\x1f\t\x04\x14'
+        b'\x14\x0f\x0e\x12\x0f\x00\x18\x06\x18\x03\x12\x08\x12\x03\x1b\x00\x12\x0f\x15\x19\x04\x1f\x07\x02'
+        b'\x18\x02\x10\x0b\x16\x08\x13\x02\x1f\x03\x05\x16\x08\x1f\t\x04\x14\x14\x0f\x0e\x12\x0f\x00\x18'
+        b'\x06\x18\x03\x12\x08\x12\x03\x1b\x00\x12\x0f\x15\x19\x04\x1f\x07\x02\x18\x02\x10\x0b\x16\x08\x13'
+        b'\x02\x1f\x03\x05\x16\x08\x1f\t\x04\x14\x14\x0f\x0e\x12\x0c\x12\x0c\x12\x08\x12\x00\x12\x08\x12'
+        b'\x00\x12\x08\x12\x00\x12\x0f\x15\x19\x04\x1f\x07\x02\x18\x02\x10\x02\x18\x02\x10\x02\x1c\x02\x1f'
+        b'\x00\x02\x15\x02\x10\x02\x18\x02\x1f\x06\x04\x14\x14\x0f\x0e\x12\x0c\x12\x0c\x12\x08\x12\x00\x12'
+        b'\x08\x12\x00\x12\x08\x12\x00\x12\x0f\x15\x19\x04\x1f\x07\x02\x18\x02\x10\x02\x18\x02\x10\x02\x1c'
+        b'\x02\x1f\x00\x02\x15\x02\x10\x02\x18\x02\x1f\x06\x04\x14\x14\x0f\x0e\x12\x0c\x12\x0c\x12\x08\x12'
+        b'\x00\x12\x08\x12\x00\x12\x08\x12\x00\x12\x0f\x15\x19\x04\x1f\x07\x02\x18\x02\x10\x02\x18\x02\x10'
+        b'\x02\x1c\x02\x1f\x00\x02\x15\x02\x10\x02\x18\x02\x1f\x06\x04\x14\x14\x0f\x0e\x12\x0c\x1e\x00\x12'
+        b'\x0c\x12\x08\x12\x03\x1b\x00\x12\x0f\x15\x19\x04\x1f\x07\x0e\x10\x02\x18\x02\x10\x0e\x10\x02\x1f'
+        b'\x00\x02\x19\x02\x18\x02\x1f\x06\x04\x14\x14\x0f\x0e\x12\x0c\x1e\x00\x12\x0c\x12\x08\x12\x03\x1b'
+        b'\x00\x12\x0f\x15\x19\x04\x1f\x07\x0e\x10\x02\x18\x02\x10\x0e\x10\x02\x1f\x00\x02\x19\x02\x18\x02'
+        b'\x1f\x06\x04\x14\x14\x0f\x0e\x12\x0c\x1e\x00\x12\x0c\x12\x08\x12\x03\x1b\x00\x12\x0f\x15\x19\x04'
+        b'\x1f\x07\x0e\x10\x02\x18\x02\x10\x0e\x10\x02\x1f\x00\x02\x19\x02\x18\x02\x1f\x06\x04\x14\x14\x0f'
+        b'\x0e\x18\x06\x12\x08\x12\x00\x12\x0c\x15\x05\x12\x0c\x12\x00\x15\x05\x12\x0f\t\x19\x04\x1f\x07'
+        b'\x02\x18\x02\x10\x05\x15\x02\x10\x02\x18\x02\x10\x05\x15\x02\x13\x02\x19\x02\x18\x02\x1f\x06\x04'
+        b'\x14\x14\x0f\x0e\x18\x06\x12\x08\x12\x00\x12\x0c\x15\x05\x12\x0c\x12\x00\x15\x05\x12\x0f\t\x19'
+        b'\x04\x1f\x07\x02\x18\x02\x10\x05\x15\x02\x10\x02\x18\x02\x10\x05\x15\x02\x13\x02\x19\x02\x18\x02'
+        b'\x1f\x06\x04\x14\x14\x0f\x0e\x18\x06\x12\x08\x12\x00\x12\x0c\x15\x05\x12\x0c\x12\x00\x15\x05\x12'
+        b'\x0f\t\x19\x04\x1f\x07\x02\x18\x02\x10\x05\x15\x02\x10\x02\x18\x02\x10\x05\x15\x02\x13\x02\x19'
+        b'\x02\x18\x02\x1f\x06\x04\x14\x14\x0f\x0e\x12\x0f\x00\x18\x06\x18\x03\x12\x02\x15\x06\x18\x03\x12'
+        b'\x02\x15\x0f\x0c\x19\x04\x1f\x07\x02\x18\x02\x10\x02\x12\x05\x16\x08\x13\x02\x12\x05\x13\x08\x19'
+        b'\x08\x1f\t\x04\x14\x14\x0f\x0e\x12\x0f\x00\x18\x06\x18\x03\x12\x02\x15\x06\x18\x03\x12\x02\x15'
+        b'\x0f\x0c\x19\x04\x1f\x07\x02\x18\x02\x10\x02\x12\x05\x16\x08\x13\x02\x12\x05\x13\x08\x19\x08\x1f'
+        b'\t\x04\x14\x14\x0f\x0e\x12\x0f\x00\x18\x06\x18\x03\x12\x02\x15\x06\x18\x03\x12\x02\x15\x0f\x0c'
+        b'\x19\x04\x1f\x07\x02\x18\x02\x10\x02\x12\x05\x16\x08\x13\x02\x12\x05\x13\x08\x19\x08\x1f\t\x04'
+        b'\x14\x14\x0f\x0e\x12\x0f\x1d\x12\x0f5\x19\x04\x1f\x07\x02\x18\x02\x10\x02\x1f \x02\x1f\x1f'
+        b'\x04\x14\x14\x0f\x0e\x12\x0f\x1d\x12\x0f5\x19\x04\x1f\x07\x02\x18\x02\x10\x02\x1f \x02\x1f'
+        b'\x1f\x04\x14\x14\x0f\x0e\x12\x0f\x1d\x12\x0f5\x19\x04\x1f\x07\x02\x18\x02\x10\x02\x1f \x02'
+        b'\x1f\x1f\x04\x14\x14\x0f\x0e\x1e\x0f\x11\x12\x0f5\x19\x04\x1f\n\x08\x13\x02\x1f \x02\x1f'
+        b'\x1f\x04\x14\x14\x0f\x0e\x1e\x0f\x11\x12\x0f5\x19\x04\x1f\n\x08\x13\x02\x1f \x02\x1f\x1f'
+        b'\x04\x14\x14\x0f\x0e\x1e\x0f\x11\x12\x0f5\x19\x04\x1f\n\x08\x13\x02\x1f \x02\x1f\x1f\x04'
+        b'\x14\x14\x0f\x86\x19\x04\x1f|\x04\x14\x14\x0f\x86\x19\x04\x1f|\x04\x14\x14\x0f\x86\x19\x04'
+        b'\x1f|\x04\x14\x14\x0f\x86\x19\x04\x1f|\x04\x14\x14\x0f\x86\x19\x04\x1f|\x04\x14\x14\x0f'
+        b'\x86\x19\x04\x1f|\x04\x14\x14\x0f\x86\x19\x04\x1f|\x04\x14\x14\x0f\x86\x19\x04\x1f|\x04'
+        b'\x14\x14\x0f\x86\x19\x04\x1f|\x04\x14\x14\x0f\x86\x19\x04\x1f|\x04\x14\x14\x0f\x86\x19\x04'
+        b'\x1f|\x04\x14\x14\x0f\x86\x19\x04\x1f|\x04\x14\x14\x0f\x86\x19\x04\x1f|\x04\x14\x14\x0f'
+        b'\x86\x19\x04\x1f|\x04\x14\x14\x0f\x86\x19\x04\x1f|\x04\x14\x14\x0f\x86\x19\x04\x1f|\x04'
+        b'\x14\x14\x0f\x86\x19\x04\x1f|\x04\x14\x14\x0f\x86\x19\x04\x1f|\x04\x14\x14\x0f\x86\x19\x04'
+        b'\x1f|\x04\x14\x14\x0f\x86\x19\x04\x1f|\x04\x14\x14\x0f\x86\x19\x04\x1f|\x04\x14\x14\x0f'
+        b'\x86\x19\x0f\x86\x14\x14\x0f\x86\x19\x0f\x86\x14\x14\x0f\x86\x19\x0f\x86\x14\x14\x0f\x86\x19\x0f'
+        b'\x86\x14\x14\x0f\x86\x19\x0f\x86\x14\x1f\xff\x1f!\x1f\xff\x1f!\x1f\xff\x1f!\x1f\xff\x1f'
+        b'!\x1f\xff\x1f!'
+    ),
+)
+
+# 320x80, 2 colors, 1286 bytes of runs
+GARRA_FECHADA = (
+    320, 80,
+    (0x0000, 0xFFFF),
+    (
+        b'\x00\x00\x04\x00\x08\x00\x0c\x00\x10\x00\x14\x00\x1b\x00"\x00)\x000\x007\x00@\x00'
+        b'I\x00R\x00[\x00d\x00m\x00v\x00\x7f\x00\x88\x00\x91\x00\x9a\x00\xa3\x00\xac\x00'
+        b'\xb5\x00\xbe\x00\xc7\x00\xd0\x00\xd9\x00\x01\x01)\x01Q\x01\x81\x01\xb1\x01\xe1\x01\x0b\x02'
+        b'5\x02_\x02\x90\x02\xc1\x02\xf2\x02!\x03P\x03\x7f\x03\x97\x03\xaf\x03\xc7\x03\xe0\x03'
+        b'\xf9\x03\x12\x04\x1b\x04$\x04-\x046\x04?\x04H\x04Q\x04Z\x04c\x04l\x04'
+        b'u\x04~\x04\x87\x04\x90\x04\x99\x04\xa2\x04\xab\x04\xb4\x04\xbd\x04\xc6\x04\xcf\x04\xd6\x04'
+        b'\xdd\x04\xe4\x04\xeb\x04\xf2\x04\xf6\x04\xfa\x04\xfe\x04\x02\x05'
+    ),
+    (
+        b'\x1f\xff\x1f!\x1f\xff\x1f!\x1f\xff\x1f!\x1f\xff\x1f!\x1f\xff\x1f!\x14\x0f\x86\x19'
+        b'\x0f\x86\x14\x14\x0f\x86\x19\x0f\x86\x14\x14\x0f\x86\x19\x0f\x86\x14\x14\x0f\x86\x19\x0f\x86\x14'
+        b'\x14\x0f\x86\x19\x0f\x86\x14\x14\x04\x1f|\x04\x19\x0f\x86\x14\x14\x04\x1f|\x04\x19\x0f\x86'
+        b'\x14\x14\x04\x1f|\x04\x19\x0f\x86\x14\x14\x04\x1f|\x04\x19\x0f\x86\x14\x14\x04\x1f|\x04'
+        b'\x19\x0f\x86\x14\x14\x04\x1f|\x04\x19\x0f\x86\x14\x14\x04\x1f|\x04\x19\x0f\x86\x14\x14\x04'
+        b'\x1f|\x04\x19\x0f\x86\x14\x14\x04\x1f|\x04\x19\x0f\x86\x14\x14\x04\x1f|\x04\x19\x0f\x86'
+        b'\x14\x14\x04\x1f|\x04\x19\x0f\x86\x14\x14\x04\x1f|\x04\x19\x0f\x86\x14\x14\x04\x1f|\x04'
+        b'\x19\x0f\x86\x14\x14\x04\x1f|\x04\x19\x0f\x86\x14\x14\x04\x1f|\x04\x19\x0f\x86\x14\x14\x04'
+        b'\x1f|\x04\x19\x0f\x86\x14\x14\x04\x1f|\x04\x19\x0f\x86\x14\x14\x04\x1f|\x04\x19\x0f\x86'
+        b'\x14\x14\x04\x1e\x02\x1f\x00\x08\x16\x08\x13\x02\x18\x02\x13\x0b\x13\x0b\x13\x08\x1f\x01\x04\x19'
+        b'\x0f\x13\x12\x08\x12\x00\x1b\x03\x12\x0f\x00\x18\x03\x12\x0f \x14\x14\x04\x1e\x02\x1f\x00\x08'
+        b'\x16\x08\x13\x02\x18\x02\x13\x0b\x13\x0b\x13\x08\x1f\x01\x04\x19\x0f\x13\x12\x08\x12\x00\x1b\x03'
+        b'\x12\x0f\x00\x18\x03\x12\x0f \x14\x14\x04\x1e\x02\x1f\x00\x08\x16\x08\x13\x02\x18\x02\x13\x0b'
+        b'\x13\x0b\x13\x08\x1f\x01\x04\x19\x0f\x13\x12\x08\x12\x00\x1b\x03\x12\x0f\x00\x18\x03\x12\x0f '
+        b'\x14\x14\x04\x1e\x02\x1c\x02\x1c\x02\x18\x02\x10\x02\x18\x02\x10\x02\x18\x02\x10\x02\x18\x02\x10'
+        b'\x02\x18\x02\x1d\x04\x19\x0f\x13\x12\x08\x12\x00\x12\x08\x12\x00\x12\x0f\x03\x12\x06\x12\x0f '
+        b'\x14\x14\x04\x1e\x02\x1c\x02\x1c\x02\x18\x02\x10\x02\x18\x02\x10\x02\x18\x02\x10\x02\x18\x02\x10'
+        b'\x02\x18\x02\x1d\x04\x19\x0f\x13\x12\x08\x12\x00\x12\x08\x12\x00\x12\x0f\x03\x12\x06\x12\x0f '
+        b'\x14\x14\x04\x1e\x02\x1c\x02\x1c\x02\x18\x02\x10\x02\x18\x02\x10\x02\x18\x02\x10\x02\x18\x02\x10'
+        b'\x02\x18\x02\x1d\x04\x19\x0f\x13\x12\x08\x12\x00\x12\x08\x12\x00\x12\x0f\x03\x12\x06\x12\x0f '
+        b'\x14\x14\x04\x1e\x02\x1c\x0e\x10\x02\x1c\x02\x18\x02\x13\x0b\x10\x02\x18\x02\x10\x02\x18\x02\x1d'
+        b'\x04\x19\x0f\x13\x1e\x00\x12\x08\x12\x00\x12\x0f\x03\x12\x06\x12\x0f \x14\x14\x04\x1e\x02\x1c'
+        b'\x0e\x10\x02\x1c\x02\x18\x02\x13\x0b\x10\x02\x18\x02\x10\x02\x18\x02\x1d\x04\x19\x0f\x13\x1e\x00'
+        b'\x12\x08\x12\x00\x12\x0f\x03\x12\x06\x12\x0f \x14\x14\x04\x1e\x02\x1c\x0e\x10\x02\x1c\x02\x18'
+        b'\x02\x13\x0b\x10\x02\x18\x02\x10\x02\x18\x02\x1d\x04\x19\x0f\x13\x1e\x00\x12\x08\x12\x00\x12\x0f'
+        b'\x03\x12\x06\x12\x0f \x14\x14\x04\x1e\x08\x16\x02\x18\x02\x10\x02\x1c\x05\x15\x02\x1c\x02\x10'
+        b'\x02\x15\x05\x10\x02\x18\x02\x1d\x04\x19\x0f\x13\x12\x08\x12\x00\x15\x05\x12\x00\x15\x05\x12\x06'
+        b'\x12\x06\x15\x05\x12\x0f\x14\x14\x14\x04\x1e\x08\x16\x02\x18\x02\x10\x02\x1c\x05\x15\x02\x1c\x02'
+        b'\x10\x02\x15\x05\x10\x02\x18\x02\x1d\x04\x19\x0f\x13\x12\x08\x12\x00\x15\x05\x12\x00\x15\x05\x12'
+        b'\x06\x12\x06\x15\x05\x12\x0f\x14\x14\x14\x04\x1e\x08\x16\x02\x18\x02\x10\x02\x1c\x05\x15\x02\x1c'
+        b'\x02\x10\x02\x15\x05\x10\x02\x18\x02\x1d\x04\x19\x0f\x13\x12\x08\x12\x00\x15\x05\x12\x00\x15\x05'
+        b'\x12\x06\x12\x06\x15\x05\x12\x0f\x14\x14\x14\x04\x1e\x02\x1f\x00\x08\x16\x08\x13\x02\x12\x05\x16'
+        b'\x08\x16\x05\x12\x02\x13\x08\x1f\x01\x04\x19\x0f\x13\x12\x08\x12\x00\x12\x02\x15\x03\x12\x02\x15'
+        b'\x06\x15\x06\x12\x02\x15\x0f\x17\x14\x14\x04\x1e\x02\x1f\x00\x08\x16\x08\x13\x02\x12\x05\x16\x08'
+        b'\x16\x05\x12\x02\x13\x08\x1f\x01\x04\x19\x0f\x13\x12\x08\x12\x00\x12\x02\x15\x03\x12\x02\x15\x06'
+        b'\x15\x06\x12\x02\x15\x0f\x17\x14\x14\x04\x1e\x02\x1f\x00\x08\x16\x08\x13\x02\x12\x05\x16\x08\x16'
+        b'\x05\x12\x02\x13\x08\x1f\x01\x04\x19\x0f\x13\x12\x08\x12\x00\x12\x02\x15\x03\x12\x02\x15\x06\x15'
+        b'\x06\x12\x02\x15\x0f\x17\x14\x14\x04\x1e\x02\x1f\x1d\x02\x1f\x19\x02\x1f\x0e\x04\x19\x0f\x13\x12'
+        b'\x08\x12\x00\x12\x0fP\x14\x14\x04\x1e\x02\x1f\x1d\x02\x1f\x19\x02\x1f\x0e\x04\x19\x0f\x13\x12'
+        b'\x08\x12\x00\x12\x0fP\x14\x14\x04\x1e\x02\x1f\x1d\x02\x1f\x19\x02\x1f\x0e\x04\x19\x0f\x13\x12'
+        b'\x08\x12\x00\x12\x0fP\x14\x14\x04\x1e\x0e\x1f\x11\x02\x1f\x19\x02\x1f\x0e\x04\x19\x0f\x16\x18'
+        b'\x03\x12\x0f\x13\x12\x0f*\x14\x14\x04\x1e\x0e\x1f\x11\x02\x1f\x19\x02\x1f\x0e\x04\x19\x0f\x16'
+        b'\x18\x03\x12\x0f\x13\x12\x0f*\x14\x14\x04\x1e\x0e\x1f\x11\x02\x1f\x19\x02\x1f\x0e\x04\x19\x0f'
+        b'\x16\x18\x03\x12\x0f\x13\x12\x0f*\x14\x14\x04\x1f|\x04\x19\x0f\x86\x14\x14\x04\x1f|\x04'
+        b'\x19\x0f\x86\x14\x14\x04\x1f|\x04\x19\x0f\x86\x14\x14\x04\x1f|\x04\x19\x0f\x86\x14\x14\x04'
+        b'\x1f|\x04\x19\x0f\x86\x14\x14\x04\x1f|\x04\x19\x0f\x86\x14\x14\x04\x1f|\x04\x19\x0f\x86'
+        b'\x14\x14\x04\x1f|\x04\x19\x0f\x86\x14\x14\x04\x1f|\x04\x19\x0f\x86\x14\x14\x04\x1f|\x04'
+        b'\x19\x0f\x86\x14\x14\x04\x1f|\x04\x19\x0f\x86\x14\x14\x04\x1f|\x04\x19\x0f\x86\x14\x14\x04'
+        b'\x1f|\x04\x19\x0f\x86\x14\x14\x04\x1f|\x04\x19\x0f\x86\x14\x14\x04\x1f|\x04\x19\x0f\x86'
+        b'\x14\x14\x04\x1f|\x04\x19\x0f\x86\x14\x14\x04\x1f|\x04\x19\x0f\x86\x14\x14\x04\x1f|\x04'
+        b'\x19\x0f\x86\x14\x14\x04\x1f|\x04\x19\x0f\x86\x14\x14\x04\x1f|\x04\x19\x0f\x86\x14\x14\x04'
+        b'\x1f|\x04\x19\x0f\x86\x14\x14\x0f\x86\x19\x0f\x86\x14\x14\x0f\x86\x19\x0f\x86\x14\x14\x0f\x86'
+        b'\x19\x0f\x86\x14\x14\x0f\x86\x19\x0f\x86\x14\x14\x0f\x86\x19\x0f\x86\x14\x1f\xff\x1f!\x1f\xff'
+        b'\x1f!\x1f\xff\x1f!\x1f\xff\x1f!\x1f\xff\x1f!'
+    ),
+)
@@ -0,0 +1,146 @@
+"""
+Touch Widget Table
+
+Features:
+- Declarative buttons: rectangle, colors, label, renderers and command
+- O(1) hit-testing through a grid index precomputed when widgets are added
+- Generic press/release dispatch, tracking the widget being held
+
+Renderer Signature:
+    renderer(widget, ctx) -> command or None
+    ctx is any object the application passes to press()/release()
+    (display, colors, state...). The value returned by the released
+    renderer is handed back to the caller, typically widget.command.
+"""
+
+
+class Button:
+    """
+    Rectangular touch widget.
+
+    Attributes:
+        x, y, w, h: Rectangle in screen coordinates
+        label: Text shown on the button
+        colors: Color tuple used by the renderers
+        pressed: Renderer called when the touch starts on the button
+        released: Renderer called when the touch ends
+        command: Value the released renderer usually returns
+        data: Free application data
+        active: True while the button is being held
+    """
+
+    def __init__(self, x, y, w, h, label='', colors=(), pressed=None, released=None,
+                 command=None, data=None):
+        self.x = x
+        self.y = y
+        self.w = w
+        self.h = h
+        self.label = label
+        self.colors = colors
+        self.pressed = pressed
+        self.released = released
+        self.command = command
+        self.data = data
+        self.active = False
+
+    def contains(self, x, y):
+        """Check if a point lies inside the button rectangle"""
+        return self.x <= x < self.x + self.w and self.y <= y < self.y + self.h
+
+
+class WidgetTable:
+    """
+    Registry of widgets with a spatial index for hit-testing.
+
+    The screen is divided in square cells; each cell keeps the tuple of
+    widgets overlapping it, so a touch costs one list lookup plus a
+    rectangle check on the (usually single) candidate.
+    """
+
+    def __init__(self, width=320, height=240, cell=40):
+        """
+        Initialize an empty table.
+
+        Args:
+            width: Screen width in pixels
+            height: Screen height in pixels
+            cell: Side of the index cells in pixels (pick a divisor of
+                  the layout pitch so most cells hold one widget)
+        """
+        self.width = width
+        self.height = height
+        self._cell = cell
+        self._cols = (width + cell - 1) // cell
+        self._rows = (height + cell - 1) // cell
+        self._cells = [()] * (self._cols * self._rows)
+        self.widgets = []
+        self.active = None
+
+    def add(self, widget):
+        """
+        Register a widget and index the cells it overlaps.
+
+        Returns:
+            The widget, to allow keeping a reference in one line
+        """
+        cell = self._cell
+        c0 = max(0, widget.x // cell)
+        c1 = min(self._cols - 1, (widget.x + widget.w - 1) // cell)
+        r0 = max(0, widget.y // cell)
+        r1 = min(self._rows - 1, (widget.y + widget.h - 1) // cell)
+        for r in range(r0, r1 + 1):
+            for c in range(c0, c1 + 1):
+                i = r * self._cols + c
+                self._cells[i] = self._cells[i] + (widget,)
+        self.widgets.append(widget)
+        return widget
+
+    def hit(self, x, y):
+        """
+        Find the widget under a point.
+
+        Returns:
+            The first registered widget containing (x, y), or None
+        """
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return None
+        for widget in self._cells[(y // self._cell) * self._cols + x // self._cell]:
+            if widget.contains(x, y):
+                return widget
+        return None
+
+    def press(self, x, y, ctx=None):
+        """
+        Dispatch the start of a touch.
+
+        Calls the pressed renderer of the widget under (x, y), unless it
+        is already being held.
+
+        Returns:
+            The pressed widget, or None if nothing was hit
+        """
+        widget = self.hit(x, y)
+        if widget is None or widget.active:
+            return None
+        widget.active = True
+        self.active = widget
+        if widget.pressed:
+            widget.pressed(widget, ctx)
+        return widget
+
+    def release(self, ctx=None):
+        """
+        Dispatch the end of a touch to the held widget.
+
+        Returns:
+            Whatever the released renderer returns (None if no widget
+            was held or it has no renderer)
+        """
+        widget = self.active
+        if widget is None:
+            return None
+        widget.active = False
+        self.active = None
+        if widget.released:
+            return widget.released(widget, ctx)
+        return None
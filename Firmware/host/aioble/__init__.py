@@ -0,0 +1,196 @@
+"""
+Host stand-in for the aioble client API used by main.py
+
+Connects to the BLE peripherals in emulator.radio. GATT procedures
+(discovery, MTU exchange, writes) take whole connection intervals of
+virtual time and are logged on the 'gatt' bus.
+"""
+
+import asyncio
+
+import bluetooth
+import emulator
+
+from .client import ClientCharacteristic, ClientDescriptor, ClientService, GattError  # noqa: F401
+
+
+class DeviceDisconnectedError(Exception):
+    pass
+
+
+def config(*args, **kwargs):
+    return bluetooth.BLE().config(*args, **kwargs)
+
+
+def _intervals(n):
+    return asyncio.sleep(n * emulator.CONNECTION_INTERVAL_MS / 1000)
+
+
+class Device:
+    ADDR_PUBLIC = 0
+    ADDR_RANDOM = 1
+
+    def __init__(self, addr_type, addr, peripheral=None):
+        self.addr_type = addr_type
+        self.addr = addr
+        self._peripheral = peripheral
+
+    def __eq__(self, other):
+        return isinstance(other, Device) and self.addr == other.addr
+
+    def __hash__(self):
+        return hash(self.addr)
+
+    def __repr__(self):
+        return "Device({}, {})".format(self.addr_type, self.addr.hex(':'))
+
+    def _find(self):
+        if self._peripheral is None:
+            for peripheral in emulator.radio:
+                if peripheral.addr == self.addr:
+                    self._peripheral = peripheral
+        return self._peripheral
+
+    async def connect(self, timeout_ms=10000):
+        peripheral = self._find()
+        if peripheral is None or not peripheral.available:
+            await asyncio.sleep(timeout_ms / 1000)
+            raise asyncio.TimeoutError
+        # Wait for the next advertisement, then the connection request
+        await asyncio.sleep(emulator.ADVERTISING_INTERVAL_MS / 2000)
+        await _intervals(1)
+        emulator.log.record('gatt', 'connect', 0, emulator.ADVERTISING_INTERVAL_MS * 500
+                            + emulator.CONNECTION_INTERVAL_MS * 1000, blocking=False)
+        connection = DeviceConnection(self, peripheral)
+        peripheral.attach(connection)
+        return connection
+
+
+class DeviceConnection:
+    # conn_handle -> connection, as in aioble (the bluetooth shim routes gattc_* calls through it)
+    _connected = {}
+    _next_handle = 64
+
+    def __init__(self, device, peripheral):
+        self.device = device
+        self._peripheral = peripheral
+        self._conn_handle = DeviceConnection._next_handle
+        DeviceConnection._next_handle += 1
+        DeviceConnection._connected[self._conn_handle] = self
+        self._link = True
+        self._disconnected = asyncio.Event()
+        self._characteristics = {}
+        self.mtu = 23
+
+    def is_connected(self):
+        return self._link
+
+    def _check(self):
+        if not self._link:
+            raise DeviceDisconnectedError
+
+    def _lost(self):
+        self._link = False
+        DeviceConnection._connected.pop(self._conn_handle, None)
+        self._disconnected.set()
+        self._peripheral.detach()
+
+    def _register(self, characteristic):
+        self._characteristics[characteristic._value_handle] = characteristic
+
+    def _notify(self, value_handle, data):
+        characteristic = self._characteristics.get(value_handle)
+        if characteristic is None:
+            return
+        loop = asyncio.get_running_loop()
+        loop.call_later(emulator.CONNECTION_INTERVAL_MS / 1000, characteristic._deliver, data)
+        emulator.log.record('gatt', 'notify', len(data), emulator.CONNECTION_INTERVAL_MS * 1000, blocking=False)
+
+    def _write_descriptor(self, handle, data, response):
+        """Descriptor write reaching the peripheral (logged, the caller waits if it wants to)"""
+        self._check()
+        emulator.log.record('gatt', 'descriptor', len(data),
+                            (2 if response else 1) * emulator.CONNECTION_INTERVAL_MS * 1000, blocking=False)
+        self._peripheral.write_descriptor(handle, data)
+
+    async def _procedure(self, name, intervals, nbytes=0):
+        self._check()
+        await _intervals(intervals)
+        self._check()
+        emulator.log.record('gatt', name, nbytes, intervals * emulator.CONNECTION_INTERVAL_MS * 1000,
+                            blocking=False)
+
+    async def service(self, uuid, timeout_ms=2000):
+        await self._procedure('discover', 2)
+        peripheral = self._peripheral
+        if bluetooth.UUID(peripheral.SERVICE_UUID) != uuid:
+            return None
+        start, end = peripheral.handles[:2]
+        return ClientService(self, start, end, uuid)
+
+    async def exchange_mtu(self, mtu=None, timeout_ms=1000):
+        await self._procedure('mtu', 1)
+        if mtu:
+            self.mtu = min(mtu, self._peripheral.mtu)
+        return self.mtu
+
+    async def disconnected(self, timeout_ms=60000, disconnect=False):
+        if disconnect:
+            await self.disconnect()
+        if timeout_ms:
+            await asyncio.wait_for(self._disconnected.wait(), timeout_ms / 1000)
+        else:
+            await self._disconnected.wait()
+
+    async def disconnect(self, timeout_ms=2000):
+        if self._link:
+            await _intervals(1)
+            self._lost()
+
+
+class ScanResult:
+    def __init__(self, peripheral, active):
+        self.device = Device(Device.ADDR_PUBLIC, peripheral.addr, peripheral)
+        self.rssi = peripheral.rssi
+        self._peripheral = peripheral
+        self._active = active
+
+    def name(self):
+        # The ESP32 sends its name in the scan response when it advertises the service UUID
+        peripheral = self._peripheral
+        if peripheral.advertises_uuid and not self._active:
+            return None
+        return peripheral.name
+
+    def services(self):
+        if self._peripheral.advertises_uuid:
+            yield bluetooth.UUID(self._peripheral.SERVICE_UUID)
+
+
+class scan:
+    def __init__(self, duration_ms, interval_us=1280000, window_us=11250, active=False):
+        self._duration_ms = duration_ms
+        self._active = active
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+    def __aiter__(self):
+        return self._results()
+
+    async def _results(self):
+        elapsed = 0
+        step = emulator.ADVERTISING_INTERVAL_MS
+        while elapsed < self._duration_ms:
+            await asyncio.sleep(step / 1000)
+            elapsed += step
+            for peripheral in list(emulator.radio):
+                if peripheral.available and peripheral.connection is None:
+                    emulator.log.record('gatt', 'advertisement', 31, 0, blocking=False)
+                    yield ScanResult(peripheral, self._active)
+
+    async def cancel(self):
+        pass
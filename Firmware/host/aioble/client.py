@@ -0,0 +1,114 @@
+"""Host stand-in for aioble.client (services and characteristics)"""
+
+import asyncio
+
+import bluetooth
+import emulator
+
+
+class GattError(Exception):
+    def __init__(self, status=0):
+        self._status = status
+
+
+class ClientService:
+    def __init__(self, connection, start_handle, end_handle, uuid):
+        self.connection = connection
+        self._start_handle = start_handle
+        self._end_handle = end_handle
+        self.uuid = uuid
+
+    async def characteristic(self, uuid, timeout_ms=2000):
+        connection = self.connection
+        await connection._procedure('discover', 2)
+        peripheral = connection._peripheral
+        if bluetooth.UUID(peripheral.CHAR_UUID) != uuid:
+            return None
+        _, _, end, value, properties = peripheral.handles
+        return ClientCharacteristic(self, end, value, properties, uuid)
+
+
+class ClientCharacteristic:
+    def __init__(self, service, end_handle, value_handle, properties, uuid):
+        self.service = service
+        self.connection = service.connection
+        self._end_handle = end_handle
+        self._value_handle = value_handle
+        self.properties = properties
+        self.uuid = uuid
+        self._value = None
+        self._event = asyncio.Event()
+
+    def _check_handles(self):
+        peripheral = self.connection._peripheral
+        if (self.service._start_handle, self.service._end_handle, self._end_handle,
+                self._value_handle) != peripheral.handles[:4]:
+            raise GattError(0x01)  # invalid handle
+
+    async def write(self, data, response=False, timeout_ms=1000):
+        connection = self.connection
+        connection._check()
+        self._check_handles()
+        data = bytes(data)
+        if len(data) > connection.mtu - 3:
+            raise GattError(0x0D)  # invalid attribute value length
+        # The peripheral gets it at the next connection event; the response comes one event later
+        await asyncio.sleep(emulator.CONNECTION_INTERVAL_MS / 1000)
+        connection._check()
+        emulator.log.record('gatt', 'write', len(data),
+                            (2 if response else 1) * emulator.CONNECTION_INTERVAL_MS * 1000, blocking=False)
+        connection._peripheral.receive(data)
+        if response:
+            await asyncio.sleep(emulator.CONNECTION_INTERVAL_MS / 1000)
+            connection._check()
+
+    def _register_with_connection(self):
+        self.connection._register(self)
+
+    async def descriptor(self, uuid, timeout_ms=2000):
+        connection = self.connection
+        await connection._procedure('discover', 2)
+        self._check_handles()
+        if uuid != bluetooth.UUID(0x2902) or not self.properties & bluetooth.FLAG_NOTIFY:
+            return None
+        return ClientDescriptor(self, connection._peripheral.cccd_handle, uuid)
+
+    async def subscribe(self, notify=True, indicate=False):
+        # Descriptor discovery, then the CCCD write
+        self._register_with_connection()
+        cccd = await self.descriptor(bluetooth.UUID(0x2902))
+        if cccd is None:
+            raise ValueError("CCCD not found")
+        await cccd.write(b'\x01\x00' if notify else b'\x00\x00', True)
+
+    def _deliver(self, data):
+        # aioble keeps only the most recent notification
+        self._value = data
+        self._event.set()
+
+    async def notified(self, timeout_ms=None):
+        self.connection._check()
+        self.connection._register(self)
+        if self._value is None:
+            self._event.clear()
+            if timeout_ms:
+                await asyncio.wait_for(self._event.wait(), timeout_ms / 1000)
+            else:
+                await self._event.wait()
+        data, self._value = self._value, None
+        return data
+
+
+class ClientDescriptor:
+    def __init__(self, characteristic, dsc_handle, uuid):
+        self.characteristic = characteristic
+        self.connection = characteristic.connection
+        self._value_handle = dsc_handle
+        self.uuid = uuid
+
+    async def write(self, data, response=False, timeout_ms=1000):
+        connection = self.connection
+        connection._check()
+        await asyncio.sleep((2 if response else 1) * emulator.CONNECTION_INTERVAL_MS / 1000)
+        connection._check()
+        connection._write_descriptor(self._value_handle, bytes(data), response)
@@ -0,0 +1,302 @@
+"""
+Host Benchmarks
+
+Runs the Pico controller stack on the emulator and reports, for each
+case, the bytes and transactions per bus/device, the simulated time
+(bus and radio floor, see emulator.py) and the host wall-clock time.
+
+Cases:
+- lcd_fill: full-screen ILI9341 fill
+- text_s1 / text_s3: a line of text at scales 1 and 3, with a cold and a
+  warm glyph cache
+- montar_botoes: the button grid drawn directly on the driver, and on the
+  Canvas followed by flush(), from the prebuilt screen assets
+  (ui_assets.py) and with the fill/text calls (_procedural)
+- glyph_cycle_direct_<bytes>: the button grid drawn on the driver with
+  the fill/text calls, then every button pressed and released, with a
+  warm glyph cache of the default budget and of GLYPH_CYCLE_CACHE_BYTES
+  (reports its hit rate)
+- recolor_canvas: one rainbow tick on the button grid (Canvas.recolor of
+  the primary color, then flush())
+- touch_read_point / touch_read: burst and legacy touch sampling
+- touch_to_ble: end-to-end latency from finger down/up to the GATT write
+  reaching the arm, with the real main.py tasks
+
+Usage:
+    python3 Firmware/host/bench.py [--png DIR] [--json FILE] [--repeat N]
+
+--png saves the emulated LCD and OLED contents after the latency run
+(lcd.png, oled.png) and --json writes the results to use as a baseline.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import emulator  # noqa: E402
+
+emulator.install()
+
+import uasyncio as asyncio  # noqa: E402
+
+import main  # noqa: E402
+
+TEXT = 'BitArm 0123456789'
+
+
+def measure(name, fn, repeat=1):
+    """
+    Run fn repeat times and collect the bus activity it caused.
+
+    Returns:
+        dict with the case name, totals and per bus/device breakdown
+        (averaged per run)
+    """
+    log = emulator.log
+    mark = log.mark()
+    start_us = emulator.clock.now_us
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    wall_ms = (time.perf_counter() - start) * 1000
+    buses = {}
+    for (bus, device), (nbytes, transactions, us) in sorted(log.summary(mark).items()):
+        buses['{}/{}'.format(bus, device)] = {
+            'bytes': nbytes // repeat,
+            'transactions': transactions // repeat,
+            'bus_ms': us / repeat / 1000,
+        }
+    return {
+        'name': name,
+        'runs': repeat,
+        'sim_ms': (emulator.clock.now_us - start_us) / repeat / 1000,
+        'wall_ms': wall_ms / repeat,
+        'buses': buses,
+    }
+
+
+def setup():
+    """Fresh board with the LCD and touch initialized by main.init()"""
+    board = emulator.install()
+    with contextlib.redirect_stdout(io.StringIO()):
+        tela, touch, bus = main.init(main.BRANCO, main.PRETO)
+    return board, tela, touch, bus
+
+
+def bench_display(repeat):
+    _, tela, _, _ = setup()
+    lcd = tela.display
+    results = [measure('lcd_fill', lambda: lcd.fill(main.PRETO), repeat)]
+    for scale in (1, 3):
+        def cold():
+            lcd.clear_glyph_cache()
+            lcd.text(TEXT, 0, 0, fg_color=main.BRANCO, bg_color=main.PRETO, scale=scale)
+        results.append(measure('text_s{}_cold'.format(scale), cold, repeat))
+        results.append(measure('text_s{}_warm'.format(scale),
+                               lambda: lcd.text(TEXT, 0, 0, fg_color=main.BRANCO, bg_color=main.PRETO,
+                                                scale=scale),
+                               repeat))
+    results.append(measure('montar_botoes_direct',
+                           lambda: main.montar_botoes(main.BRANCO, main.PRETO, lcd), repeat))
+    telas, main.telas = main.telas, None
+    results.append(measure('montar_botoes_direct_procedural',
+                           lambda: main.montar_botoes(main.BRANCO, main.PRETO, lcd), repeat))
+    main.telas = telas
+
+    def canvas():
+        # Alternate the colors so every run has the whole grid to send
+        main.montar_botoes(main.BRANCO, main.PRETO, tela)
+        tela.flush()
+        main.montar_botoes(main.PRETO, main.BRANCO, tela)
+        tela.flush()
+    result = measure('montar_botoes_canvas', canvas, repeat)
+    result['runs'] *= 2
+    result['sim_ms'] /= 2
+    result['wall_ms'] /= 2
+    for totals in result['buses'].values():
+        totals['bytes'] //= 2
+        totals['transactions'] //= 2
+        totals['bus_ms'] /= 2
+    results.append(result)
+
+    main.montar_botoes(main.BRANCO, main.PRETO, tela)
+    tela.flush()
+    colors = [main.BRANCO, 0x1234]
+
+    def recolor():
+        tela.recolor(colors[0], colors[1])
+        colors.reverse()
+        tela.flush()
+    results.append(measure('recolor_canvas', recolor, repeat))
+    return results
+
+
+# Glyph cache budget holding every scale-3 glyph of the button interface (53 of 720 B)
+GLYPH_CYCLE_CACHE_BYTES = 40960
+
+
+def bench_glyph_cycle(repeat):
+    import machine
+    from ili9341 import ILI9341
+    _, _, _, bus = setup()
+    oled = main.init_bitdog()[4]
+    tabela, _ = main.criar_botoes()
+    telas, main.telas = main.telas, None
+    results = []
+    for budget in (ILI9341.GLYPH_CACHE_BYTES, GLYPH_CYCLE_CACHE_BYTES):
+        lcd = ILI9341(bus.device('lcd', main.LCD_BAUDRATE), dc=machine.Pin(20), cs=machine.Pin(17),
+                      WIDTH=320, HEIGHT=240, rst=None, glyph_cache_bytes=budget)
+        calls = [0, 0]
+        glyph, rasterize = lcd._glyph, lcd._rasterize_glyph
+
+        def counted_glyph(*args):
+            calls[0] += 1
+            return glyph(*args)
+
+        def counted_rasterize(*args):
+            calls[1] += 1
+            return rasterize(*args)
+        lcd._glyph, lcd._rasterize_glyph = counted_glyph, counted_rasterize
+
+        def cycle():
+            ctx = main.Contexto(lcd, main.Status(oled))
+            main.montar_botoes(ctx.branco, main.PRETO, lcd)
+            main.abrir(ctx.branco, main.PRETO, lcd)
+            for button in tabela.widgets:
+                tabela.press(button.x + button.w // 2, button.y + button.h // 2, ctx)
+                tabela.release(ctx)
+        with contextlib.redirect_stdout(io.StringIO()):
+            cycle()
+            calls[:] = [0, 0]
+            result = measure('glyph_cycle_direct_{}'.format(budget), cycle, repeat)
+        result['glyph_hits'] = calls[0] - calls[1]
+        result['glyph_calls'] = calls[0]
+        result['glyph_cache_bytes'] = budget
+        results.append(result)
+    main.telas = telas
+    return results
+
+
+def bench_touch(repeat):
+    board, _, touch, _ = setup()
+    board['touch'].press(200, 120)
+    return [measure('touch_read_point', touch.read_point, repeat),
+            measure('touch_read', touch.read, repeat)]
+
+
+# Center of each button touched by the latency case, with its command
+PRESSES = [(40, 40, '0'), (280, 120, '7'), (80, 200, '8'), (240, 200, '9')]
+HOLD_MS = 100
+WRITE_TIMEOUT_MS = 5000
+
+
+async def _touch_to_ble(board, events):
+    arm, touch = board['arm'], board['touch']
+    led_r, led_g, led_b, alto_falante, oled = main.init_bitdog()
+    animador = main.Animador(main.Matriz())
+    efeitos = main.Efeitos(led_r, led_g, led_b, alto_falante, animador)
+    status = main.Status(oled)
+    sender = main.BLE_Sender("Touch-Interface")
+    if not await sender.conectar():
+        raise RuntimeError("emulated arm not found")
+    display, touch_drv, bus = main.init(main.BRANCO, main.PRETO)
+    tabela, fechar_btn = main.criar_botoes()
+    ctx = main.Contexto(display, status)
+    comandos = main.Fila()
+    eventos = main.Fila()
+    fim = asyncio.Event()
+    tarefas = [asyncio.create_task(status.tarefa()),
+               asyncio.create_task(animador.tarefa()),
+               asyncio.create_task(main.tarefa_ble(sender, comandos, efeitos, status)),
+               asyncio.create_task(main.tarefa_touch(touch_drv, bus, eventos)),
+               asyncio.create_task(main.tarefa_ui(tabela, fechar_btn, ctx, bus, eventos, comandos, fim))]
+    for px, py, command in PRESSES:
+        n = len(arm.writes)
+        pressed_us = emulator.clock.now_us
+        touch.press(px, py)
+        await asyncio.sleep_ms(HOLD_MS)
+        released_us = emulator.clock.now_us
+        touch.release()
+        waited_ms = 0
+        while len(arm.writes) == n:
+            await asyncio.sleep_ms(1)
+            waited_ms += 1
+            if waited_ms > WRITE_TIMEOUT_MS:
+                raise RuntimeError("no GATT write for command {} (did a task crash?)".format(command))
+        written_us = arm.writes[-1][0]
+        events.append({'command': command, 'press_to_write_ms': (written_us - pressed_us) / 1000,
+                       'release_to_write_ms': (written_us - released_us) / 1000})
+        # Let the move finish so the next command is sent right away
+        while arm.planner.ativo:
+            await asyncio.sleep_ms(10)
+        await asyncio.sleep_ms(200)
+    for tarefa in tarefas:
+        tarefa.cancel()
+    await sender.desconectar()
+
+
+def bench_touch_to_ble(png_dir=None):
+    board = emulator.install()
+    events = []
+    log = emulator.log
+    mark = log.mark()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        asyncio.run(_touch_to_ble(board, events))
+    wall_ms = (time.perf_counter() - start) * 1000
+    if png_dir:
+        os.makedirs(png_dir, exist_ok=True)
+        board['lcd'].save_png(os.path.join(png_dir, 'lcd.png'))
+        board['oled'].save_png(os.path.join(png_dir, 'oled.png'))
+    buses = {}
+    for (bus, device), (nbytes, transactions, us) in sorted(log.summary(mark).items()):
+        buses['{}/{}'.format(bus, device)] = {'bytes': nbytes, 'transactions': transactions, 'bus_ms': us / 1000}
+    press = [e['press_to_write_ms'] for e in events]
+    release = [e['release_to_write_ms'] for e in events]
+    return [{
+        'name': 'touch_to_ble',
+        'runs': len(events),
+        'sim_ms': sum(release) / len(release),
+        'wall_ms': wall_ms,
+        'press_to_write_ms': press,
+        'release_to_write_ms': release,
+        'buses': buses,
+    }]
+
+
+def report(results):
+    for r in results:
+        print("{:<32} {:>9.3f} ms sim  {:>9.3f} ms host  ({} runs)".format(
+            r['name'], r['sim_ms'], r['wall_ms'], r['runs']))
+        if 'press_to_write_ms' in r:
+            print("    press->write   ms: " + " ".join("{:.1f}".format(v) for v in r['press_to_write_ms']))
+            print("    release->write ms: " + " ".join("{:.1f}".format(v) for v in r['release_to_write_ms']))
+        if 'glyph_calls' in r:
+            print("    glyph cache hits: {}/{} ({:.0f}%), budget {} B".format(
+                r['glyph_hits'], r['glyph_calls'], 100 * r['glyph_hits'] / r['glyph_calls'], r['glyph_cache_bytes']))
+        for name, t in r['buses'].items():
+            print("    {:<18} {:>8} B {:>6} tx {:>9.3f} ms".format(name, t['bytes'], t['transactions'], t['bus_ms']))
+
+
+def run(repeat=5, png_dir=None):
+    results = bench_display(repeat) + bench_glyph_cycle(repeat) + bench_touch(repeat * 20) + bench_touch_to_ble(png_dir)
+    return results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmark the Pico stack on the host emulator")
+    parser.add_argument('--png', metavar='DIR', help="save lcd.png and oled.png here")
+    parser.add_argument('--json', metavar='FILE', help="write the results as JSON")
+    parser.add_argument('--repeat', type=int, default=5, help="runs per display case (touch uses 20x)")
+    args = parser.parse_args()
+    results = run(args.repeat, args.png)
+    report(results)
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
@@ -0,0 +1,65 @@
+"""Host stand-in for the MicroPython bluetooth module"""
+
+FLAG_BROADCAST = 0x0001
+FLAG_READ = 0x0002
+FLAG_WRITE_NO_RESPONSE = 0x0004
+FLAG_WRITE = 0x0008
+FLAG_NOTIFY = 0x0010
+FLAG_INDICATE = 0x0020
+
+
+class UUID:
+    def __init__(self, value):
+        if isinstance(value, UUID):
+            value = value._value
+        if isinstance(value, str):
+            value = value.lower()
+        self._value = value
+
+    def __eq__(self, other):
+        return isinstance(other, UUID) and self._value == other._value
+
+    def __hash__(self):
+        return hash(self._value)
+
+    def __str__(self):
+        return self._value if isinstance(self._value, str) else '0x{:04x}'.format(self._value)
+
+    def __repr__(self):
+        return "UUID('{}')".format(self)
+
+
+class BLE:
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = object.__new__(cls)
+            cls._instance._active = False
+            cls._instance._config = {'mtu': 23, 'gap_name': 'MPY'}
+        return cls._instance
+
+    def active(self, state=None):
+        if state is not None:
+            self._active = bool(state)
+        return self._active
+
+    def config(self, *args, **kwargs):
+        if args:
+            return self._config.get(args[0])
+        self._config.update(kwargs)
+
+    def irq(self, handler):
+        self._irq = handler
+
+    def gattc_write(self, conn_handle, value_handle, data, mode=0):
+        # Only descriptor writes go through here (main.py writes the cached CCCD); the peripheral gets it at the next
+        # connection event
+        import asyncio
+        import emulator
+        from aioble import DeviceConnection
+        connection = DeviceConnection._connected.get(conn_handle)
+        if connection is None:
+            raise OSError(107)  # ENOTCONN
+        asyncio.get_running_loop().call_later(emulator.CONNECTION_INTERVAL_MS / 1000, connection._write_descriptor,
+                                              value_handle, bytes(data), mode == 1)
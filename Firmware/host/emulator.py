@@ -0,0 +1,652 @@
+"""
+Host Emulator Core
+
+Runs the Pico controller stack (main.py and the drivers in external/libs)
+under CPython, against emulated peripherals.
+
+Features:
+- Virtual clock shared by utime/time, the uasyncio shim and the buses:
+  sleeps and transfers advance it, nothing waits in real time
+- Transaction log for SPI, I2C, GATT and NeoPixel traffic, with the
+  simulated duration of each transfer computed from the configured
+  baudrate
+- Peripheral models: ILI9341 panel (decodes CASET/RASET/RAMWR into a
+  RGB565 framebuffer), TSC2046 touch (answers burst and single reads for
+  a simulated finger), SSD1306 OLED (decodes windows into its GDDRAM) and
+  the BitArm ESP32 (binary and legacy protocols, driven by the Python
+  reference planner in Arm/trajetoria.py)
+- PNG export of the LCD and OLED contents for regression checks
+
+Timing Model:
+    SPI:  SPI_CALL_US + 8 * nbytes / baudrate
+    I2C:  I2C_CALL_US + 9 * (nbytes + 1) / freq   (address byte + ACKs)
+    GATT: a write with response takes two connection intervals, a
+          notification is delivered one interval after it is sent
+    CPU time spent by Python code is not modeled; the simulated times are
+    the bus/radio floor of each operation.
+
+Usage:
+    import emulator
+    emulator.install()          # shim paths, time patch, BitDogLab board
+    import main                 # main.py runs unchanged on the shims
+    mark = emulator.log.mark()
+    ...
+    print(emulator.log.summary(mark))
+"""
+
+import asyncio
+import math
+import os
+import selectors
+import struct
+import sys
+import time
+import zlib
+
+HOST_DIR = os.path.dirname(os.path.abspath(__file__))
+FIRMWARE_DIR = os.path.dirname(HOST_DIR)
+REPO_DIR = os.path.dirname(FIRMWARE_DIR)
+LIBS_DIR = os.path.join(FIRMWARE_DIR, 'external', 'libs')
+ARM_DIR = os.path.join(REPO_DIR, 'Arm')
+
+# Timing estimates (tune against a logic analyser capture if needed)
+SPI_CALL_US = 2             # Python call + peripheral setup per SPI transfer
+I2C_CALL_US = 10            # start/stop conditions and call overhead
+CONNECTION_INTERVAL_MS = 30 # BLE connection interval negotiated with the ESP32
+ADVERTISING_INTERVAL_MS = 40
+NEOPIXEL_US_PER_LED = 30    # 24 bits at 800 kHz
+
+
+class Clock:
+    """
+    Virtual monotonic clock in microseconds.
+
+    Attributes:
+        now_us: Current simulated time
+    """
+
+    def __init__(self):
+        self.now_us = 0
+
+    def advance_us(self, us):
+        """Move the clock forward (never backwards)"""
+        if us > 0:
+            self.now_us += int(math.ceil(us))
+
+    def ms(self):
+        return self.now_us // 1000
+
+
+clock = Clock()
+
+
+class BusLog:
+    """
+    Record of every emulated bus transaction.
+
+    Each record is (bus, device, nbytes, duration_us, start_us).
+    """
+
+    def __init__(self):
+        self.records = []
+
+    def record(self, bus, device, nbytes, duration_us, blocking=True):
+        """
+        Log a transaction and, if it blocks the CPU, advance the clock.
+
+        Args:
+            bus: Bus name ('spi0', 'i2c1', 'gatt', ...)
+            device: Device name the transfer was addressed to
+            nbytes: Payload size in bytes
+            duration_us: Simulated transfer time
+            blocking: False for radio traffic that runs in the background
+        """
+        self.records.append((bus, device, nbytes, duration_us, clock.now_us))
+        if blocking:
+            clock.advance_us(duration_us)
+
+    def mark(self):
+        """Position to pass to summary() to only count later records"""
+        return len(self.records)
+
+    def summary(self, since=0):
+        """
+        Totals per (bus, device) since a mark.
+
+        Returns:
+            dict mapping (bus, device) to [nbytes, transactions, duration_us]
+        """
+        totals = {}
+        for bus, device, nbytes, duration_us, _ in self.records[since:]:
+            t = totals.setdefault((bus, device), [0, 0, 0])
+            t[0] += nbytes
+            t[1] += 1
+            t[2] += duration_us
+        return totals
+
+    def clear(self):
+        self.records = []
+
+
+log = BusLog()
+
+
+def spi_duration_us(nbytes, baudrate):
+    return SPI_CALL_US + nbytes * 8 * 1_000_000 / baudrate
+
+
+def i2c_duration_us(nbytes, freq):
+    return I2C_CALL_US + (nbytes + 1) * 9 * 1_000_000 / freq
+
+
+# ---------------------------------------------------------------------------
+# Board wiring: devices attached to buses and pins, looked up by the shims
+# ---------------------------------------------------------------------------
+
+pins = {}           # pin id -> machine.Pin
+spi_devices = {}    # SPI id -> [model]
+i2c_devices = {}    # address -> model
+radio = []          # BLE peripherals in range
+
+
+def pin_value(pin_id, default=1):
+    pin = pins.get(pin_id)
+    return default if pin is None else pin.value()
+
+
+def reset():
+    """Forget every device, pin and record and restart the clock"""
+    pins.clear()
+    spi_devices.clear()
+    i2c_devices.clear()
+    radio.clear()
+    log.clear()
+    clock.now_us = 0
+
+
+class ILI9341Panel:
+    """
+    ILI9341 model: decodes the command stream into a RGB565 framebuffer.
+
+    The framebuffer is kept in the driver's logical 320x240 coordinates.
+    rgb() returns what the glass shows: with MV set and only one of MX/MY
+    (LANDSCAPE_INV in ili9341.py) the frame appears mirrored top to
+    bottom, which is why the driver's font rows are stored upside down.
+    """
+
+    name = 'lcd'
+
+    def __init__(self, cs=17, dc=20, width=320, height=240):
+        self.cs = cs
+        self.dc = dc
+        self.width = width
+        self.height = height
+        self.framebuffer = bytearray(width * height * 2)
+        self.inverted = False
+        self.madctl = 0
+        self.commands = 0
+        self._cmd = None
+        self._args = bytearray()
+        self._window = (0, width - 1, 0, height - 1)
+        self._cursor = (0, 0)
+        self._pending = b''
+
+    def write(self, data):
+        if pin_value(self.dc) == 0:
+            for cmd in data:
+                self._command(cmd)
+        elif self._cmd == 0x2C:
+            self._pixels(bytes(data))
+        else:
+            self._args += data
+            if self._cmd in (0x2A, 0x2B) and len(self._args) >= 4:
+                start, end = struct.unpack('>HH', self._args[:4])
+                x0, x1, y0, y1 = self._window
+                if self._cmd == 0x2A:
+                    self._window = (start, end, y0, y1)
+                else:
+                    self._window = (x0, x1, start, end)
+            elif self._cmd == 0x36 and len(self._args) == 1:
+                self.madctl = self._args[0]
+
+    def exchange(self, tx, rx):
+        self.write(tx)
+        for i in range(len(rx)):
+            rx[i] = 0
+
+    def _command(self, cmd):
+        self.commands += 1
+        self._cmd = cmd
+        self._args = bytearray()
+        if cmd == 0x21:
+            self.inverted = True
+        elif cmd == 0x20:
+            self.inverted = False
+        elif cmd == 0x2C:
+            self._cursor = (self._window[0], self._window[2])
+            self._pending = b''
+
+    def _pixels(self, data):
+        if self._pending:
+            data = self._pending + data
+            self._pending = b''
+        if len(data) & 1:
+            self._pending = data[-1:]
+            data = data[:-1]
+        x0, x1, y0, y1 = self._window
+        x, y = self._cursor
+        fb = self.framebuffer
+        stride = self.width * 2
+        i = 0
+        n = len(data)
+        while i < n and y <= y1:
+            run = min(x1 - x + 1, (n - i) // 2)
+            if 0 <= y < self.height:
+                a = max(x, 0)
+                b = min(x + run, self.width)
+                if a < b:
+                    off = y * stride
+                    fb[off + a * 2:off + b * 2] = data[i + (a - x) * 2:i + (b - x) * 2]
+            i += run * 2
+            x += run
+            if x > x1:
+                x = x0
+                y += 1
+        self._cursor = (x, y)
+
+    def pixel(self, x, y):
+        """RGB565 value stored at (x, y)"""
+        i = (y * self.width + x) * 2
+        return (self.framebuffer[i] << 8) | self.framebuffer[i + 1]
+
+    def mirrored(self):
+        """True if the glass shows the frame mirrored top to bottom"""
+        m = self.madctl
+        return bool(m & 0x20) and bool(m & 0x80) != bool(m & 0x40)
+
+    def rgb(self):
+        """Visible image as RGB888 rows (inversion and mirroring applied like the glass does)"""
+        out = bytearray(self.width * self.height * 3)
+        fb = self.framebuffer
+        flip = 0xFFFF if self.inverted else 0
+        stride = self.width * 2
+        mirrored = self.mirrored()
+        j = 0
+        for y in range(self.height):
+            row = (self.height - 1 - y) if mirrored else y
+            for i in range(row * stride, (row + 1) * stride, 2):
+                v = ((fb[i] << 8) | fb[i + 1]) ^ flip
+                r = (v >> 11) & 0x1F
+                g = (v >> 5) & 0x3F
+                b = v & 0x1F
+                out[j] = (r << 3) | (r >> 2)
+                out[j + 1] = (g << 2) | (g >> 4)
+                out[j + 2] = (b << 3) | (b >> 2)
+                j += 3
+        return out
+
+    def save_png(self, path):
+        write_png(path, self.width, self.height, self.rgb())
+
+
+class TSC2046Touch:
+    """
+    TSC2046 model answering with the raw ADC values of a simulated finger.
+
+    press() takes screen pixels and converts them back to raw values with
+    the same calibration and axis swap main.py configures on the driver.
+    """
+
+    name = 'touch'
+    CMD_X = 0x90
+    CMD_Y = 0xD0
+    CMD_Z = 0xB0
+
+    def __init__(self, cs=9, calibration=(1880, 150, 270, 1830), screen=(320, 240, True)):
+        self.cs = cs
+        self.calibration = calibration
+        self.screen = screen
+        self.raw = None     # (x, y, z) while touched
+        self._last_cmd = None
+
+    def press(self, px, py, z=600):
+        """Touch the screen at pixel (px, py)"""
+        x_min, x_max, y_min, y_max = self.calibration
+        width, height, swap_xy = self.screen
+        if swap_xy:
+            y = y_max - (px + 0.5) * (y_max - y_min) / width
+            x = x_min + (py + 0.5) * (x_max - x_min) / height
+        else:
+            x = x_min + (px + 0.5) * (x_max - x_min) / width
+            y = y_max - (py + 0.5) * (y_max - y_min) / height
+        self.raw = (int(round(x)), int(round(y)), z)
+
+    def release(self):
+        self.raw = None
+
+    def _value(self, cmd):
+        if self.raw is None:
+            return 0
+        x, y, z = self.raw
+        return {self.CMD_X: x, self.CMD_Y: y, self.CMD_Z: z}.get(cmd, 0)
+
+    @staticmethod
+    def _encode(value, rx, i):
+        # The driver decodes ((b1 << 4) | (b2 >> 4)) & 0xFFF
+        rx[i] = (value >> 4) & 0xFF
+        rx[i + 1] = (value & 0x0F) << 4
+
+    def write(self, data):
+        if len(data):
+            self._last_cmd = data[-1]
+
+    def readinto(self, buf):
+        if len(buf) >= 2:
+            self._encode(self._value(self._last_cmd), buf, 0)
+
+    def exchange(self, tx, rx):
+        n = len(tx)
+        for i in range(len(rx)):
+            rx[i] = 0
+        i = 0
+        while i + 2 < n:
+            cmd = tx[i]
+            if cmd & 0x80:
+                self._encode(self._value(cmd), rx, i + 1)
+                i += 3
+            else:
+                i += 1
+
+
+class SSD1306Panel:
+    """SSD1306 model (horizontal addressing mode) keeping its GDDRAM"""
+
+    name = 'oled'
+
+    def __init__(self, addr=0x3C, width=128, height=64):
+        self.addr = addr
+        self.width = width
+        self.height = height
+        self.ram = bytearray(width * height // 8)
+        self._cols = (0, width - 1)
+        self._pages = (0, height // 8 - 1)
+        self._ptr = (0, 0)
+        self._pending = []
+
+    def i2c_write(self, data):
+        if not data:
+            return
+        control = data[0]
+        if control & 0x40:
+            self._data(data[1:])
+        else:
+            self._pending += list(data[1:])
+            self._commands()
+
+    def _commands(self):
+        p = self._pending
+        while p:
+            cmd = p[0]
+            if cmd in (0x21, 0x22):
+                if len(p) < 3:
+                    return
+                if cmd == 0x21:
+                    self._cols = (p[1], p[2])
+                else:
+                    self._pages = (p[1], p[2])
+                self._ptr = (self._pages[0], self._cols[0])
+                del p[:3]
+            elif cmd in (0x81, 0xA8, 0xD3, 0xDA, 0xD5, 0xD9, 0xDB, 0x8D, 0x20):
+                if len(p) < 2:
+                    return
+                del p[:2]
+            else:
+                del p[:1]
+
+    def _data(self, data):
+        page, col = self._ptr
+        for byte in data:
+            if 0 <= col < self.width and 0 <= page < self.height // 8:
+                self.ram[page * self.width + col] = byte
+            col += 1
+            if col > self._cols[1]:
+                col = self._cols[0]
+                page += 1
+                if page > self._pages[1]:
+                    page = self._pages[0]
+        self._ptr = (page, col)
+
+    def save_png(self, path):
+        rgb = bytearray(self.width * self.height * 3)
+        for y in range(self.height):
+            for x in range(self.width):
+                if (self.ram[(y >> 3) * self.width + x] >> (y & 7)) & 1:
+                    i = (y * self.width + x) * 3
+                    rgb[i:i + 3] = b'\xff\xff\xff'
+        write_png(path, self.width, self.height, rgb)
+
+
+class ArmPeripheral:
+    """
+    BitArm ESP32 as seen over BLE: advertises the command service, parses
+    binary v1 frames and legacy digits, and notifies progress from the
+    reference planner (Arm/trajetoria.py) stepped every 10 ms.
+
+    Attributes:
+        writes: (time_us, bytes) of every GATT write received
+        available: False to simulate the arm being out of range
+    """
+
+    SERVICE_UUID = '12345678-1234-5678-1234-56789abcdef0'
+    CHAR_UUID = 'abcdef01-2345-6789-abcd-0123456789ab'
+    PRESETS = [
+        (160, 130, 150, 90), (120, 130, 150, 90), (60, 130, 150, 90), (5, 130, 150, 90),
+        (160, 100, 120, 90), (120, 100, 120, 90), (60, 100, 120, 90), (5, 100, 120, 90),
+    ]
+    VELOCIDADE_GARRA = 180
+
+    def __init__(self, name='ESP32_BRAÇO_BLE', addr=b'\x24\x6f\x28\x01\x02\x03', rssi=-58,
+                 advertises_uuid=True, mtu=247):
+        if ARM_DIR not in sys.path:
+            sys.path.append(ARM_DIR)
+        import trajetoria
+        self._trajetoria = trajetoria
+        self.name = name
+        self.addr = addr
+        self.rssi = rssi
+        self.advertises_uuid = advertises_uuid
+        self.mtu = mtu
+        self.available = True
+        self.handles = (0x0028, 0x002D, 0x002D, 0x002A, 0x18)   # service start/end, char end/value, properties
+        self.cccd_handle = 0x002B
+        self.subscribed = False     # CCCD of the connected client (BLE2902 only notifies when it is set)
+        self.descriptor_writes = 0
+        self.planner = trajetoria.Planejador()
+        self.writes = []
+        self.connection = None
+        self._task = None
+
+    # Link management (called by the aioble shim)
+    def attach(self, connection):
+        self.connection = connection
+        self.subscribed = False
+        task = self._task
+        if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+            self._task = asyncio.ensure_future(self._run())
+
+    def detach(self):
+        self.connection = None
+
+    def drop_link(self):
+        """Simulate a radio drop seen by both sides"""
+        if self.connection is not None:
+            self.connection._lost()
+
+    async def _run(self):
+        t = self._trajetoria
+        while True:
+            await asyncio.sleep(t.PERIODO_CONTROLE_MS / 1000)
+            for notification in self.planner.atualizar(clock.ms()):
+                self._notify(notification)
+
+    def write_descriptor(self, handle, data):
+        """CCCD write from the client; other handles are ignored, like an invalid handle on the ESP32"""
+        self.descriptor_writes += 1
+        if handle == self.cccd_handle:
+            self.subscribed = bool(data[0] & 1)
+
+    def _notify(self, notification):
+        if self.connection is not None and self.subscribed:
+            self.connection._notify(self.handles[3], bytes(notification))
+
+    def receive(self, data):
+        """Process one GATT write, like processarComando() on the ESP32"""
+        t = self._trajetoria
+        self.writes.append((clock.now_us, bytes(data)))
+        now = clock.ms()
+        if data[0] == 0xA1:
+            if len(data) < 3:
+                self._notify((t.ERRO, 0, 0, 0, 0, 0, 0))
+                return
+            tipo, seq, p = data[1], data[2], data[3:]
+            if tipo == 0x01 and len(p) >= 7:
+                duracao = p[5] | (p[6] << 8)
+                perfil = p[7] if len(p) >= 8 else t.PERFIL_PADRAO
+                notes = self.planner.comandar(seq, [tuple(p[:4]) + (duracao,)], p[4], perfil, now)
+            elif tipo == 0x02 and len(p) >= 2 and len(p) >= 2 + 6 * p[0]:
+                waypoints = []
+                for i in range(p[0]):
+                    w = p[2 + 6 * i:8 + 6 * i]
+                    waypoints.append(tuple(w[:4]) + (w[4] | (w[5] << 8),))
+                notes = self.planner.comandar(seq, waypoints, p[1], t.PERFIL_PADRAO, now)
+            elif tipo == 0x03 and len(p) >= 1 and p[0] <= 9:
+                notes = self._preset(p[0], seq, now)
+            else:
+                notes = [(t.ERRO, seq) + tuple(int(round(a)) for a in self.planner.atual) + (0,)]
+        elif 0x30 <= data[0] <= 0x39:
+            notes = self._preset(data[0] - 0x30, 0, now)
+        else:
+            notes = [(t.ERRO, 0) + tuple(int(round(a)) for a in self.planner.atual) + (0,)]
+        for notification in notes:
+            self._notify(notification)
+
+    def _preset(self, idx, seq, now):
+        t = self._trajetoria
+        if idx <= 7:
+            return self.planner.comandar(seq, [self.PRESETS[idx] + (0,)], t.VELOCIDADE_PADRAO, t.PERFIL_PADRAO, now)
+        garra = 60 if idx == 8 else 120
+        m = t.ANGULO_MANTER
+        return self.planner.comandar(seq, [(m, m, m, garra, 0)], self.VELOCIDADE_GARRA, t.PERFIL_PADRAO, now)
+
+
+# ---------------------------------------------------------------------------
+# Virtual-time asyncio loop used by the uasyncio shim
+# ---------------------------------------------------------------------------
+
+class _VirtualSelector(selectors.DefaultSelector):
+    """Never blocks: a select() that would wait advances the virtual clock instead"""
+
+    def select(self, timeout=None):
+        ready = super().select(0)
+        if ready or timeout == 0:
+            return ready
+        if timeout is None:
+            raise RuntimeError("emulated program is blocked forever (no task can run)")
+        clock.advance_us(timeout * 1_000_000)
+        return []
+
+
+class VirtualLoop(asyncio.SelectorEventLoop):
+    def __init__(self):
+        super().__init__(_VirtualSelector())
+
+    def time(self):
+        return clock.now_us / 1_000_000
+
+
+def new_loop():
+    loop = VirtualLoop()
+    asyncio.set_event_loop(loop)
+    return loop
+
+
+def run(coro):
+    """Run a coroutine to completion on a fresh virtual-time loop"""
+    loop = new_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        for task in asyncio.all_tasks(loop):
+            task.cancel()
+        loop.run_until_complete(asyncio.sleep(0))
+        loop.close()
+
+
+# ---------------------------------------------------------------------------
+# Installation
+# ---------------------------------------------------------------------------
+
+def _patch_time():
+    """Add the MicroPython extensions of the time module to CPython's"""
+    time.ticks_us = lambda: clock.now_us
+    time.ticks_ms = lambda: clock.now_us // 1000
+    time.ticks_cpu = lambda: clock.now_us
+    time.ticks_diff = lambda a, b: a - b
+    time.ticks_add = lambda a, b: a + b
+    time.sleep_ms = lambda ms: clock.advance_us(ms * 1000)
+    time.sleep_us = lambda us: clock.advance_us(us)
+
+
+def board():
+    """
+    Wire the BitDogLab + touch LCD kit used by main.py.
+
+    Returns:
+        dict with the 'lcd', 'touch', 'oled' and 'arm' models
+    """
+    lcd = ILI9341Panel(cs=17, dc=20)
+    touch = TSC2046Touch(cs=9)
+    oled = SSD1306Panel(addr=0x3C)
+    arm = ArmPeripheral()
+    spi_devices[0] = [lcd, touch]
+    i2c_devices[oled.addr] = oled
+    radio.append(arm)
+    return {'lcd': lcd, 'touch': touch, 'oled': oled, 'arm': arm}
+
+
+def install(with_board=True):
+    """
+    Make the shims and firmware sources importable and reset the emulator.
+
+    Args:
+        with_board: Also wire the default board (see board())
+
+    Returns:
+        The board dict, or None
+    """
+    for path in (REPO_DIR, LIBS_DIR, HOST_DIR):
+        if path in sys.path:
+            sys.path.remove(path)
+        sys.path.insert(0, path)
+    _patch_time()
+    reset()
+    return board() if with_board else None
+
+
+def write_png(path, width, height, rgb):
+    """Write RGB888 pixel rows to a PNG file (no dependencies)"""
+    raw = bytearray()
+    stride = width * 3
+    for y in range(height):
+        raw.append(0)
+        raw += rgb[y * stride:(y + 1) * stride]
+
+    def chunk(kind, data):
+        body = kind + data
+        return struct.pack('>I', len(data)) + body + struct.pack('>I', zlib.crc32(body) & 0xFFFFFFFF)
+
+    with open(path, 'wb') as f:
+        f.write(b'\x89PNG\r\n\x1a\n')
+        f.write(chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0)))
+        f.write(chunk(b'IDAT', zlib.compress(bytes(raw), 9)))
+        f.write(chunk(b'IEND', b''))
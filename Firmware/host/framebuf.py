@@ -0,0 +1,189 @@
+"""
+Host stand-in for the MicroPython framebuf module
+
+Supports the formats used by the firmware (MONO_VLSB for the SSD1306,
+GS4_HMSB for the canvas) plus MONO_HLSB, RGB565 and GS8. text() draws
+the 5x8 font of ili9341.py in 8x8 cells: glyph shapes differ slightly
+from MicroPython's font, cell size and placement are the same.
+"""
+
+MONO_VLSB = 0
+RGB565 = 1
+GS4_HMSB = 2
+MONO_HLSB = 3
+MONO_HMSB = 4
+GS2_HMSB = 5
+GS8 = 6
+MVLSB = MONO_VLSB
+
+
+_font = None
+
+
+def _glyph(code):
+    """Columns of one character (LSB at the top), padded to 8"""
+    global _font
+    if _font is None:
+        from ili9341 import ILI9341
+        _font = ILI9341.DEFAULT_FONT
+    if code < 32 or code > 126:
+        code = 63  # '?'
+    start = (code - 32) * 5
+    return tuple(_font[start:start + 5]) + (0, 0, 0)
+
+
+class FrameBuffer:
+    def __init__(self, buffer, width, height, format, stride=None):
+        if format not in (MONO_VLSB, MONO_HLSB, RGB565, GS4_HMSB, GS8):
+            raise ValueError("invalid format")
+        self._buf = buffer
+        self._width = width
+        self._height = height
+        self._format = format
+        self._stride = width if stride is None else stride
+
+    # Pixel access per format
+    def _get(self, x, y):
+        b, fmt, s = self._buf, self._format, self._stride
+        if fmt == MONO_VLSB:
+            return (b[(y >> 3) * s + x] >> (y & 7)) & 1
+        if fmt == MONO_HLSB:
+            return (b[(y * s + x) >> 3] >> (7 - (x & 7))) & 1
+        if fmt == GS4_HMSB:
+            v = b[(y * s + x) >> 1]
+            return (v >> 4) if x % 2 == 0 else (v & 0x0F)
+        if fmt == GS8:
+            return b[y * s + x]
+        i = (y * s + x) * 2
+        return b[i] | (b[i + 1] << 8)
+
+    def _set(self, x, y, c):
+        b, fmt, s = self._buf, self._format, self._stride
+        if fmt == MONO_VLSB:
+            i = (y >> 3) * s + x
+            m = 1 << (y & 7)
+            b[i] = (b[i] | m) if c & 1 else (b[i] & ~m)
+        elif fmt == MONO_HLSB:
+            i = (y * s + x) >> 3
+            m = 0x80 >> (x & 7)
+            b[i] = (b[i] | m) if c & 1 else (b[i] & ~m)
+        elif fmt == GS4_HMSB:
+            i = (y * s + x) >> 1
+            if x % 2 == 0:
+                b[i] = (b[i] & 0x0F) | ((c & 0x0F) << 4)
+            else:
+                b[i] = (b[i] & 0xF0) | (c & 0x0F)
+        elif fmt == GS8:
+            b[y * s + x] = c & 0xFF
+        else:
+            i = (y * s + x) * 2
+            b[i] = c & 0xFF
+            b[i + 1] = (c >> 8) & 0xFF
+
+    def fill(self, c):
+        fmt = self._format
+        if fmt in (MONO_VLSB, MONO_HLSB):
+            pattern = b'\xff' if c & 1 else b'\x00'
+        elif fmt == GS4_HMSB:
+            pattern = bytes([((c & 0x0F) << 4) | (c & 0x0F)])
+        elif fmt == GS8:
+            pattern = bytes([c & 0xFF])
+        else:
+            pattern = bytes([c & 0xFF, (c >> 8) & 0xFF])
+        n = len(self._buf)
+        self._buf[:] = (pattern * (n // len(pattern) + 1))[:n]
+
+    def pixel(self, x, y, c=None):
+        if not (0 <= x < self._width and 0 <= y < self._height):
+            return None
+        if c is None:
+            return self._get(x, y)
+        self._set(x, y, c)
+
+    def fill_rect(self, x, y, w, h, c):
+        x0 = max(0, x)
+        y0 = max(0, y)
+        x1 = min(self._width, x + w)
+        y1 = min(self._height, y + h)
+        if x0 >= x1 or y0 >= y1:
+            return
+        if self._format == GS4_HMSB:
+            # Whole bytes with slice assignment, odd edges per pixel
+            a = x0 + (x0 & 1)
+            b = x1 - (x1 & 1)
+            byte = bytes([((c & 0x0F) << 4) | (c & 0x0F)])
+            for yy in range(y0, y1):
+                if x0 & 1:
+                    self._set(x0, yy, c)
+                if a < b:
+                    off = (yy * self._stride + a) >> 1
+                    self._buf[off:off + ((b - a) >> 1)] = byte * ((b - a) >> 1)
+                if x1 & 1 and x1 - 1 >= a:
+                    self._set(x1 - 1, yy, c)
+            return
+        for yy in range(y0, y1):
+            for xx in range(x0, x1):
+                self._set(xx, yy, c)
+
+    def hline(self, x, y, w, c):
+        self.fill_rect(x, y, w, 1, c)
+
+    def vline(self, x, y, h, c):
+        self.fill_rect(x, y, 1, h, c)
+
+    def rect(self, x, y, w, h, c, f=False):
+        if f:
+            self.fill_rect(x, y, w, h, c)
+            return
+        self.fill_rect(x, y, w, 1, c)
+        self.fill_rect(x, y + h - 1, w, 1, c)
+        self.fill_rect(x, y, 1, h, c)
+        self.fill_rect(x + w - 1, y, 1, h, c)
+
+    def line(self, x0, y0, x1, y1, c):
+        dx = abs(x1 - x0)
+        dy = -abs(y1 - y0)
+        sx = 1 if x0 < x1 else -1
+        sy = 1 if y0 < y1 else -1
+        err = dx + dy
+        while True:
+            self.pixel(x0, y0, c)
+            if x0 == x1 and y0 == y1:
+                return
+            e2 = 2 * err
+            if e2 >= dy:
+                err += dy
+                x0 += sx
+            if e2 <= dx:
+                err += dx
+                y0 += sy
+
+    def text(self, s, x, y, c=1):
+        for ch in s:
+            cols = _glyph(ord(ch))
+            for i in range(8):
+                bits = cols[i]
+                for j in range(8):
+                    if (bits >> j) & 1:
+                        self.pixel(x + i, y + j, c)
+            x += 8
+
+    def blit(self, fbuf, x, y, key=-1, palette=None):
+        for yy in range(fbuf._height):
+            for xx in range(fbuf._width):
+                c = fbuf._get(xx, yy)
+                if c == key:
+                    continue
+                if palette is not None:
+                    c = palette._get(c, 0)
+                self.pixel(x + xx, y + yy, c)
+
+    def scroll(self, dx, dy):
+        w, h = self._width, self._height
+        xs = range(w - 1, -1, -1) if dx > 0 else range(w)
+        ys = range(h - 1, -1, -1) if dy > 0 else range(h)
+        for yy in ys:
+            for xx in xs:
+                sx, sy = xx - dx, yy - dy
+                if 0 <= sx < w and 0 <= sy < h:
+                    self._set(xx, yy, self._get(sx, sy))
@@ -0,0 +1,228 @@
+"""
+Host stand-in for the MicroPython machine module
+
+Pins keep their state in the emulator (one object per pin id), and the
+SPI/I2C classes route each transfer to the emulated device selected by
+its chip select pin or address, logging it with a simulated duration.
+"""
+
+import emulator
+
+
+def freq(hz=None):
+    return 125_000_000
+
+
+def reset():
+    raise SystemExit("machine.reset()")
+
+
+def unique_id():
+    return b'\xe6\x61\x41\x04\x03\x2b\x4c\x2a'
+
+
+class Pin:
+    IN = 0
+    OUT = 1
+    OPEN_DRAIN = 2
+    PULL_UP = 1
+    PULL_DOWN = 2
+    IRQ_FALLING = 4
+    IRQ_RISING = 8
+
+    def __new__(cls, id, *args, **kwargs):
+        pin = emulator.pins.get(id)
+        if pin is None:
+            pin = object.__new__(cls)
+            pin.id = id
+            pin._value = 1
+            pin.mode = cls.IN
+            pin.pull = None
+            pin.handler = None
+            pin.trigger = 0
+            emulator.pins[id] = pin
+        return pin
+
+    def __init__(self, id, mode=None, pull=None, value=None):
+        self.init(mode, pull, value)
+
+    def init(self, mode=None, pull=None, value=None):
+        if mode is not None:
+            self.mode = mode
+        if pull is not None:
+            self.pull = pull
+        if value is not None:
+            self._value = 1 if value else 0
+
+    def value(self, v=None):
+        if v is None:
+            return self._value
+        self.drive(v)
+
+    def __call__(self, v=None):
+        return self.value(v)
+
+    def on(self):
+        self.drive(1)
+
+    def off(self):
+        self.drive(0)
+
+    def toggle(self):
+        self.drive(not self._value)
+
+    def drive(self, v):
+        """Set the level (also used by test code to drive inputs), firing IRQs"""
+        old = self._value
+        self._value = 1 if v else 0
+        if self.handler is not None:
+            if (old and not self._value and self.trigger & self.IRQ_FALLING) or \
+               (not old and self._value and self.trigger & self.IRQ_RISING):
+                self.handler(self)
+
+    def irq(self, handler=None, trigger=IRQ_FALLING | IRQ_RISING, hard=False):
+        self.handler = handler
+        self.trigger = trigger
+
+    def __repr__(self):
+        return "Pin({})".format(self.id)
+
+
+class SPI:
+    def __init__(self, id, baudrate=1_000_000, polarity=0, phase=0, bits=8, firstbit=0,
+                 sck=None, mosi=None, miso=None):
+        self.id = id
+        self.bus = 'spi{}'.format(id)
+        self.baudrate = baudrate
+        self.polarity = polarity
+        self.phase = phase
+
+    def init(self, baudrate=None, polarity=None, phase=None, **kwargs):
+        if baudrate is not None:
+            self.baudrate = baudrate
+        if polarity is not None:
+            self.polarity = polarity
+        if phase is not None:
+            self.phase = phase
+
+    def deinit(self):
+        pass
+
+    def _selected(self):
+        for device in emulator.spi_devices.get(self.id, ()):
+            if emulator.pin_value(device.cs) == 0:
+                return device
+        return None
+
+    def _log(self, device, nbytes):
+        emulator.log.record(self.bus, device.name if device else '-', nbytes,
+                            emulator.spi_duration_us(nbytes, self.baudrate))
+
+    def write(self, buf):
+        device = self._selected()
+        if device is not None:
+            device.write(buf)
+        self._log(device, len(buf))
+
+    def read(self, nbytes, write=0x00):
+        buf = bytearray(nbytes)
+        self.readinto(buf, write)
+        return bytes(buf)
+
+    def readinto(self, buf, write=0x00):
+        device = self._selected()
+        if device is not None and hasattr(device, 'readinto'):
+            device.readinto(buf)
+        else:
+            for i in range(len(buf)):
+                buf[i] = 0
+        self._log(device, len(buf))
+
+    def write_readinto(self, write_buf, read_buf):
+        device = self._selected()
+        if device is not None:
+            device.exchange(write_buf, read_buf)
+        self._log(device, len(write_buf))
+
+
+class I2C:
+    def __init__(self, id=0, scl=None, sda=None, freq=400_000, timeout=50000):
+        self.id = id
+        self.bus = 'i2c{}'.format(id)
+        self.freq = freq
+
+    def scan(self):
+        return sorted(emulator.i2c_devices)
+
+    def _device(self, addr):
+        device = emulator.i2c_devices.get(addr)
+        if device is None:
+            raise OSError(5)  # EIO: no ACK
+        return device
+
+    def writeto(self, addr, buf, stop=True):
+        device = self._device(addr)
+        device.i2c_write(bytes(buf))
+        emulator.log.record(self.bus, device.name, len(buf), emulator.i2c_duration_us(len(buf), self.freq))
+        return len(buf)
+
+    def writevto(self, addr, vector, stop=True):
+        data = b''.join(bytes(b) for b in vector)
+        return self.writeto(addr, data, stop)
+
+    def readfrom_into(self, addr, buf, stop=True):
+        device = self._device(addr)
+        if hasattr(device, 'i2c_read'):
+            device.i2c_read(buf)
+        emulator.log.record(self.bus, device.name, len(buf), emulator.i2c_duration_us(len(buf), self.freq))
+
+    def readfrom(self, addr, nbytes, stop=True):
+        buf = bytearray(nbytes)
+        self.readfrom_into(addr, buf, stop)
+        return bytes(buf)
+
+    def writeto_mem(self, addr, memaddr, buf, addrsize=8):
+        self.writeto(addr, bytes([memaddr]) + bytes(buf))
+
+    def readfrom_mem_into(self, addr, memaddr, buf, addrsize=8):
+        self.writeto(addr, bytes([memaddr]), False)
+        self.readfrom_into(addr, buf)
+
+    def readfrom_mem(self, addr, memaddr, nbytes, addrsize=8):
+        buf = bytearray(nbytes)
+        self.readfrom_mem_into(addr, memaddr, buf, addrsize)
+        return bytes(buf)
+
+
+class SoftI2C(I2C):
+    def __init__(self, scl=None, sda=None, freq=500_000, timeout=50000):
+        super().__init__('soft', scl, sda, freq, timeout)
+        self.bus = 'softi2c'
+
+
+class PWM:
+    def __init__(self, pin, freq=0, duty_u16=0):
+        self.pin = pin
+        self._freq = freq
+        self._duty = duty_u16
+
+    def freq(self, value=None):
+        if value is None:
+            return self._freq
+        self._freq = value
+
+    def duty_u16(self, value=None):
+        if value is None:
+            return self._duty
+        self._duty = value
+
+    def deinit(self):
+        self._duty = 0
+
+
+class ADC:
+    def __init__(self, pin):
+        self.pin = pin
+
+    def read_u16(self):
+        return 32768
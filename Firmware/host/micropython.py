@@ -0,0 +1,72 @@
+"""Host stand-in for the MicroPython micropython module"""
+
+
+import builtins
+import functools
+
+
+def const(value):
+    return value
+
+
+def native(func):
+    return func
+
+
+class ptr8:
+    """Viper pointer type: the argument is viewed as unsigned bytes"""
+    fmt = 'B'
+
+
+class ptr16:
+    """Viper pointer type: the argument is viewed as unsigned 16-bit words"""
+    fmt = 'H'
+
+
+class ptr32:
+    """Viper pointer type: the argument is viewed as unsigned 32-bit words"""
+    fmt = 'I'
+
+
+# Viper code names the pointer types without importing them
+builtins.ptr8 = ptr8
+builtins.ptr16 = ptr16
+builtins.ptr32 = ptr32
+
+
+def viper(func):
+    """
+    Run a viper function as plain Python: arguments annotated with a
+    pointer type are cast to a memoryview of that element size, so
+    indexing reads and writes the buffer as the machine code would.
+    """
+    code = func.__code__
+    kinds = [func.__annotations__.get(name) for name in code.co_varnames[:code.co_argcount]]
+    pointers = [(i, kind.fmt) for i, kind in enumerate(kinds)
+                if isinstance(kind, type) and issubclass(kind, (ptr8, ptr16, ptr32))]
+    if not pointers:
+        return func
+
+    @functools.wraps(func)
+    def wrapper(*args):
+        args = list(args)
+        for i, fmt in pointers:
+            args[i] = memoryview(args[i]).cast('B').cast(fmt)
+        return func(*args)
+    return wrapper
+
+
+def opt_level(level=None):
+    return 0 if level is None else None
+
+
+def mem_info(verbose=False):
+    print("mem_info: not available on the host")
+
+
+def alloc_emergency_exception_buf(size):
+    pass
+
+
+def schedule(func, arg):
+    func(arg)
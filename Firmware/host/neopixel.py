@@ -0,0 +1,30 @@
+"""Host stand-in for the MicroPython neopixel module"""
+
+import emulator
+
+
+class NeoPixel:
+    def __init__(self, pin, n, bpp=3, timing=1):
+        self.pin = pin
+        self.n = n
+        self.bpp = bpp
+        self.pixels = [(0,) * bpp for _ in range(n)]
+        self.writes = 0
+
+    def __len__(self):
+        return self.n
+
+    def __setitem__(self, i, color):
+        self.pixels[i] = tuple(color)
+
+    def __getitem__(self, i):
+        return self.pixels[i]
+
+    def fill(self, color):
+        for i in range(self.n):
+            self.pixels[i] = tuple(color)
+
+    def write(self):
+        self.writes += 1
+        emulator.log.record('neopixel', 'pin{}'.format(getattr(self.pin, 'id', '?')), self.n * self.bpp,
+                            self.n * emulator.NEOPIXEL_US_PER_LED)
@@ -0,0 +1,52 @@
+"""
+Host stand-in for MicroPython's uasyncio, on top of CPython's asyncio
+
+Event loops created by run() use the emulator's virtual clock, so
+sleep_ms() and timeouts take no real time.
+"""
+
+import asyncio as _asyncio
+from asyncio import (CancelledError, Event, Lock, TimeoutError, create_task, current_task,  # noqa: F401
+                     gather, sleep, wait_for)
+
+import emulator
+
+
+async def sleep_ms(ms):
+    await _asyncio.sleep(ms / 1000)
+
+
+async def wait_for_ms(aw, timeout):
+    return await _asyncio.wait_for(aw, timeout / 1000)
+
+
+class ThreadSafeFlag:
+    """Event that clears itself when a waiter wakes up"""
+
+    def __init__(self):
+        self._event = _asyncio.Event()
+
+    def set(self):
+        self._event.set()
+
+    def clear(self):
+        self._event.clear()
+
+    async def wait(self):
+        await self._event.wait()
+        self._event.clear()
+
+
+def get_event_loop():
+    try:
+        return _asyncio.get_running_loop()
+    except RuntimeError:
+        return emulator.new_loop()
+
+
+def new_event_loop():
+    return emulator.new_loop()
+
+
+def run(coro):
+    return emulator.run(coro)
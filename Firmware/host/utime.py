@@ -0,0 +1,43 @@
+"""Host stand-in for the MicroPython utime module (virtual clock)"""
+
+import emulator
+
+
+def ticks_us():
+    return emulator.clock.now_us
+
+
+def ticks_ms():
+    return emulator.clock.now_us // 1000
+
+
+def ticks_cpu():
+    return emulator.clock.now_us
+
+
+def ticks_diff(a, b):
+    return a - b
+
+
+def ticks_add(a, b):
+    return a + b
+
+
+def sleep_us(us):
+    emulator.clock.advance_us(us)
+
+
+def sleep_ms(ms):
+    emulator.clock.advance_us(ms * 1000)
+
+
+def sleep(s):
+    emulator.clock.advance_us(s * 1_000_000)
+
+
+def time():
+    return emulator.clock.now_us // 1_000_000
+
+
+def time_ns():
+    return emulator.clock.now_us * 1000
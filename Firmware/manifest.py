@@ -1,9 +1,18 @@
 include("$(PORT_DIR)/boards/manifest.py")
 
 # Congela os módulos personalizados
-freeze("external/libs", "ahtx0.py")
-freeze("external/libs", "bh1750.py")
+freeze("external/libs", "ahtx0.py", opt=3)
+freeze("external/libs", "bh1750.py", opt=3)
 freeze("external/libs", "ssd1306.py", opt=3)
-freeze("external/libs", "matriz_bdl.py")
-freeze("external/libs", "ili9341.py")
-freeze("external/libs", "tsc2046.py")
\ No newline at end of file
+freeze("external/libs", "matriz_bdl.py", opt=3)
+freeze("external/libs", "kernels.py", opt=3)
+freeze("external/libs", "ili9341.py", opt=3)
+freeze("external/libs", "tsc2046.py", opt=3)
+freeze("external/libs", "canvas.py", opt=3)
+freeze("external/libs", "ui_assets.py", opt=3)
+freeze("external/libs", "ik.py", opt=3)
+freeze("external/libs", "ik_table.py", opt=3)
+freeze("external/libs", "widgets.py", opt=3)
+freeze("external/libs", "spibus.py", opt=3)
+freeze("external/libs", "tracer.py", opt=3)
+freeze("external/libs", "sampler.py", opt=3)
\ No newline at end of file
@@ -0,0 +1,285 @@
+"""
+Boot and Render Benchmarks (board or host)
+
+Measures what the viper kernels (external/libs/kernels.py) and the
+deferred imports of main.py change, and checks that every kernel gives
+the same output as the pure-Python loop it replaces.
+
+Cases:
+- boot: time to import main.py, then the import time of each module it
+  now loads on first use (the old eager boot paid all of them upfront)
+- glyph_s1 / glyph_s3: rasterizing the 95 printable characters
+- canvas_flush: expanding the whole 320x240 canvas to RGB565
+- touch_burst: decoding a TSC2046 burst into the three medians
+- screen: drawing the initial screen on the canvas from the prebuilt
+  assets (ui_assets.py) and with the fill/text calls
+- ik_lookup: angles of a point of the workspace map from the
+  precomputed table (ik.py, ik_table.py) and from the trigonometric
+  solver of Arm/cinematica.py, which the table replaces
+
+The render and touch cases run on a null SPI bus, so they time only the
+work done by the CPU (the bus time is the same for both variants, see
+host/bench.py). Each case runs with the kernel and with the fallback,
+by setting the kernel reference the driver module keeps, whatever
+kernels.ENABLED says, and restoring it afterwards (the screen
+case clears main.telas instead; ik_lookup checks that the table stays
+within a degree of the solver).
+
+Usage:
+    mpremote cp main.py : + run Firmware/pico_bench.py   (board)
+    python3 Firmware/pico_bench.py                       (host)
+
+On the host the viper functions run as plain Python over memoryviews,
+so the timings only show that the script works; the outputs are still
+compared.
+"""
+
+import sys
+import time
+
+HOST = sys.implementation.name != 'micropython'
+
+if HOST:
+    import os
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'host'))
+    import emulator
+    emulator.install(with_board=False)
+
+    def ticks_us():
+        # The emulator replaces time.ticks_us with its virtual clock
+        return int(time.perf_counter() * 1_000_000)
+else:
+    ticks_us = time.ticks_us
+
+# Modules main.py imports on first use, in the order a session loads them
+DEFERRED = ('aioble', 'bluetooth', 'spibus', 'kernels', 'ili9341', 'canvas', 'tsc2046', 'widgets',
+            'ik', 'ik_table', 'bh1750', 'ahtx0', 'sampler')
+
+
+def elapsed_us(start):
+    return ticks_us() - start if HOST else time.ticks_diff(ticks_us(), start)
+
+
+def timed(fn, runs):
+    """Average microseconds per call of fn"""
+    start = ticks_us()
+    for _ in range(runs):
+        fn()
+    return elapsed_us(start) / runs
+
+
+def bench_boot():
+    """
+    Returns:
+        List of (module, import_us); the first entry is main itself
+    """
+    results = []
+    start = ticks_us()
+    try:
+        __import__('main')
+    except ImportError as e:
+        print("boot: main.py not found ({}), copy it to the board first".format(e))
+        return results
+    results.append(('main', elapsed_us(start)))
+    for name in DEFERRED:
+        if name in sys.modules:
+            continue
+        start = ticks_us()
+        try:
+            __import__(name)
+        except ImportError:
+            continue
+        results.append((name, elapsed_us(start)))
+    return results
+
+
+class NullSPI:
+    """
+    SPI stand-in: write() only counts bytes (or keeps them while
+    recording) and write_readinto() returns a fixed pseudo-random reply.
+    """
+
+    def __init__(self):
+        self.nbytes = 0
+        self.recorded = None
+        self._seed = 1
+
+    def write(self, buf):
+        self.nbytes += len(buf)
+        if self.recorded is not None:
+            self.recorded.append(bytes(buf))
+
+    def readinto(self, buf):
+        pass
+
+    def reseed(self):
+        self._seed = 1
+
+    def write_readinto(self, tx, rx):
+        seed = self._seed
+        for i in range(len(rx)):
+            seed = (seed * 1103515245 + 12345) & 0x7FFFFFFF
+            rx[i] = seed >> 16 & 0xFF
+        self._seed = seed
+
+
+def bench_glyphs(ili9341, display, kernel):
+    saved = ili9341.glyph_rgb565
+    results = []
+    for scale in (1, 3):
+        def run():
+            for code in range(32, 127):
+                display._rasterize_glyph(code, 0xF81F, 0x0841, scale)
+        out = []
+        for variant in (kernel, None):
+            ili9341.glyph_rgb565 = variant
+            out.append([bytes(display._rasterize_glyph(code, 0xF81F, 0x0841, scale)) for code in range(32, 127)])
+            results.append(('glyph_s{}'.format(scale), variant is not None, timed(run, 5)))
+        assert out[0] == out[1], "glyph_rgb565 differs from the Python loop at scale {}".format(scale)
+        out = None
+    ili9341.glyph_rgb565 = saved
+    return results
+
+
+def bench_canvas(canvas, tela, spi, kernel):
+    # Same layout as the interface: a grid of 80x80 buttons with labels
+    for i in range(12):
+        x, y = i % 4 * 80, i // 4 * 80
+        tela.fill_rect(x, y, 80, 80, 0x07E0 if (i + i // 4) % 2 else 0x0000)
+        tela.text('U' + str(i), x + 25, y + 30, fg_color=0xFFFF, bg_color=0x001F, scale=2)
+    tela.flush()
+
+    def run():
+        tela.invalidate()
+        tela.flush()
+    results = []
+    out = []
+    saved = canvas.expand_gs4_rows
+    for variant in (kernel, None):
+        canvas.expand_gs4_rows = variant
+        # Compare a few rectangles, including odd columns (half bytes)
+        spi.recorded = []
+        for x, y, w, h in ((0, 0, 320, 8), (3, 17, 61, 40), (159, 160, 81, 80)):
+            tela.invalidate(x, y, w, h)
+            tela.flush()
+        out.append(spi.recorded)
+        spi.recorded = None
+        results.append(('canvas_flush', variant is not None, timed(run, 3)))
+    assert out[0] == out[1], "expand_gs4_rows differs from _expand_gs4"
+    canvas.expand_gs4_rows = saved
+    return results
+
+
+def bench_touch(tsc2046, touch, spi, kernel):
+    results = []
+    out = []
+    saved = tsc2046.tsc_medians
+    for variant in (kernel, None):
+        tsc2046.tsc_medians = variant
+        spi.reseed()
+        out.append([touch.read_burst() for _ in range(100)])
+        results.append(('touch_burst', variant is not None, timed(touch.read_burst, 200)))
+    assert out[0] == out[1], "tsc_medians differs from the Python loop"
+    tsc2046.tsc_medians = saved
+    return results
+
+
+def bench_screen(tela):
+    try:
+        import main
+        import ui_assets
+    except ImportError:
+        return []
+
+    def run():
+        main.montar_botoes(main.BRANCO, main.PRETO, tela)
+        main.abrir(main.BRANCO, main.PRETO, tela)
+        tela.flush()
+    results = []
+    for telas in (ui_assets, None):
+        main.telas = telas
+        results.append(('screen', telas is not None, timed(run, 3)))
+    main.telas = None
+    return results
+
+
+def bench_ik():
+    try:
+        import math
+        import ik
+        import ik_table
+    except ImportError:
+        return []
+    table = ik.IKTable(ik_table)
+    l1, l2 = ik_table.LINKS
+    dz = ik_table.Z - ik_table.SHOULDER_Z
+    deg = 180 / math.pi
+
+    def solve(x, y):
+        # Arm/cinematica.py ik(): elbow up, shoulder and elbow counted from 180
+        r = math.sqrt(x * x + y * y)
+        c = (r * r + dz * dz - l1 * l1 - l2 * l2) / (2 * l1 * l2)
+        if r == 0 or c < -1 or c > 1:
+            return None
+        q = math.acos(c)
+        e = math.atan2(dz, r) + math.atan2(l2 * math.sin(q), l1 + l2 * math.cos(q))
+        return (int(math.atan2(y, x) * deg + 0.5), int(180 - e * deg + 0.5), int(180 - q * deg + 0.5))
+
+    span = table.x1 - table.x0
+    points = [(table.x0 + (i * 37) % span, table.y0 + (i * 53) % (table.y1 - table.y0)) for i in range(200)]
+    for x, y in points:
+        angles = table.angles(x, y)
+        if angles is not None:
+            exact = solve(x, y)
+            assert max(abs(a - b) for a, b in zip(angles, exact)) <= 1, "ik table differs from the solver"
+
+    def lookup():
+        for x, y in points:
+            table.angles(x, y)
+
+    def solved():
+        for x, y in points:
+            solve(x, y)
+    return [('ik_lookup', True, timed(lookup, 5) / len(points)),
+            ('ik_lookup', False, timed(solved, 5) / len(points))]
+
+
+def bench_render():
+    import machine
+    import ili9341
+    import canvas
+    import tsc2046
+    from kernels import glyph_rgb565, expand_gs4_rows, tsc_medians
+    spi = NullSPI()
+    display = ili9341.ILI9341(spi, dc=machine.Pin(20, machine.Pin.OUT), cs=machine.Pin(17, machine.Pin.OUT),
+                              WIDTH=320, HEIGHT=240, rst=None)
+    tela = canvas.Canvas(display)
+    touch = tsc2046.TSC2046(spi, cs=machine.Pin(9), samples=5)
+    return (bench_glyphs(ili9341, display, glyph_rgb565)
+            + bench_canvas(canvas, tela, spi, expand_gs4_rows)
+            + bench_touch(tsc2046, touch, spi, tsc_medians)
+            + bench_screen(tela)
+            + bench_ik())
+
+
+def report(boot, render):
+    if boot:
+        print("boot (import, us):")
+        deferred = 0
+        for name, us in boot:
+            print("  {:<10} {:>9.0f}".format(name, us))
+            if name != 'main':
+                deferred += us
+        print("  main.py now: {:.0f} us; deferred to first use: {:.0f} us".format(boot[0][1], deferred))
+    print("render (us per call: kernel, asset or table / python, drawn or solved / speedup):")
+    cases = {}
+    for name, is_kernel, us in render:
+        cases.setdefault(name, [0, 0])[0 if is_kernel else 1] = us
+    for name, (kernel_us, python_us) in cases.items():
+        print("  {:<13} {:>9.0f} {:>9.0f} {:>6.1f}x".format(name, kernel_us, python_us, python_us / kernel_us))
+    print("outputs identical: yes")
+
+
+if __name__ == '__main__':
+    boot = bench_boot()
+    report(boot, bench_render())
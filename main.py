@@ -1,63 +1,245 @@
-import aioble
-import bluetooth
 import struct
 import uasyncio as asyncio
 import machine
 import utime
-from ili9341 import ILI9341
-from tsc2046 import TSC2046
 from ssd1306 import SSD1306_I2C
+from tracer import Tracer
+from matriz_bdl import Matriz, Animador, sprite, X_GRANDE
+
+# Os módulos pesados são importados no primeiro uso, para que o OLED, o LED e a matriz respondam logo após o boot:
+# a pilha BLE (aioble, bluetooth) ao criar o BLE_Sender, os drivers do LCD e do touch em init() e criar_botoes() (só
+# depois da conexão), os dos sensores em init_sensores() e a tabela do modo mapa em criar_mapa()
+aioble = None
+bluetooth = None
+
+def importar_ble():
+    global aioble, bluetooth
+    if aioble is None:
+        import aioble as _aioble
+        import bluetooth as _bluetooth
+        aioble = _aioble
+        bluetooth = _bluetooth
+
+# Adaptador para os campos privados do aioble, usados para reconectar sem descoberta. Escrito para o aioble do
+# micropython-lib que acompanha a v1.22.2 (aioble/client.py e device.py): numa atualização do aioble, só este trecho
+# precisa ser conferido
+class GattGuardado:
+    CCCD = 0x2902
+    ATIVAR_NOTIFICACOES = b'\x01\x00'
+
+    # Handles da primeira conexão: (início e fim do serviço, fim e valor da característica, propriedades, CCCD ou None)
+    @staticmethod
+    def handles(service, characteristic, cccd):
+        return (service._start_handle, service._end_handle, characteristic._end_handle,
+                characteristic._value_handle, characteristic.properties, cccd._value_handle if cccd else None)
+
+    # Recria a característica a partir dos handles, registrada na conexão para receber as notificações
+    @staticmethod
+    def caracteristica(connection, handles, uuid_servico, uuid_caracteristica):
+        inicio_srv, fim_srv, fim_chr, valor, propriedades, _ = handles
+        service = aioble.client.ClientService(connection, inicio_srv, fim_srv, uuid_servico)
+        characteristic = aioble.client.ClientCharacteristic(service, fim_chr, valor, propriedades, uuid_caracteristica)
+        GattGuardado.registrar(characteristic)
+        return characteristic
+
+    # Encaminha as notificações da característica para ela, como o subscribe() do aioble faz
+    @staticmethod
+    def registrar(characteristic):
+        characteristic._register_with_connection()
+
+    # Ativa as notificações escrevendo direto no CCCD guardado, sem a descoberta de descritores do subscribe(). A
+    # confirmação da escrita chega depois e o aioble a ignora. Retorna False se não há CCCD guardado
+    @staticmethod
+    def ativar_notificacoes(connection, handles):
+        if handles[5] is None:
+            return False
+        bluetooth.BLE().gattc_write(connection._conn_handle, handles[5], GattGuardado.ATIVAR_NOTIFICACOES, 1)
+        return True
 
 class BLE_Sender:
     
+    # Estados notificados pela ESP32: [estado, seq, base, braço1, braço2, garra]
+    MOVENDO = 1
+    CONCLUIDO = 2
+    ERRO = 3
+    INTERROMPIDO = 4    # Substituído por um comando mais novo antes de terminar
+
+    # Protocolo binário v1, little-endian: [versão, tipo, seq, dados...] (formato completo em Arm/README.md)
+    VERSAO = 0xA1
+    TIPO_POSE = 0x01
+    TIPO_LOTE = 0x02
+    TIPO_PRESET = 0x03
+    MANTER = 0xFF       # Ângulo que deixa a junta onde está
+    PERFIL_TRAPEZIO = 0
+    PERFIL_SCURVE = 1
+    MTU_PADRAO = 23     # ATT_MTU mínimo do BLE; cada escrita carrega até MTU - 3 bytes
+    MTU_DESEJADO = 247
+
+    # Conexão: scan filtrado pelo serviço, conexão direta ao endereço guardado e backoff exponencial limitado
+    NOME_ESP32 = "ESP32_BRAÇO_BLE"
+    DURACAO_SCAN_MS = 5000
+    TIMEOUT_DIRETO_MS = 2000
+    TIMEOUT_CONEXAO_MS = 10000
+    ESPERA_MIN_MS = 250
+    ESPERA_MAX_MS = 8000
+    _PROP_NOTIFY = 0x10
+
     # Inicializa os parâmetros de conexão necessários para a comunicação com a ESP32
     def __init__(self, device_name="PicoBLE"):
+        importar_ble()
         self._SERVICE_UUID = bluetooth.UUID("12345678-1234-5678-1234-56789abcdef0")
         self._CHAR_UUID = bluetooth.UUID("abcdef01-2345-6789-abcd-0123456789ab")
         self.device_name = device_name
         self.conectado = False
         self.characteristic = None
         self.connection = None
+        self.notificacoes = False
+        self.mtu = self.MTU_PADRAO
+        self._seq = 0
+        self.online = asyncio.Event()   # setado enquanto há conexão
+        self._dispositivo = None        # ESP32 da primeira conexão (endereço)
+        self._handles = None            # handles GATT da primeira conexão
+        self._reconexao = False         # conexão atual usa os handles guardados
+        self.espera_ms = self.ESPERA_MIN_MS
+        # Métricas de conexão
+        self.tentativas = 0
+        self.conexoes = 0
+        self.conexoes_diretas = 0
+        self.tempo_conexao_ms = None
+        self.rssi = None
 
-    # Rotina de conexão com a ESP32
+    # Rotina de conexão com a ESP32. Tenta primeiro a conexão direta ao endereço e handles guardados na primeira
+    # conexão; se falhar, faz um scan filtrado pelo UUID do serviço. Em caso de falha, espera_ms dobra (até o limite)
     async def conectar(self):
+        self.tentativas += 1
+        inicio = utime.ticks_ms()
+        if self._dispositivo is not None:
+            print("Conectando direto à ESP32...")
+            # Sem scan não há RSSI desta conexão (o bluetooth do MicroPython não lê o RSSI de uma conexão aberta)
+            self.rssi = None
+            if await self._abrir(self._dispositivo, self.TIMEOUT_DIRETO_MS):
+                self.conexoes_diretas += 1
+                return self._conectou(inicio)
         print("Procurando ESP32...")
-        device = None
+        device = await self._procurar()
+        if device is None:
+            print("ESP32 não encontrada.")
+            return self._falhou()
+        print("Conectando...")
+        if await self._abrir(device, self.TIMEOUT_CONEXAO_MS):
+            self._dispositivo = device
+            return self._conectou(inicio)
+        return self._falhou()
+
+    # Scan ativo (para receber o nome na resposta) que para no primeiro anúncio com o UUID do serviço. O nome
+    # fica como alternativa para firmwares da ESP32 que não anunciam o serviço
+    async def _procurar(self):
         try:
-            # Scan por 5 segundos (5000ms), com janela de 3 segundos (3000ms)
-            async with aioble.scan(5000, 3000) as scanner:
+            async with aioble.scan(self.DURACAO_SCAN_MS, 30000, 30000, active=True) as scanner:
                 async for result in scanner:
-                    print("Dispositivo encontrado:", result.name())
-                    if result.name() == "ESP32_BRAÇO_BLE":
-                        print("ESP32 encontrada!")
-                        device = result.device
-                        break
-            if not device:
-                print("ESP32 não encontrada.")
-                return False
-            print("Conectando...")
-            try:
-                # Tentar conectar com timeout de 10 segundos
-                self.connection = await asyncio.wait_for(device.connect(), 10)
+                    if self._SERVICE_UUID in result.services() or result.name() == self.NOME_ESP32:
+                        print("ESP32 encontrada! RSSI:", result.rssi)
+                        self.rssi = result.rssi
+                        return result.device
+        except Exception as e:
+            print("Erro durante scan:", e)
+        return None
+
+    # Conecta e prepara a característica. Usa os handles guardados quando existem e só refaz a descoberta de
+    # serviços se eles não servirem mais (firmware da ESP32 trocado, por exemplo)
+    async def _abrir(self, device, timeout_ms):
+        try:
+            self.connection = await device.connect(timeout_ms=timeout_ms)
+        except asyncio.TimeoutError:
+            print("Timeout na conexão")
+            return False
+        except Exception as e:
+            print("Erro durante conexão:", e)
+            return False
+        try:
+            self._reconexao = self._handles is not None
+            if self._reconexao:
+                # Reconexão: característica e CCCD dos handles guardados, sem nenhuma descoberta. Se os handles
+                # estiverem velhos (firmware da ESP32 trocado), a primeira escrita falha e _escrever() os descarta
+                self.characteristic = GattGuardado.caracteristica(self.connection, self._handles,
+                                                                  self._SERVICE_UUID, self._CHAR_UUID)
+                self.notificacoes = GattGuardado.ativar_notificacoes(self.connection, self._handles)
+            else:
                 print("Conectado, buscando serviços...")
                 service = await self.connection.service(self._SERVICE_UUID)
                 self.characteristic = await service.characteristic(self._CHAR_UUID)
-                utime.sleep_ms(3000)
-                self.conectado = True
-                print("Conectado com sucesso!")
-                return True
-                
-            except asyncio.TimeoutError:
-                print("Timeout na conexão")
-                return False
+                cccd = None
+                try:
+                    cccd = await self._assinar()
+                except Exception as e:
+                    print("ESP32 sem notificações de movimento:", e)
+                self._handles = GattGuardado.handles(service, self.characteristic, cccd)
+            # MTU maior permite mais waypoints por escrita nos lotes
+            try:
+                self.mtu = await self.connection.exchange_mtu(self.MTU_DESEJADO)
             except Exception as e:
-                print("Erro durante conexão:", e)
-                return False
-                
+                print("Troca de MTU falhou:", e)
+                self.mtu = self.MTU_PADRAO
+            return True
         except Exception as e:
-            print("Erro durante scan:", e)
+            print("Erro durante conexão:", e)
+            try:
+                await self.connection.disconnect()
+            except:
+                pass
+            self.connection = None
+            self.characteristic = None
             return False
 
+    # Assina as notificações de movimento na primeira conexão (firmware antigo da ESP32 não as tem): descobre o CCCD e
+    # escreve nele, como o subscribe() do aioble, mas devolve o descritor para que as reconexões o usem direto
+    async def _assinar(self):
+        self.notificacoes = False
+        if not self.characteristic.properties & self._PROP_NOTIFY:
+            print("ESP32 sem notificações de movimento")
+            return None
+        cccd = await self.characteristic.descriptor(bluetooth.UUID(GattGuardado.CCCD))
+        if cccd is None:
+            print("ESP32 sem CCCD na característica")
+            return None
+        GattGuardado.registrar(self.characteristic)
+        await cccd.write(GattGuardado.ATIVAR_NOTIFICACOES, True)
+        self.notificacoes = True
+        return cccd
+
+    def _conectou(self, inicio):
+        self.tempo_conexao_ms = utime.ticks_diff(utime.ticks_ms(), inicio)
+        self.conexoes += 1
+        self.espera_ms = self.ESPERA_MIN_MS
+        self.conectado = True
+        self.online.set()
+        print(f"Conectado com sucesso em {self.tempo_conexao_ms} ms!")
+        return True
+
+    def _falhou(self):
+        self.espera_ms = min(self.espera_ms * 2, self.ESPERA_MAX_MS)
+        return False
+
+    # Marca a conexão como perdida; a tarefa de conexão volta a conectar
+    def _caiu(self):
+        self.conectado = False
+        self.online.clear()
+
+    # Retorna quando o link com a ESP32 cair
+    async def aguardar_desconexao(self):
+        if self.connection is not None:
+            try:
+                await self.connection.disconnected(timeout_ms=None)
+            except Exception:
+                pass
+        print("Conexão BLE perdida")
+        self._caiu()
+
+    # Métricas de conexão, para o log serial
+    def resumo_conexao(self):
+        return "BLE: {}/{} conexões ({} diretas), última em {} ms, RSSI {}".format(
+            self.conexoes, self.tentativas, self.conexoes_diretas, self.tempo_conexao_ms, self.rssi)
+
     # Rotina de desconexão com a ESP32
     async def desconectar(self):
         if self.connection:
@@ -67,34 +249,144 @@ class BLE_Sender:
                 pass
         self.connection = None
         self.characteristic = None
-        self.conectado = False
+        self.notificacoes = False
+        self.mtu = self.MTU_PADRAO
+        self._caiu()
         print("Desconectado.")
 
-    # Rotina de envio de caracteres para a ESP32. Todos os comandos comunicáveis estão codificados nos caracteres numéricos de 0 a 9. Essa rotina também exibe no OLED o comando enviado
-    async def enviar_caractere(self, caractere, oled, s, x, oled_print=True):
+    # Escreve um comando na característica da ESP32. Retorna True se a escrita foi confirmada
+    async def _escrever(self, dados, descricao):
         if not self.conectado or self.characteristic is None:
             print(f"Erro: Não conectado a dispositivo BLE ou dispositivo não disponível {self.conectado} {self.characteristic}")
             return False
         try:
-            dados = str(caractere).encode('utf-8')
-            
+            if self.notificacoes:
+                await self._descartar_notificacao()
+            tracer.begin(SPAN_GATT)
             await self.characteristic.write(dados, True)
-            if oled_print:
-                oled_write("Comando enviado:", 0, 20, oled, fill=True)
-                oled_write(s, x, 30, oled)
-            print(f"Caractere '{caractere}' enviado")
+            tracer.end(SPAN_GATT)
+            tracer.end(SPAN_ENVIO)
+            print(f"{descricao} enviado")
             return True
         except Exception as e:
-            if e is not None:
-                print(f"Erro ao enviar caractere '{caractere}':", e)
-                return False
+            tracer.cancel(SPAN_GATT)
+            print(f"Erro ao enviar {descricao}:", e)
+            # Se a conexão caiu, a tarefa BLE volta a conectar
+            if self.connection is None or not self.connection.is_connected():
+                self._caiu()
+            elif isinstance(e, aioble.client.GattError) and self._reconexao:
+                # Handles guardados recusados (firmware da ESP32 trocado): a reconexão refaz a descoberta
+                print("Handles GATT recusados, reconectando com descoberta")
+                self._handles = None
+                await self.desconectar()
+            return False
+
+    # Número de sequência dos quadros binários (1 a 255; o 0 fica para os comandos legados)
+    def _proximo_seq(self):
+        self._seq = self._seq % 255 + 1
+        return self._seq
+
+    # Modo de compatibilidade: comandos codificados nos caracteres numéricos de 0 a 9
+    async def enviar_caractere(self, caractere):
+        return await self._escrever(str(caractere).encode('utf-8'), f"Caractere '{caractere}'")
+
+    # Envia uma pose com alvos para cada junta (MANTER mantém a junta). velocidade em graus/s de pico e duracao_ms em
+    # ms; com os dois em 0 a ESP32 usa a velocidade padrão. Todas as juntas chegam juntas, seguindo o perfil (PERFIL_*,
+    # None = padrão da ESP32). Um comando novo interrompe o anterior. Retorna o seq do quadro, ou None se falhou
+    async def enviar_pose(self, base, braco1, braco2, garra=MANTER, velocidade=0, duracao_ms=0, perfil=None):
+        seq = self._proximo_seq()
+        dados = struct.pack("<8BH", self.VERSAO, self.TIPO_POSE, seq,
+                            base, braco1, braco2, garra, velocidade, duracao_ms)
+        if perfil is not None:
+            dados += bytes((perfil,))
+        return seq if await self._escrever(dados, f"Pose {seq}") else None
+
+    # Envia uma das posições gravadas na ESP32 (0–9, as mesmas dos caracteres). Retorna o seq ou None
+    async def enviar_preset(self, indice):
+        seq = self._proximo_seq()
+        dados = struct.pack("<4B", self.VERSAO, self.TIPO_PRESET, seq, indice)
+        return seq if await self._escrever(dados, f"Preset {indice}") else None
 
-# Rotina necessária uma vez que o barramento SPI é compartilhado tanto para o touch (mais lento) quanto para o LCD (mais rápido)
-def set_spi_speed(speed, spi):
-    spi.init(baudrate=speed)
+    # Envia uma sequência de waypoints (base, braço1, braço2, garra, duracao_ms) no menor número de escritas que o MTU
+    # permite. Entre um quadro e outro espera a ESP32 concluir o anterior; retorna o seq do último quadro, ou None
+    async def enviar_lote(self, waypoints, velocidade=0, timeout_ms=4000):
+        por_quadro = min(255, (self.mtu - 3 - 5) // 6)
+        seq = None
+        for i in range(0, len(waypoints), por_quadro):
+            if seq is not None and await self.aguardar_movimento(timeout_ms * por_quadro, seq) is None:
+                return None
+            parte = waypoints[i:i + por_quadro]
+            seq = self._proximo_seq()
+            dados = bytearray(5 + 6 * len(parte))
+            struct.pack_into("<5B", dados, 0, self.VERSAO, self.TIPO_LOTE, seq, len(parte), velocidade)
+            for j, (base, braco1, braco2, garra, duracao_ms) in enumerate(parte):
+                struct.pack_into("<4BH", dados, 5 + 6 * j, base, braco1, braco2, garra, duracao_ms)
+            if not await self._escrever(dados, f"Lote {seq} ({len(parte)} waypoints)"):
+                return None
+        return seq
+
+    # Descarta uma notificação antiga (de um movimento cuja espera expirou). O aioble guarda apenas a última
+    async def _descartar_notificacao(self):
+        try:
+            await self.characteristic.notified(timeout_ms=1)
+        except asyncio.TimeoutError:
+            pass
+
+    # Espera a ESP32 notificar o fim do movimento (do quadro seq, se informado). Retorna os ângulos finais (base, braço1,
+    # braço2, garra), ou None em caso de timeout ou comando recusado. Sem notificações (firmware antigo), espera um
+    # tempo fixo de um segundo
+    async def aguardar_movimento(self, timeout_ms, seq=None):
+        if not self.notificacoes:
+            await asyncio.sleep_ms(1000)
+            return None
+        inicio = utime.ticks_ms()
+        while True:
+            restante = timeout_ms - utime.ticks_diff(utime.ticks_ms(), inicio)
+            if restante <= 0:
+                return None
+            try:
+                dados = await self.characteristic.notified(timeout_ms=restante)
+            except asyncio.TimeoutError:
+                print("Timeout esperando o fim do movimento")
+                return None
+            except Exception as e:
+                print("Erro esperando o fim do movimento:", e)
+                if self.connection is None or not self.connection.is_connected():
+                    self._caiu()
+                return None
+            if len(dados) >= 6:
+                estado, recebido, base, braco1, braco2, garra = struct.unpack_from("<6B", dados)
+            else:
+                # Firmware anterior ao protocolo binário: [estado, base, braço1, braço2, garra], sem seq
+                estado, base, braco1, braco2, garra = struct.unpack_from("<5B", dados)
+                recebido = seq
+            if seq is not None and recebido != seq:
+                continue
+            if estado == self.CONCLUIDO:
+                return base, braco1, braco2, garra
+            if estado == self.ERRO:
+                print("ESP32 recusou o comando", recebido)
+                return None
+            if estado == self.INTERROMPIDO:
+                print("Comando", recebido, "interrompido por outro")
+                return None
+
+# Telas pré-renderizadas (ui_assets.py, gerado por Firmware/build_assets.py a partir das rotinas abaixo). Com TELAS = True,
+# init() carrega o módulo e as rotinas de desenho copiam retângulos das telas, com as cores trocadas pela paleta, em vez
+# de desenhar cada retângulo e texto. Sem o módulo, a interface é desenhada como antes
+TELAS = True
+telas = None
+
+# Copia uma metade (x = 0 ou 160) da fileira da garra de uma tela; y_tela é a linha da tela onde a fileira começa
+def copiar_garra(tela, y_tela, x, cor1, cor2, display):
+    display.blit_asset(tela, x+5, 165, (cor1, cor2), (x+5, 165 - y_tela, 150, 70))
 
 # Rotina que implementa a animação de exibição dos dois botões superiores (estado: fechar/aberto)
 def abrir(cor1, cor2, display):
+    if telas:
+        copiar_garra(telas.TELA, 0, 0, cor1, cor2, display)
+        copiar_garra(telas.TELA, 0, 160, cor1, cor2, display)
+        return
     display.fill_rect(5, 165, 150, 70, cor1)
     display.fill_rect(165, 165, 150, 70, cor1)
     display.fill_rect(170, 170, 140, 60, cor2)
@@ -103,6 +395,10 @@ def abrir(cor1, cor2, display):
 
 # Rotina que implementa a animação de exibição dos dois botões superiores (estado: fechado/abrir)
 def fechar(cor1, cor2, display):
+    if telas:
+        copiar_garra(telas.GARRA_FECHADA, 160, 0, cor1, cor2, display)
+        copiar_garra(telas.GARRA_FECHADA, 160, 160, cor1, cor2, display)
+        return
     display.fill_rect(5, 165, 150, 70, cor1)
     display.fill_rect(165, 165, 150, 70, cor1)
     display.fill_rect(10, 170, 140, 60, cor2)
@@ -111,6 +407,10 @@ def fechar(cor1, cor2, display):
 
 # Rotina que implementa a animação de exibição dos oito botões inferiores
 def montar_botoes(cor1, cor2, display, fill=True):
+    if telas:
+        display.blit_asset(telas.TELA, 0, 0, (cor1, cor2), (0, 0, 320, 160))
+        if fill : display.fill_rect(0, 160, 320, 80, cor2)
+        return
     if fill : display.fill(cor2)
     largura_quadrado = 320 // 4
     altura_quadrado = 240 // 3
@@ -140,23 +440,112 @@ def led(r, g, b, led_r, led_g, led_b):
     led_g.duty_u16(int(g * 65535 / 255))
     led_b.duty_u16(int(b * 65535 / 255))
     
-# Rotina que toca uma música (escrita em duty cycles) nos auto falantes da BitDogLab
-def play(musica, alto_falante):
-    for nota, duracao in musica:
-        freq = nota
-        alto_falante.freq(freq if freq > 0 else 500)
-        alto_falante.duty_u16(32767 if freq > 0 else 0)
-        utime.sleep_ms(120 * duracao)
+# Rotina que toca uma música (escrita em duty cycles) nos auto falantes da BitDogLab, sem bloquear as demais tarefas
+async def play(musica, alto_falante):
+    try:
+        for nota, duracao in musica:
+            freq = nota
+            alto_falante.freq(freq if freq > 0 else 500)
+            alto_falante.duty_u16(32767 if freq > 0 else 0)
+            await asyncio.sleep_ms(120 * duracao)
+            alto_falante.duty_u16(0)
+            await asyncio.sleep_ms(50)
+    finally:
+        # Música interrompida (cancelada) não deixa o alto falante ligado
         alto_falante.duty_u16(0)
-        utime.sleep_ms(50)
 
-# Rotina que escreve um texto s a partir da coordenada x y no display OLED da BitDogLab
-def oled_write(s, x, y, oled, fill=False):
-    if fill : oled.fill(0)
-    oled.text(s, x, y)
-    oled.show()
+# Efeitos de áudio, do led e da matriz de LEDs da BitDogLab. A música e as animações rodam em tarefas próprias; uma
+# nova música (ou animação) interrompe a anterior
+class Efeitos:
+    def __init__(self, led_r, led_g, led_b, alto_falante, animador=None):
+        self.led_r = led_r
+        self.led_g = led_g
+        self.led_b = led_b
+        self.alto_falante = alto_falante
+        self.animador = animador
+        self.garra = ANIM_ABERTA   # estado da garra mostrado quando o braço está parado
+        self._musica = None
+
+    def led(self, r, g, b):
+        led(r, g, b, self.led_r, self.led_g, self.led_b)
+
+    # Mostra o estado do braço na matriz de LEDs (ANIM_*), sem esperar
+    def animar(self, quadros, repetir=True):
+        if self.animador is not None:
+            self.animador.tocar(quadros, repetir)
+
+    def tocar(self, musica):
+        if self._musica is not None:
+            self._musica.cancel()
+        self._musica = asyncio.create_task(play(musica, self.alto_falante))
+
+    # Espera a música atual terminar (usado no encerramento)
+    async def aguardar(self):
+        if self._musica is not None:
+            try:
+                await self._musica
+            except asyncio.CancelledError:
+                pass
+
+# Status no display OLED da BitDogLab. Cada mensagem é uma lista de linhas (texto, x, y); a tarefa do OLED desenha só a
+# mensagem mais recente, com um único show(), então mensagens em sequência não atrasam quem as envia
+class Status:
+    def __init__(self, oled):
+        self.oled = oled
+        self._mensagem = ((), True)
+        self._rodape = None
+        self._evento = asyncio.Event()
+
+    def mostrar(self, *linhas, fill=True):
+        self._mensagem = (linhas, fill)
+        self._evento.set()
+
+    # Linha fixa na última página do OLED (telemetria), redesenhada junto com a mensagem atual
+    def rodape(self, texto):
+        if texto != self._rodape:
+            self._rodape = texto
+            self._evento.set()
+
+    async def tarefa(self):
+        while True:
+            await self._evento.wait()
+            self._evento.clear()
+            linhas, fill = self._mensagem
+            if self._rodape is not None:
+                self.oled.fill_rect(0, 56, 128, 8, 0)
+                linhas = linhas + ((self._rodape, 0, 56),)
+            # Todas as linhas numa só atualização, que envia apenas as páginas do OLED que mudaram
+            self.oled.text_lines(linhas, clear=fill)
+
+# Fila entre tarefas (o uasyncio não tem Queue). Quando cheia, descarta o item mais antigo
+class Fila:
+    def __init__(self, tamanho=8):
+        self._itens = []
+        self._tamanho = tamanho
+        self._evento = asyncio.Event()
+
+    def put(self, item):
+        if len(self._itens) >= self._tamanho:
+            self._itens.pop(0)
+        self._itens.append(item)
+        self._evento.set()
+
+    # Devolve um item ao início da fila (ex.: comando que não pôde ser enviado)
+    def devolver(self, item):
+        self._itens.insert(0, item)
+        self._evento.set()
+
+    async def get(self):
+        while not self._itens:
+            self._evento.clear()
+            await self._evento.wait()
+        return self._itens.pop(0)
 
 # Rotina que inicializa todos os periféicos da BitDogLab que são utilizados no projeto
+# OLED no I2C1 por hardware (GP14 = SDA, GP15 = SCL). Com OLED_I2C_HW = False usa o SoftI2C (bit-banging)
+OLED_I2C_HW = True
+OLED_I2C_FREQ = 400_000
+
 def init_bitdog():
     led_r = machine.PWM(machine.Pin(12))
     led_g = machine.PWM(machine.Pin(11))
@@ -165,40 +554,96 @@ def init_bitdog():
     led_r.freq(1000)
     led_g.freq(1000)
     led_b.freq(1000)
-    i2c_oled = machine.SoftI2C(scl=machine.Pin(15), sda=machine.Pin(14))
+    if OLED_I2C_HW:
+        i2c_oled = machine.I2C(1, scl=machine.Pin(15), sda=machine.Pin(14), freq=OLED_I2C_FREQ)
+    else:
+        i2c_oled = machine.SoftI2C(scl=machine.Pin(15), sda=machine.Pin(14), freq=OLED_I2C_FREQ)
     oled = SSD1306_I2C(128, 64, i2c_oled)
     oled.fill(0)
     oled.show()
     return led_r, led_g, led_b, alto_falante, oled
 
+# Sensores de luz (BH1750) e de temperatura e umidade (AHT20) no I2C0 da BitDogLab (GP0 = SDA, GP1 = SCL). Com
+# SENSORES = True, os que responderem no barramento são lidos em segundo plano e a telemetria aparece no pé do OLED
+SENSORES = False
+ENDERECO_BH1750 = 0x23
+ENDERECO_AHT = 0x38
+PERIODO_LUZ_MS = 1000
+PERIODO_AMBIENTE_MS = 5000
+PERIODO_TELEMETRIA_MS = 1000
+
+def init_sensores():
+    from bh1750 import BH1750
+    from ahtx0 import AHT20
+    from sampler import Sampler
+    i2c = machine.I2C(0, scl=machine.Pin(1), sda=machine.Pin(0), freq=400_000)
+    enderecos = i2c.scan()
+    amostrador = Sampler()
+    if ENDERECO_BH1750 in enderecos:
+        amostrador.add('luz', BH1750(ENDERECO_BH1750, i2c).measurement_async, PERIODO_LUZ_MS)
+    if ENDERECO_AHT in enderecos:
+        amostrador.add('ambiente', AHT20(i2c, ENDERECO_AHT).measure_async, PERIODO_AMBIENTE_MS)
+    return amostrador
+
+# Pino ligado ao T_IRQ do touch. Na montagem do kit o T_IRQ vai ao GND, então o touch é lido por pooling (None)
+TOUCH_IRQ = None
+
+# O barramento SPI é compartilhado pelo touch (mais lento) e pelo LCD (mais rápido). Cada um registra sua velocidade no
+# árbitro do barramento, que só reconfigura o SPI quando o dispositivo ativo muda
+LCD_BAUDRATE = 50_000_000
+TOUCH_BAUDRATE = 1_000_000
+
 # Rotina de inicialização da comunicação SPI, do LCD e do touch, além das devidas calibrações e uma primeira exibição dos botões.
+# A interface é desenhada num canvas em memória, que envia ao LCD apenas as regiões alteradas a cada flush()
 def init(cor1, cor2):
+    global telas
+    from spibus import SPIBus
+    from ili9341 import ILI9341
+    from canvas import Canvas
+    from tsc2046 import TSC2046
+    if TELAS and telas is None:
+        try:
+            import ui_assets
+            telas = ui_assets
+        except ImportError:
+            print("ui_assets não encontrado: a interface será desenhada")
     spi = machine.SPI(0,
-                      baudrate=30_000_000,
+                      baudrate=TOUCH_BAUDRATE,
                       sck=machine.Pin(18),
                       mosi=machine.Pin(19),
                       miso=machine.Pin(16))
-    display = ILI9341(spi, 
+    bus = SPIBus(spi)
+    display = ILI9341(bus.device('lcd', LCD_BAUDRATE),
                       dc=machine.Pin(20),
                       cs=machine.Pin(17),
                       WIDTH=320,
                       HEIGHT=240,
                       rst=None)
-    montar_botoes(cor1, cor2, display)
-    abrir(cor1, cor2, display)
-    set_spi_speed(1_000_000, spi)
-    touch = TSC2046(spi,
+    tela = Canvas(display)
+    montar_botoes(cor1, cor2, tela)
+    abrir(cor1, cor2, tela)
+    tela.flush()
+    touch = TSC2046(bus.device('touch', TOUCH_BAUDRATE),
                     cs=machine.Pin(9),
-                    irq=None)
+                    irq=machine.Pin(TOUCH_IRQ) if TOUCH_IRQ is not None else None,
+                    samples=5)
     CALIB_X_MIN = 1880
     CALIB_X_MAX = 150
     CALIB_Y_MIN = 270
     CALIB_Y_MAX = 1830
     touch.set_calibration((CALIB_X_MIN, CALIB_X_MAX, CALIB_Y_MIN, CALIB_Y_MAX))
-    return display, touch, spi
+    # O eixo Y do touch corresponde ao eixo X da tela (e vice-versa)
+    touch.set_screen(320, 240, swap_xy=True)
+    return tela, touch, bus
 
 # Animação responsável pela responsividade dos dois botões superiores
 def tocar_garra(x, cor1, cor2, display, s):
+    if telas:
+        if s in ('Fechar', 'Aberto'):
+            copiar_garra(telas.TELA, 0, x, cor1, cor2, display)
+        else:
+            copiar_garra(telas.GARRA_FECHADA, 160, x, cor1, cor2, display)
+        return
     display.fill_rect(x+5, 165, 150, 70, cor1)
     if s == 'Fechar':
         display.text('Fechar', 35, 185, fg_color=cor2, bg_color=cor1, scale=3)
@@ -213,15 +658,29 @@ def tocar_garra(x, cor1, cor2, display, s):
 
 # Animação responsável pela responsividade dos oito botões inferiores
 def tocar_botao(x, y, cor, comp, display, s):
+    if telas:
+        # Na tela, a borda e o texto dos botões das casas pares são da cor 0 da paleta, e o fundo da cor 1
+        paleta = (cor, comp) if (x // 80 + y // 80) % 2 == 0 else (comp, cor)
+        display.blit_asset(telas.TELA, x, y, paleta, (x, y, 80, 80))
+        return
     display.fill_rect(x, y, 80, 80, cor)
     display.fill_rect(x+5, y+5, 80-10, 80-10, comp)
     display.text(s, x + 80//2 - 15, y + 80//2 - 15, fg_color=cor, bg_color=comp, scale=3)
 
-# Animação do led da BitDogLab responsável pelo halt do programa durante o movimento do braço robótico, aguardando por um segundo
-def wait_movement(led_r, led_g, led_b):
-    led(100, 100, 0, led_r, led_g, led_b)
-    utime.sleep_ms(1000)
-    led(0, 0, 50, led_r, led_g, led_b)
+# Animação do led da BitDogLab durante o movimento do braço robótico, até a ESP32 notificar o fim do movimento (ou até o
+# timeout). Só a tarefa BLE espera
+async def wait_movement(sender, efeitos, seq=None):
+    efeitos.led(100, 100, 0)
+    efeitos.animar(ANIM_MOVENDO)
+    tracer.begin(SPAN_MOVIMENTO)
+    angulos = await sender.aguardar_movimento(TEMPO_MAXIMO_MOVIMENTO_MS, seq)
+    efeitos.led(0, 0, 50)
+    if angulos:
+        tracer.end(SPAN_MOVIMENTO)
+        print("Movimento concluído:", angulos)
+    else:
+        tracer.cancel(SPAN_MOVIMENTO)
+    return angulos
 
 # EasterEgg
 class RainbowColors():
@@ -232,254 +691,474 @@ class RainbowColors():
         else : self.color += 0xA
         return self.color
 
-async def main():
-    led_r, led_g, led_b, alto_falante, oled = init_bitdog()
-    sender = BLE_Sender("Touch-Interface")
-    # Flags
-    end = False           # indica se o usuário pediu o encerramento da execução
-    connecting = False    # indica se o texto "Conectando BLE..." já foi escrito no OLED
-    initialized = False   # indica se as rotinas de inicialização já foram executadas
-    # Cores
-    BRANCO = 0x0000
-    PRETO = 0xFFFF
-    CINZA = 0x7BEF
-    VERMELHO = 0x07FF
-    VERDE = 0xF81F
-    # EasterEgg
+# Animações de estado do braço na matriz de LEDs: quadros (sprite, cor, duração em ms; 0 = fica até a próxima)
+ANIM_CONECTANDO = tuple((sprite([p]), (0, 0, 20), 150) for p in ((2, 4), (4, 2), (2, 0), (0, 2)))
+ANIM_MOVENDO = ((sprite([(2, 2)]), (20, 20, 0), 200),
+                (sprite([(1, 1), (2, 1), (3, 1), (1, 2), (3, 2), (1, 3), (2, 3), (3, 3)]), (20, 20, 0), 200))
+ANIM_ABERTA = ((sprite([(0, 4), (0, 3), (0, 2), (1, 1), (2, 0), (3, 1), (4, 2), (4, 3), (4, 4)]), (0, 0, 20), 0),)
+ANIM_FECHADA = ((sprite([(1, 4), (3, 4), (1, 3), (3, 3), (2, 2), (2, 1), (2, 0)]), (0, 0, 20), 0),)
+ANIM_ERRO = ((X_GRANDE, (20, 0, 0), 0),)
+# Estado da garra mostrado depois de cada movimento, pelo último comando de garra enviado
+ANIM_GARRA = {'8': ANIM_FECHADA, '9': ANIM_ABERTA}
+
+# Cores (RGB565 com inversão de cores ativa no LCD)
+BRANCO = 0x0000
+PRETO = 0xFFFF
+CINZA = 0x7BEF
+VERMELHO = 0x07FF
+VERDE = 0xF81F
+
+# Estado compartilhado pelos renderizadores dos botões
+class Contexto:
+    def __init__(self, display, status):
+        self.display = display
+        self.status = status
+        self.branco = BRANCO  # cor primária atual (muda no modo arco-íris)
+        self.aberta = True    # garra aberta
+        self.fechada = False  # garra fechada
+        self.ee = 0           # contador do EasterEgg
+        self.toque = None     # ponto (x, y) do toque atual, na tela
+        self.mapa = None      # Mapa do modo mapa (None sem a tabela de cinemática inversa)
+
+# Renderizadores dos oito botões inferiores. Ao soltar, a cor de destaque (VERDE) volta a ser a cor primária atual
+def pressionar_botao(botao, ctx):
+    cor, comp = botao.colors
+    tocar_botao(botao.x, botao.y, cor, comp, ctx.display, botao.label)
+
+def soltar_botao(botao, ctx):
+    cor, comp = [ctx.branco if c == VERDE else c for c in botao.colors]
+    tocar_botao(botao.x, botao.y, cor, comp, ctx.display, botao.label)
+    # EasterEgg: D1 decrementa e U1 incrementa o contador (0 a 3). Abaixo de 3, o modo arco-íris é desfeito
+    ctx.ee = min(3, max(0, ctx.ee + botao.data))
+    if ctx.ee < 3 and ctx.branco != BRANCO:
+        ctx.branco = BRANCO
+        ctx.ee = 0
+    return botao.command
+
+# Renderizadores dos dois botões superiores (garra). data: (x, flag de estado no contexto, rótulo do estado, texto e coluna no OLED)
+def pressionar_garra(botao, ctx):
+    x, estado, ativo, texto, x_oled = botao.data
+    if getattr(ctx, estado):
+        tocar_garra(x, VERMELHO, PRETO, ctx.display, ativo)
+    else:
+        tocar_garra(x, VERDE, PRETO, ctx.display, botao.label)
+
+def soltar_garra(botao, ctx):
+    x, estado, ativo, texto, x_oled = botao.data
+    # Se a garra já está no estado pedido, o toque não manda caractere
+    if getattr(ctx, estado):
+        tocar_garra(x, ctx.branco, PRETO, ctx.display, ativo)
+        ctx.status.mostrar(("Garra foi", 30, 20), (texto, x_oled, 30))
+        return None
+    if x == 0:
+        fechar(ctx.branco, PRETO, ctx.display)
+    else:
+        abrir(ctx.branco, PRETO, ctx.display)
+    ctx.fechada = x == 0
+    ctx.aberta = x != 0
+    return botao.command
+
+# Tabela declarativa dos botões: retângulo, cores, rótulo, renderizadores e comando (caractere, texto e coluna no OLED)
+def criar_botoes():
+    from widgets import Button, WidgetTable
+    tabela = WidgetTable(320, 240, cell=80)
+    for linha, prefixo in enumerate(('D', 'U')):
+        for coluna in range(4):
+            rotulo = prefixo + str(coluna + 1)
+            cores = (VERDE, PRETO) if (linha + coluna) % 2 == 0 else (PRETO, VERDE)
+            ee = {'D1': -1, 'U1': 1}.get(rotulo, 0)
+            tabela.add(Button(coluna * 80, linha * 80, 80, 80, label=rotulo, colors=cores,
+                              pressed=pressionar_botao, released=soltar_botao,
+                              command=(str(linha * 4 + coluna), rotulo, 50), data=ee))
+    fechar_btn = tabela.add(Button(0, 160, 160, 80, label='Fechar', pressed=pressionar_garra, released=soltar_garra,
+                                   command=('8', 'Fechar', 40), data=(0, 'fechada', 'Fechado', 'fechada', 38)))
+    tabela.add(Button(160, 160, 160, 80, label='Abrir', pressed=pressionar_garra, released=soltar_garra,
+                      command=('9', 'Abrir', 40), data=(160, 'aberta', 'Aberto', 'aberta', 40)))
+    return tabela, fechar_btn
+
+# Modo mapa: o botão A alterna entre os botões e um mapa do espaço de trabalho visto de cima. Tocar um ponto do mapa
+# manda o braço para ele (garra mantida), com os ângulos interpolados da tabela de cinemática inversa (ik_table.py,
+# gerada por Arm/cinematica.py) em vez de trigonometria no Pico. Não existe no modo legado, que só tem as posições
+# gravadas na ESP32
+MAPA = True
+MARCA_MAPA = 7   # lado do marcador do ponto tocado, em pixels
+
+# Mapa do espaço de trabalho: a base fica na borda de baixo da tela (que é fisicamente a borda de baixo, com o quadro
+# espelhado na vertical) e a frente do braço para cima. A área alcançável (CINZA) vem das regiões da tabela
+class Mapa:
+    def __init__(self, tabela_ik):
+        from widgets import Button, WidgetTable
+        self.ik = tabela_ik
+        # Escala (px/mm) em que a grade inteira cabe na tela, com a base em (x_base, y_base)
+        self.escala = min(300 / (tabela_ik.x1 - tabela_ik.x0), 220 / (tabela_ik.y1 - tabela_ik.y0))
+        self.x_base = 160
+        self.y_base = 8
+        self.regioes = []
+        for x0, y0, x1, y1 in tabela_ik.regions():
+            px0, py0 = self.para_tela(x0, y0)
+            px1, py1 = self.para_tela(x1, y1)
+            self.regioes.append((px0, py0, px1 - px0, py1 - py0))
+        self.marca = None   # retângulo do marcador desenhado
+        self.tabela = WidgetTable(320, 240, cell=80)
+        self.tabela.add(Button(0, 0, 320, 240, label='Mapa', pressed=pressionar_mapa, released=soltar_mapa))
+
+    def para_tela(self, x, y):
+        return self.x_base + round(x * self.escala), self.y_base + round((y - self.ik.y0) * self.escala)
+
+    def para_mm(self, px, py):
+        return (px - self.x_base) / self.escala, self.ik.y0 + (py - self.y_base) / self.escala
+
+    # Ângulos (base, ombro, cotovelo) do ponto da tela, ou None fora do alcance
+    def angulos(self, px, py):
+        return self.ik.angles(*self.para_mm(px, py))
+
+    # Desenha o mapa inteiro, ou só o que fica dentro de area (x, y, w, h), para apagar o marcador
+    def desenhar(self, display, area=None):
+        if area is None:
+            area = (0, 0, 320, 240)
+            self.marca = None
+        x, y, w, h = area
+        display.fill_rect(x, y, w, h, PRETO)
+        for regiao in self.regioes:
+            recortar(display, regiao, area, CINZA)
+        recortar(display, (self.x_base - 4, self.y_base - 6, 9, 6), area, BRANCO)   # base do braço
+        if recortar(None, (4, 228, 128, 8), area, None):
+            display.text('Mapa (A: botoes)', 4, 228, fg_color=BRANCO, bg_color=PRETO, scale=1)
+
+    # Move o marcador para o ponto (px, py) da tela, na cor dada; sem ponto, só apaga o marcador anterior
+    def marcar(self, display, px=None, py=None, cor=BRANCO):
+        if self.marca:
+            self.desenhar(display, self.marca)
+            self.marca = None
+        if px is not None:
+            m = MARCA_MAPA
+            x = min(max(px - m // 2, 0), 320 - m)
+            y = min(max(py - m // 2, 0), 240 - m)
+            self.marca = (x, y, m, m)
+            display.fill_rect(x, y, m, m, cor)
+
+# Preenche a parte do retângulo (x, y, w, h) que fica dentro de area. Retorna False se não há interseção (sem display,
+# só testa)
+def recortar(display, retangulo, area, cor):
+    x, y, w, h = retangulo
+    ax, ay, aw, ah = area
+    x0, y0 = max(x, ax), max(y, ay)
+    x1, y1 = min(x + w, ax + aw), min(y + h, ay + ah)
+    if x0 >= x1 or y0 >= y1:
+        return False
+    if display:
+        display.fill_rect(x0, y0, x1 - x0, y1 - y0, cor)
+    return True
+
+# Carrega a tabela de cinemática inversa e monta o mapa; None se a tabela não estiver no firmware
+def criar_mapa():
+    try:
+        from ik import IKTable
+        import ik_table
+    except ImportError:
+        print("ik_table não encontrado: modo mapa desativado")
+        return None
+    return Mapa(IKTable(ik_table))
+
+# Renderizadores do mapa: o marcador fica VERDE no toque se o ponto é alcançável (VERMELHO se não) e, ao soltar, o
+# comando é a própria pose (base, braço1, braço2, garra, velocidade), com as coordenadas em mm no OLED
+def pressionar_mapa(botao, ctx):
+    mapa = ctx.mapa
+    px, py = ctx.toque
+    mapa.marcar(ctx.display, px, py, VERDE if mapa.angulos(px, py) else VERMELHO)
+
+def soltar_mapa(botao, ctx):
+    mapa = ctx.mapa
+    px, py = ctx.toque
+    angulos = mapa.angulos(px, py)
+    if angulos is None:
+        mapa.marcar(ctx.display)
+        ctx.status.mostrar(("Fora do", 35, 20), ("alcance", 35, 30))
+        return None
+    mapa.marcar(ctx.display, px, py, ctx.branco)
+    x, y = mapa.para_mm(px, py)
+    return angulos + (MANTER, 0), "x{} y{} mm".format(int(round(x)), int(round(y))), 20
+
+# Tempos da interface
+PERIODO_TOUCH_MS = 10     # "Taxa de atualização" de pooling do touch: 100Hz
+TOQUE_LONGO_MS = 2000     # Segurar "Fechar" por ~2s encerra a execução
+PERIODO_ARCO_IRIS_MS = 1000
+TEMPO_MAXIMO_MOVIMENTO_MS = 4000  # Maior preset da ESP32: 155° a 120°/s de pico, ~2,4 s
+
+# Eventos do touch para a interface
+EVT_TOQUE = 0
+EVT_SOLTA = 1
+EVT_LONGO = 2
+EVT_MODO = 3    # botão A: troca entre os botões e o mapa
+
+# Medição de latência (tracer.py). Com TRACE = False cada ponto de medição custa só uma chamada que retorna na hora.
+# Com TRACE = True, o botão B imprime p50/p95/máximo de cada trecho na serial; TRACE_OLED mostra o resumo no OLED
+# (p50 e p95 em ms) no lugar das mensagens de status
+TRACE = False
+TRACE_OLED = False
+PERIODO_TRACE_MS = 1000
+SPAN_DETECCAO = 0    # Toque detectado pelo touch até a interface começar a tratá-lo
+SPAN_LEITURA = 1     # Leitura das coordenadas durante o toque (inclui a espera pelo barramento)
+SPAN_TOQUE = 2       # Desenho do botão pressionado (press + flush)
+SPAN_SOLTA = 3       # Desenho do botão solto (release + flush)
+SPAN_GATT = 4        # Escrita GATT do comando, até a confirmação da ESP32
+SPAN_MOVIMENTO = 5   # Fim da escrita até a ESP32 notificar o fim do movimento
+SPAN_ENVIO = 6       # Toque solto até a escrita do comando ser confirmada
+tracer = Tracer(('deteccao', 'leitura', 'toque', 'solta', 'gatt', 'movimento', 'envio'), size=256, enabled=TRACE)
+
+# Com PROTOCOLO_LEGADO = True, os comandos saem como os caracteres '0'–'9' (firmware antigo da ESP32)
+PROTOCOLO_LEGADO = False
+MANTER = BLE_Sender.MANTER
+# Pose de cada botão no protocolo binário: (base, braço1, braço2, garra, velocidade de pico em graus/s, 0 = padrão).
+# Espelha a tabela da ESP32, mas qualquer ângulo pode ser usado aqui sem regravar o firmware
+POSES = {
+    '0': (160, 130, 150, 90, 0), '1': (120, 130, 150, 90, 0), '2': (60, 130, 150, 90, 0), '3': (5, 130, 150, 90, 0),
+    '4': (160, 100, 120, 90, 0), '5': (120, 100, 120, 90, 0), '6': (60, 100, 120, 90, 0), '7': (5, 100, 120, 90, 0),
+    '8': (MANTER, MANTER, MANTER, 60, 180),   # Garra fechada (botão Fechar)
+    '9': (MANTER, MANTER, MANTER, 120, 180),  # Garra aberta (botão Abrir)
+}
+
+# Envia o comando de um botão (o caractere da pose) ou de um ponto do mapa (a própria pose). Retorna o seq para
+# aguardar o movimento (0 no modo legado), ou None se falhou
+async def enviar_comando(sender, caractere):
+    if PROTOCOLO_LEGADO:
+        return 0 if await sender.enviar_caractere(caractere) else None
+    return await sender.enviar_pose(*(POSES[caractere] if isinstance(caractere, str) else caractere))
+
+# Tarefa do touch: espera o toque (IRQ ou pooling), informa a posição e acompanha o toque até soltar
+async def tarefa_touch(touch, bus, eventos):
+    while True:
+        p_x, p_y, z = await touch.wait_touch(PERIODO_TOUCH_MS)
+        tracer.begin(SPAN_DETECCAO)
+        eventos.put((EVT_TOQUE, p_x, p_y))
+        inicio = utime.ticks_ms()
+        longo = False
+        while True:
+            await asyncio.sleep_ms(PERIODO_TOUCH_MS)
+            tracer.begin(SPAN_LEITURA)
+            async with bus.lock:
+                ponto = touch.read_point()
+            tracer.end(SPAN_LEITURA)
+            if not ponto:
+                break
+            if not longo and utime.ticks_diff(utime.ticks_ms(), inicio) >= TOQUE_LONGO_MS:
+                longo = True
+                eventos.put((EVT_LONGO,))
+        eventos.put((EVT_SOLTA,))
+
+# Tarefa da interface: anima os botões tocados e repassa os comandos para a tarefa BLE. tabela é a dos botões ou a do
+# mapa, conforme o modo
+async def tarefa_ui(tabela, fechar_btn, ctx, bus, eventos, comandos, fim):
+    botoes = tabela
+    while True:
+        evento = await eventos.get()
+        if evento[0] == EVT_TOQUE:
+            tracer.end(SPAN_DETECCAO)
+            tracer.begin(SPAN_TOQUE)
+            ctx.toque = (evento[1], evento[2])
+            async with bus.lock:
+                if tabela.press(evento[1], evento[2], ctx):
+                    ctx.display.flush()
+            tracer.end(SPAN_TOQUE)
+        elif evento[0] == EVT_LONGO:
+            # Toque longo em "Fechar": pedido de encerramento
+            if tabela.active is fechar_btn:
+                fim.set()
+                return
+        elif evento[0] == EVT_MODO:
+            # A troca espera o toque atual terminar
+            if ctx.mapa is None or tabela.active:
+                continue
+            tabela = botoes if tabela is ctx.mapa.tabela else ctx.mapa.tabela
+            async with bus.lock:
+                if tabela is botoes:
+                    montar_botoes(ctx.branco, PRETO, ctx.display)
+                    (fechar if ctx.fechada else abrir)(ctx.branco, PRETO, ctx.display)
+                else:
+                    ctx.mapa.desenhar(ctx.display)
+                ctx.display.flush()
+        elif tabela.active:
+            tracer.begin(SPAN_ENVIO)
+            tracer.begin(SPAN_SOLTA)
+            async with bus.lock:
+                comando = tabela.release(ctx)
+                ctx.display.flush()
+            tracer.end(SPAN_SOLTA)
+            if comando:
+                comandos.put(comando)
+            else:
+                tracer.cancel(SPAN_ENVIO)
+
+# Tarefa do EasterEgg: com o contador em 3, troca a cor primária a cada segundo
+async def tarefa_arco_iris(ctx, bus):
     rainbow = RainbowColors()
-    while not end:
-        if not sender.conectado:
-            if not connecting:
-                # Escrita no OLED para feedback ao usuário durante espera pela conexão à ESP32
-                oled_write("Conectando", 25, 20, oled)
-                oled_write("BLE...", 40, 30, oled)
-                led(50, 0, 0, led_r, led_g, led_b)
-                # Só precisa ser exibido uma vez, logo:
-                connecting = True
-            if initialized:
-                # Caso a conexão caia, escreve no OLED para feedback ao usuário
-                oled_write("Reconectando", 25, 20, oled)
-                oled_write("BLE...", 40, 30, oled)
-                led(50, 0, 0, led_r, led_g, led_b)
-            # Solicitação de conexão
-            await sender.conectar()
+    while True:
+        await asyncio.sleep_ms(PERIODO_ARCO_IRIS_MS)
+        if ctx.ee >= 3:
+            print("Rainbow mode!")
+            cor = rainbow.next()
+            async with bus.lock:
+                # Só a entrada da paleta muda: o canvas reenvia apenas a área onde a cor antiga foi desenhada
+                ctx.display.recolor(ctx.branco, cor)
+                ctx.branco = cor
+                ctx.display.flush()
+
+# Tarefa da telemetria: lê os valores do cache do amostrador (sem esperar o I2C) e atualiza o pé do OLED
+async def tarefa_telemetria(amostrador, status):
+    while True:
+        await asyncio.sleep_ms(PERIODO_TELEMETRIA_MS)
+        partes = []
+        ambiente = amostrador.get('ambiente')
+        if ambiente is not None:
+            partes.append("{:.1f}C {:.0f}%".format(*ambiente))
+        luz = amostrador.get('luz')
+        if luz is not None:
+            partes.append("{:.0f}lx".format(luz))
+        if partes:
+            status.rodape(" ".join(partes))
+
+# Tarefa do modo mapa: cada aperto do botão A (já solto depois do início) troca o modo da interface
+async def tarefa_modo(eventos):
+    button_a = machine.Pin(5, machine.Pin.IN, machine.Pin.PULL_UP)
+    anterior = button_a.value()
+    while True:
+        await asyncio.sleep_ms(50)
+        valor = button_a.value()
+        if anterior and not valor:
+            eventos.put((EVT_MODO,))
+        anterior = valor
+
+# Tarefa do trace: o botão B imprime as estatísticas na serial; com TRACE_OLED, o resumo é atualizado no OLED
+async def tarefa_trace(status):
+    button_b = machine.Pin(6, machine.Pin.IN, machine.Pin.PULL_UP)
+    anterior = 1
+    proximo = utime.ticks_ms()
+    while True:
+        await asyncio.sleep_ms(50)
+        valor = button_b.value()
+        if anterior and not valor:
+            print(tracer.report())
+        anterior = valor
+        if TRACE_OLED and utime.ticks_diff(utime.ticks_ms(), proximo) >= 0:
+            proximo = utime.ticks_add(proximo, PERIODO_TRACE_MS)
+            linhas = tracer.lines()
+            if linhas:
+                status.mostrar(*[(linha, 0, 8 * i) for i, linha in enumerate(linhas)])
+
+# Tarefa de conexão: conecta à ESP32 e, quando o link cai, reconecta em segundo plano, com backoff entre as tentativas.
+# Enquanto isso a interface continua funcionando e os comandos ficam na fila
+async def tarefa_conexao(sender, efeitos, status, conectado):
+    while True:
+        if sender.conectado:
+            await sender.aguardar_desconexao()
+            continue
+        # Feedback ao usuário durante espera pela conexão à ESP32
+        if conectado.is_set():
+            status.mostrar(("Reconectando", 25, 20), ("BLE...", 40, 30))
         else:
-            if not initialized:
-                # Rotinas de inicialização:
-                led(0, 0, 50, led_r, led_g, led_b)                            # Led azul acende para indicar conexão bem sucedida
-                play([(392, 1), (415, 1), (440, 1)], alto_falante)            # Música para indicar conexão bem sucedida
-                oled_write("BLE conectado!", 10, 20, oled, fill=True)         # Escrita no OLED para indicar conexão bem sucedida
-                oled_write("Inicializando", 12, 30, oled)
-                display, touch, spi = init(BRANCO, PRETO)                     # Inicialização do SPI, touch e LCD
-                await asyncio.sleep(2)                                        # Espera pela inicialização
-                await sender.enviar_caractere('4', oled, 'U1', 40, False)     # Posição inicial: 4 ("U1")
-                await asyncio.sleep(0.5)
-                await sender.enviar_caractere('9', oled, 'Abrir', 40, False)  # Posição inicial: 9 (Garra aberta)
-                # Flags para lógica de toque ("anti bouncing")
-                U1, U2, U3, U4 = False, False, False, False
-                D1, D2, D3, D4 = False, False, False, False
-                # Flags específicas
-                openit, closeit, opened, closed = False, False, True, False
-                touched = False
-                # Temporizações incrementais
-                k, n, ee = 0, 0, 0
-                # Feedback de fim da inicialização no OLED
-                oled_write("Inicializado", 12, 20, oled, fill=True)
-                oled_write("com sucesso", 14, 30, oled)
-                initialized = True
-            # Lógicas de código a serem executadas durante o toque
-            if touch.is_touched():
-                # Se o contador de encerramento tiver chegado em 200 (~2s)
-                if k == 200:
-                    # Rotina de encerramento
-                    end = True
-                    oled_write("Desconectando", 10, 20, oled, fill=True)            # Feedback visual no OLED
-                    oled_write("e encerrando", 12, 30, oled)
-                    play([(392, 1), (369, 1), (392, 1), (523, 2)], alto_falante)    # Música de encerramento
-                    set_spi_speed(50_000_000, spi)
-                    display.fill(PRETO)                                             # Apagar display LCD
-                    await sender.desconectar()                                      # Encerrar BLE
-                    led(0, 0, 0, led_r, led_g, led_b)                               # Apagar led da BitDogLab
-                    oled.fill(0)                                                    # Apagar OLED
-                    oled.show()
-                # Se o toque tem o intuito de fechar
-                if closeit:
-                    k += 1
-                # Se o botão acabou de ser tocado
-                if not touched:
-                    # Atualiza flag
-                    touched = True
-                    # Lê a posição do toque
-                    y, x, z = touch.read()
-                    p_x = int(x * 320)
-                    p_y = int(y * 240)
-                    # Acelera para animações
-                    set_spi_speed(30_000_000, spi)
-                    # Lógica de detecção do toque por pooling. Todos atualizam flags para animações e demais lógicas
-                    if not D1 and 0 <= p_x < 80 and 0 <= p_y < 80: # D1
-                        tocar_botao(0, 0, VERDE, PRETO, display, 'D1')
-                        D1 = True
-                    elif not D2 and 80 <= p_x < 160 and 0 <= p_y < 80: # D2
-                        tocar_botao(80, 0, PRETO, VERDE, display, 'D2')
-                        D2 = True
-                    elif not D3 and 160 <= p_x < 240 and 0 <= p_y < 80: # D3
-                        tocar_botao(160, 0, VERDE, PRETO, display, 'D3')
-                        D3 = True
-                    elif not D4 and 240 <= p_x < 320 and 0 <= p_y < 80: # D4
-                        tocar_botao(240, 0, PRETO, VERDE, display, 'D4')
-                        D4 = True
-                    elif not U1 and 0 <= p_x < 80 and 80 <= p_y < 160: # U1
-                        tocar_botao(0, 80, PRETO, VERDE, display, 'U1')
-                        U1 = True
-                    elif not U2 and 80 <= p_x < 160 and 80 <= p_y < 160: # U2
-                        tocar_botao(80, 80, VERDE, PRETO, display, 'U2')
-                        U2 = True
-                    elif not U3 and 160 <= p_x < 240 and 80 <= p_y < 160: # U3
-                        tocar_botao(160, 80, PRETO, VERDE, display, 'U3')
-                        U3 = True
-                    elif not U4 and 240 <= p_x < 320 and 80 <= p_y < 160: # U4
-                        tocar_botao(240, 80, VERDE, PRETO, display, 'U4')
-                        U4 = True
-                    elif not closeit and 0 <= p_x < 160 and 160 <= p_y < 240: # Close
-                        # Flag identifica intuito de fechar
-                        closeit = True
-                        if closed:
-                            tocar_garra(0, VERMELHO, PRETO, display, 'Fechado')
-                        else:
-                            tocar_garra(0, VERDE, PRETO, display, 'Fechar')
-                    elif not openit and 160 <= p_x < 320 and 160 <= p_y < 240: # Open
-                        # Flag identifica intuito de abrir
-                        openit = True
-                        if opened:
-                            tocar_garra(160, VERMELHO, PRETO, display, 'Aberto')
-                        else:
-                            tocar_garra(160, VERDE, PRETO, display, 'Abrir')
+            status.mostrar(("Conectando", 25, 20), ("BLE...", 40, 30))
+        efeitos.led(50, 0, 0)
+        efeitos.animar(ANIM_CONECTANDO)
+        # Solicitação de conexão
+        if await sender.conectar():
+            efeitos.led(0, 0, 50)
+            efeitos.animar(efeitos.garra)
+            print(sender.resumo_conexao())
+            if conectado.is_set():
+                status.mostrar(("BLE reconectado", 4, 20))
+            conectado.set()
+        else:
+            await asyncio.sleep_ms(sender.espera_ms)
+
+# Tarefa BLE: envia os comandos da fila, um de cada vez, enquanto há conexão
+async def tarefa_ble(sender, comandos, efeitos, status):
+    while True:
+        await sender.online.wait()
+        caractere, s, x = await comandos.get()
+        seq = await enviar_comando(sender, caractere)
+        if seq is not None:
+            status.mostrar(("Comando enviado:", 0, 20), (s, x, 30))
+            # O próximo comando só sai depois que a ESP32 notifica o fim deste movimento
+            if await wait_movement(sender, efeitos, seq):
+                efeitos.garra = ANIM_GARRA.get(caractere, efeitos.garra)
+                efeitos.animar(efeitos.garra)
             else:
-                # Atualiza flag
-                touched = False
-                # Pooling para animações que disparam ao soltar o botão. Todos os oito botões inferiores são iguais
-                if D1:
-                    # Acelera SPI
-                    set_spi_speed(50_000_000, spi)
-                    # Atualzia flag
-                    D1 = False
-                    # EasterEgg counter
-                    ee -= 1
-                    # Animações e envio do caractere
-                    tocar_botao(0, 0, BRANCO, PRETO, display, 'D1')
-                    await asyncio.sleep(0.5)
-                    await sender.enviar_caractere('0', oled, 'D1', 50)
-                    wait_movement(led_r, led_g, led_b)
-                elif D2:
-                    set_spi_speed(50_000_000, spi)
-                    D2 = False
-                    tocar_botao(80, 0, PRETO, BRANCO, display, 'D2')
-                    await asyncio.sleep(0.5)
-                    await sender.enviar_caractere('1', oled, 'D2', 50)
-                    wait_movement(led_r, led_g, led_b)
-                elif D3:
-                    set_spi_speed(50_000_000, spi)
-                    D3 = False
-                    tocar_botao(160, 0, BRANCO, PRETO, display, 'D3')
-                    await asyncio.sleep(0.5)
-                    await sender.enviar_caractere('2', oled, 'D3', 50)
-                    wait_movement(led_r, led_g, led_b)
-                elif D4:
-                    set_spi_speed(50_000_000, spi)
-                    D4 = False
-                    tocar_botao(240, 0, PRETO, BRANCO, display, 'D4')
-                    await asyncio.sleep(0.5)
-                    await sender.enviar_caractere('3', oled, 'D4', 50)
-                    wait_movement(led_r, led_g, led_b)
-                elif U1:
-                    set_spi_speed(50_000_000, spi)
-                    U1 = False
-                    # EasterEgg counter
-                    ee += 1
-                    tocar_botao(0, 80, PRETO, BRANCO, display, 'U1')
-                    await asyncio.sleep(0.5)
-                    await sender.enviar_caractere('4', oled, 'U1', 50)
-                    wait_movement(led_r, led_g, led_b)
-                elif U2:
-                    set_spi_speed(50_000_000, spi)
-                    U2 = False
-                    tocar_botao(80, 80, BRANCO, PRETO, display, 'U2')
-                    await asyncio.sleep(0.5)
-                    await sender.enviar_caractere('5', oled, 'U2', 50)
-                    wait_movement(led_r, led_g, led_b)
-                elif U3:
-                    set_spi_speed(50_000_000, spi)
-                    U3 = False
-                    tocar_botao(160, 80, PRETO, BRANCO, display, 'U3')
-                    await asyncio.sleep(0.5)
-                    await sender.enviar_caractere('6', oled, 'U3', 50)
-                    wait_movement(led_r, led_g, led_b)
-                elif U4:
-                    set_spi_speed(50_000_000, spi)
-                    U4 = False
-                    tocar_botao(240, 80, BRANCO, PRETO, display, 'U4')
-                    await asyncio.sleep(0.5)
-                    await sender.enviar_caractere('7', oled, 'U4', 50)
-                    wait_movement(led_r, led_g, led_b)
-                elif closeit:
-                    # Acelera SPI
-                    set_spi_speed(50_000_000, spi)
-                    # Atualiza flag
-                    closeit = False
-                    # Se estava aberto, o intuito de fechar realmente fecha
-                    if opened:
-                        # Animação
-                        fechar(BRANCO, PRETO, display)
-                        # Atualização de flags de estado
-                        closed = True
-                        opened = False
-                        await asyncio.sleep(0.5)
-                        # Envio de caractere
-                        await sender.enviar_caractere('8', oled, 'Fechar', 40)
-                        wait_movement(led_r, led_g, led_b)
-                    # Se já estava fechado, intuito de fechar não manda caractere
-                    else:
-                        # Animação e feedback visual no OLED
-                        tocar_garra(0, BRANCO, PRETO, display, 'Fechado')
-                        oled_write("Garra foi", 30, 20, oled, fill=True)
-                        oled_write("fechada", 38, 30, oled)
-                # Lógica análoga ao closeit
-                elif openit:
-                    set_spi_speed(50_000_000, spi)
-                    openit = False
-                    if closed:
-                        abrir(BRANCO, PRETO, display)
-                        opened = True
-                        closed = False
-                        await asyncio.sleep(0.5)
-                        await sender.enviar_caractere('9', oled, 'Abrir', 40)
-                        wait_movement(led_r, led_g, led_b)
-                    else:
-                        tocar_garra(160, BRANCO, PRETO, display, 'Aberto')
-                        oled_write("Garra foi", 30, 20, oled, fill=True)
-                        oled_write("aberta", 40, 30, oled)
-            # EasterEgg
-            if ee >= 3:
-                ee = 3
-                if n%100 == 0:
-                    print("Rainbow mode!")
-                    BRANCO = rainbow.next()
-                    set_spi_speed(50_000_000, spi)
-                    montar_botoes(BRANCO, PRETO, display, fill=False)
-                    if opened : abrir(BRANCO, PRETO, display)
-                    if closed : fechar(BRANCO, PRETO, display)
-                    set_spi_speed(1_000_000, spi)
-                n += 1
-            elif ee < 0 : ee = 0
-            elif BRANCO != 0x0000:
-                BRANCO = 0x0000
-                ee = 0
-            # Diminuição da velocidade para touch
-            set_spi_speed(1_000_000, spi)
-        # "Taxa de atualização" de pooling: 100Hz
-        utime.sleep_ms(10)
+                efeitos.animar(ANIM_ERRO)
+        elif not sender.conectado:
+            # Comando volta para a fila e é enviado após a reconexão
+            comandos.devolver((caractere, s, x))
+
+async def main():
+    led_r, led_g, led_b, alto_falante, oled = init_bitdog()
+    matriz = Matriz()
+    animador = Animador(matriz)
+    efeitos = Efeitos(led_r, led_g, led_b, alto_falante, animador)
+    status = Status(oled)
+    sender = BLE_Sender("Touch-Interface")
+    comandos = Fila()
+    eventos = Fila()
+    conectado = asyncio.Event()   # indica que a primeira conexão BLE foi feita
+    fim = asyncio.Event()         # indica se o usuário pediu o encerramento da execução
+    tarefas = [asyncio.create_task(status.tarefa()),
+               asyncio.create_task(tarefa_conexao(sender, efeitos, status, conectado)),
+               asyncio.create_task(tarefa_ble(sender, comandos, efeitos, status)),
+               asyncio.create_task(animador.tarefa())]
+    await conectado.wait()
+    # Rotinas de inicialização:
+    efeitos.tocar([(392, 1), (415, 1), (440, 1)])                          # Música para indicar conexão bem sucedida
+    status.mostrar(("BLE conectado!", 10, 20), ("Inicializando", 12, 30))  # Escrita no OLED para indicar conexão bem sucedida
+    display, touch, bus = init(BRANCO, PRETO)                              # Inicialização do SPI, touch e LCD
+    await asyncio.sleep(2)                                                 # Espera pela inicialização
+    if PROTOCOLO_LEGADO:
+        await sender.enviar_caractere('4')                                 # Posição inicial: 4 ("U1")
+        await sender.aguardar_movimento(TEMPO_MAXIMO_MOVIMENTO_MS)
+        await sender.enviar_caractere('9')                                 # Posição inicial: 9 (Garra aberta)
+    else:
+        # Posição inicial 4 ("U1") e garra 9 numa única escrita
+        await sender.enviar_lote([POSES['4'][:4] + (0,), POSES['9'][:4] + (0,)])
+    # Botões e estado compartilhado pelos renderizadores
+    tabela, fechar_btn = criar_botoes()
+    ctx = Contexto(display, status)
+    if MAPA and not PROTOCOLO_LEGADO:
+        ctx.mapa = criar_mapa()
+    # Feedback de fim da inicialização no OLED
+    status.mostrar(("Inicializado", 12, 20), ("com sucesso", 14, 30))
+    tarefas.append(asyncio.create_task(tarefa_touch(touch, bus, eventos)))
+    tarefas.append(asyncio.create_task(tarefa_ui(tabela, fechar_btn, ctx, bus, eventos, comandos, fim)))
+    tarefas.append(asyncio.create_task(tarefa_arco_iris(ctx, bus)))
+    if ctx.mapa:
+        tarefas.append(asyncio.create_task(tarefa_modo(eventos)))
+    if TRACE:
+        tarefas.append(asyncio.create_task(tarefa_trace(status)))
+    if SENSORES:
+        amostrador = init_sensores()
+        tarefas += amostrador.start()
+        tarefas.append(asyncio.create_task(tarefa_telemetria(amostrador, status)))
+    await fim.wait()
+    # Rotina de encerramento
+    for tarefa in tarefas[1:]:
+        tarefa.cancel()
+    status.mostrar(("Desconectando", 10, 20), ("e encerrando", 12, 30))  # Feedback visual no OLED
+    efeitos.tocar([(392, 1), (369, 1), (392, 1), (523, 2)])              # Música de encerramento
+    await efeitos.aguardar()
+    async with bus.lock:
+        display.fill(PRETO)                                              # Apagar display LCD
+        display.flush()
+    await sender.desconectar()                                           # Encerrar BLE
+    print(bus.report())                                                  # Estatísticas do barramento SPI
+    print(sender.resumo_conexao())                                       # Métricas de conexão BLE
+    if TRACE:
+        print(tracer.report())                                           # Latências medidas
+    efeitos.led(0, 0, 0)                                                 # Apagar led da BitDogLab
+    matriz.fill()                                                        # Apagar matriz de LEDs
+    matriz.show()
+    tarefas[0].cancel()
+    oled.fill(0)                                                         # Apagar OLED
+    oled.show()
 
 # Programa não inicia enquanto o botão A não for pressionado
-button_a = machine.Pin(5, machine.Pin.IN, machine.Pin.PULL_UP)
-while not button_a.value() == 0 : utime.sleep_ms(10)
-asyncio.run(main())
+# (a guarda permite importar o módulo no emulador de Firmware/host)
+if __name__ == '__main__':
+    button_a = machine.Pin(5, machine.Pin.IN, machine.Pin.PULL_UP)
+    while not button_a.value() == 0 : utime.sleep_ms(10)
+    asyncio.run(main())